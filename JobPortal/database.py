@@ -0,0 +1,78 @@
+"""
+Builds settings.DATABASES from environment URLs.
+
+    DATABASE_URL            primary (default: sqlite:///<BASE_DIR>/db.sqlite3)
+    DATABASE_REPLICA_URLS   optional comma-separated read replicas
+    DB_CONN_MAX_AGE         seconds to keep connections open (default: 0)
+
+Connections are closed after each request by default. The app is served
+by uvicorn workers (see Procfile), and under ASGI Django opens
+connections in sync_to_async threads that persistent connections would
+leak; Django's docs say to disable them there. To reuse connections,
+pool outside the app instead: PgBouncer in transaction mode in front of
+PostgreSQL, or Django's own pool with psycopg 3 (OPTIONS['pool']).
+
+Replicas become the aliases replica1, replica2, ... and are used by
+jobs.routers.PrimaryReplicaRouter. To try replication locally, point both
+variables at SQLite files and refresh the replica with
+`python manage.py sync_sqlite_replica`.
+"""
+import os
+import tempfile
+
+import dj_database_url
+
+SQLITE_ENGINE = 'django.db.backends.sqlite3'
+POSTGRES_ENGINES = ('django.db.backends.postgresql', 'django.contrib.gis.db.backends.postgis')
+
+# WAL lets readers run alongside the single writer; NORMAL sync is safe in WAL
+SQLITE_INIT_COMMAND = 'PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;'
+SQLITE_BUSY_TIMEOUT = 20  # seconds a connection waits for a lock before "database is locked"
+
+
+def _tune(config: dict, replica: bool = False) -> dict:
+    options = config.setdefault('OPTIONS', {})
+    if config['ENGINE'] == SQLITE_ENGINE:
+        options.setdefault('init_command', SQLITE_INIT_COMMAND)
+        options.setdefault('timeout', SQLITE_BUSY_TIMEOUT)
+        if not replica:
+            # Take the write lock at BEGIN, so a transaction never fails
+            # half-way through when it tries to upgrade a read lock
+            options.setdefault('transaction_mode', 'IMMEDIATE')
+            # A file rather than the in-memory default, whose shared-cache
+            # table locks fail instantly instead of honouring the busy timeout;
+            # concurrency tests need the same locking as production. Named
+            # per process, so concurrent test runs never share one file
+            config.setdefault('TEST', {}).setdefault(
+                'NAME', os.path.join(tempfile.gettempdir(), f'jobportal_test_{os.getpid()}.sqlite3')
+            )
+    elif config['ENGINE'] in POSTGRES_ENGINES:
+        options.setdefault('connect_timeout', 5)
+        if replica:
+            options.setdefault('options', '-c default_transaction_read_only=on')
+    if replica:
+        # Tests run against the primary's test database only
+        config['TEST'] = {'MIRROR': 'default'}
+    return config
+
+
+def database_settings(base_dir):
+    """
+    Returns:
+        A (DATABASES, replica_aliases) tuple.
+    """
+    conn_max_age = int(os.environ.get('DB_CONN_MAX_AGE', 0))
+
+    def parse(url):
+        return dj_database_url.parse(url, conn_max_age=conn_max_age, conn_health_checks=True)
+
+    primary_url = os.environ.get('DATABASE_URL') or f"sqlite:///{base_dir / 'db.sqlite3'}"
+    databases = {'default': _tune(parse(primary_url))}
+
+    replicas = []
+    replica_urls = [url.strip() for url in os.environ.get('DATABASE_REPLICA_URLS', '').split(',') if url.strip()]
+    for number, url in enumerate(replica_urls, start=1):
+        alias = f'replica{number}'
+        databases[alias] = _tune(parse(url), replica=True)
+        replicas.append(alias)
+    return databases, replicas
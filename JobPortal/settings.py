@@ -12,6 +12,8 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 import os
 from pathlib import Path
 
+from .database import database_settings
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -41,12 +43,15 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'jobs.middleware.ViewMetricsMiddleware',
+    'jobs.middleware.ReplicaRoutingMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'jobs.middleware.AsyncWhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'jobs.middleware.RoleMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -55,7 +60,8 @@ ROOT_URLCONF = 'JobPortal.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # DjangoTemplates with render timing for ViewMetricsMiddleware
+        'BACKEND': 'jobs.instrumentation.TimedDjangoTemplates',
         'DIRS': [],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -74,14 +80,84 @@ WSGI_APPLICATION = 'JobPortal.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
-DATABASES = {
+# Primary and read replicas come from DATABASE_URL / DATABASE_REPLICA_URLS;
+# see JobPortal/database.py. Without them this is the local db.sqlite3.
+
+DATABASES, DATABASE_REPLICAS = database_settings(BASE_DIR)
+DATABASE_ROUTERS = ['jobs.routers.PrimaryReplicaRouter']
+
+# After a write, the user's reads stay on the primary for this long so they
+# see their own changes despite replication lag
+REPLICA_PIN_SECONDS = 5
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Local memory is per process; use the file backend (or a shared cache) when
+# running several gunicorn workers so invalidation reaches all of them, e.g.
+# CACHE_BACKEND=django.core.cache.backends.filebased.FileBasedCache CACHE_LOCATION=/var/tmp/jobportal_cache
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'jobportal'),
     }
 }
 
 
+# Email
+# Candidates are notified of status changes by the send_notifications worker.
+# Set EMAIL_BACKEND=django.core.mail.backends.smtp.EmailBackend (plus the
+# usual EMAIL_HOST settings) in production; the console backend needs nothing.
+
+EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.console.EmailBackend')
+EMAIL_HOST = os.environ.get('EMAIL_HOST', 'localhost')
+EMAIL_PORT = int(os.environ.get('EMAIL_PORT', 25))
+EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER', '')
+EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD', '')
+EMAIL_USE_TLS = os.environ.get('EMAIL_USE_TLS', '') == '1'
+EMAIL_TIMEOUT = 10
+DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'Job Portal <no-reply@jobportal.local>')
+
+# Seconds a status change waits in the outbox, so quick successive changes
+# (shortlist, then schedule) reach the candidate as one email
+NOTIFICATION_COALESCE_SECONDS = 60
+
+
+# Job expiry and archival (the archive_jobs command)
+# Postings close JOB_EXPIRY_DAYS after they are posted; applications move to
+# the archive table APPLICATION_ARCHIVE_DAYS after their job closed.
+
+JOB_EXPIRY_DAYS = int(os.environ.get('JOB_EXPIRY_DAYS', 60))
+APPLICATION_ARCHIVE_DAYS = int(os.environ.get('APPLICATION_ARCHIVE_DAYS', 90))
+
+
+# Per-view performance budgets
+# Requests over budget are logged to the 'jobs.performance' logger by
+# jobs.middleware.ViewMetricsMiddleware. Keys are URL names; 'default' applies
+# to every view without its own entry.
+
+VIEW_BUDGETS = {
+    'default': {'queries': 25, 'ms': 500},
+    'employer_dashboard': {'queries': 15, 'ms': 400},
+    'employee_dashboard': {'queries': 10, 'ms': 300},
+    'apply_for_job': {'queries': 10, 'ms': 200},
+    # Checking a password runs PBKDF2 with Django's default iterations (~0.5 s)
+    'login': {'queries': 15, 'ms': 1500},
+}
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'jobs.performance': {'handlers': ['console'], 'level': 'WARNING'},
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -118,10 +194,22 @@ USE_TZ = True
 
 STATIC_URL = '/static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# app.css is generated: run "manage.py build_css" before collectstatic
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'jobs.storage.StaticFilesStorage'},
+}
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
+
+# How permission-checked files (resumes) are sent; see jobs.delivery.
+# 'x-accel': nginx serves them from an `internal` location that maps
+#            PRIVATE_FILE_ACCEL_PREFIX to MEDIA_ROOT.
+# 'x-sendfile': Apache mod_xsendfile / lighttpd send the file by path.
+# '': Django streams the file itself (development, or no front-end server).
+PRIVATE_FILE_DELIVERY = os.environ.get('PRIVATE_FILE_DELIVERY', '')
+PRIVATE_FILE_ACCEL_PREFIX = os.environ.get('PRIVATE_FILE_ACCEL_PREFIX', '/protected-media/')
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
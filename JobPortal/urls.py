@@ -16,8 +16,6 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
-from django.conf import settings
-from django.conf.urls.static import static
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -26,6 +24,5 @@ urlpatterns = [
     path('', include('jobs.urls')),
 ]
 
-# Serve media files (uploads) only during development (DEBUG=True)
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+# Uploaded files are not served by URL: resumes go through the permission-checked
+# jobs.views.download_resume view
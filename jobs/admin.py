@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import EmployerProfile, JobSeekerProfile, JobPosting, Application, Interview
+from .models import EmployerProfile, JobSeekerProfile, JobPosting, Application, Interview, ResumeText, ResumeBlob, NotificationOutbox, ArchivedApplication, SavedSearch, SavedSearchMatch, Location
 
 # Define how models should appear in the admin
 @admin.register(EmployerProfile)
@@ -14,8 +14,10 @@ class JobSeekerProfileAdmin(admin.ModelAdmin):
 
 @admin.register(JobPosting)
 class JobPostingAdmin(admin.ModelAdmin):
-    list_display = ('title', 'employer', 'location', 'posted_on', 'is_active')
-    list_filter = ('is_active', 'location')
+    list_display = ('title', 'employer', 'location', 'canonical_location', 'posted_on', 'is_active', 'closed_on')
+    # Filter on the resolved place, so "Chennai" and "chennai, TN" are one choice
+    list_filter = ('is_active', 'canonical_location__country', ('canonical_location', admin.RelatedOnlyFieldListFilter))
+    list_select_related = ('employer', 'canonical_location')
     search_fields = ('title', 'description')
 
 @admin.register(Application)
@@ -34,3 +36,47 @@ class ApplicationAdmin(admin.ModelAdmin):
 class InterviewAdmin(admin.ModelAdmin):
     list_display = ('application', 'scheduled_time', 'location_link')
     list_filter = ('scheduled_time',)
+
+
+@admin.register(ResumeText)
+class ResumeTextAdmin(admin.ModelAdmin):
+    list_display = ('profile', 'status', 'source_name', 'extracted_on', 'extraction_seconds')
+    list_filter = ('status',)
+    search_fields = ('profile__user__username', 'source_name')
+    readonly_fields = ('queued_on', 'extracted_on', 'extraction_seconds', 'error')
+
+@admin.register(ResumeBlob)
+class ResumeBlobAdmin(admin.ModelAdmin):
+    list_display = ('name', 'size', 'ref_count', 'created_on', 'released_on')
+    search_fields = ('name',)
+
+@admin.register(NotificationOutbox)
+class NotificationOutboxAdmin(admin.ModelAdmin):
+    list_display = ('application', 'status', 'state', 'attempts', 'created_on', 'available_at', 'sent_on')
+    list_filter = ('state', 'status')
+    readonly_fields = ('created_on', 'sent_on', 'attempts', 'last_error')
+
+@admin.register(ArchivedApplication)
+class ArchivedApplicationAdmin(admin.ModelAdmin):
+    list_display = ('id', 'job', 'seeker', 'status', 'applied_on', 'archived_on')
+    list_filter = ('status',)
+    search_fields = ('seeker__user__username', 'job__title')
+    raw_id_fields = ('job', 'seeker')
+
+@admin.register(SavedSearch)
+class SavedSearchAdmin(admin.ModelAdmin):
+    list_display = ('seeker', 'keywords', 'location', 'skills', 'key_term', 'created_on')
+    search_fields = ('seeker__user__username', 'keywords', 'key_term')
+    readonly_fields = ('key_term',)
+
+@admin.register(SavedSearchMatch)
+class SavedSearchMatchAdmin(admin.ModelAdmin):
+    list_display = ('seeker', 'job', 'search', 'matched_on', 'digested_on')
+    list_filter = ('digested_on',)
+
+@admin.register(Location)
+class LocationAdmin(admin.ModelAdmin):
+    list_display = ('name', 'region', 'country', 'latitude', 'longitude', 'geohash')
+    list_filter = ('country',)
+    search_fields = ('name', 'aliases__alias')
+    readonly_fields = ('geohash',)
@@ -0,0 +1,189 @@
+import re
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from .matching import normalize_skills
+from .models import EmployerProfile, SavedSearch, SavedSearchMatch
+
+# --- Saved Search Matching (reverse search) ---
+#
+# Searching runs one query against many postings; here each new or edited
+# posting is run against many stored queries. Queries are conjunctive, so
+# each is indexed under a single one of its terms: a posting looks up only
+# the searches keyed by terms it contains, and verifies just those. The
+# cost follows the posting's size and the candidates it finds, not the
+# number of saved searches.
+
+DIGEST_BATCH_SIZE = 200  # seekers per batch
+MAX_SAVED_SEARCHES = 20  # per seeker
+_WORD_RE = re.compile(r'\w+', re.UNICODE)
+_LOOKUP_CHUNK = 500  # terms per IN (...) lookup, well under SQLite's parameter limit
+
+
+def _words(text: str) -> set:
+    return {word[:100] for word in _WORD_RE.findall((text or '').lower())}
+
+
+def search_terms(search) -> set:
+    """
+    The terms a posting must contain to match a saved search.
+
+    Terms are namespaced by field: "kw:" for a keyword found anywhere in
+    the posting, "loc:" for a word of its location, "skill:" for a
+    normalised skill it lists.
+    """
+    return (
+        {f'kw:{word}' for word in _words(search.keywords)}
+        | {f'loc:{word}' for word in _words(search.location)}
+        | {f'skill:{skill}' for skill in normalize_skills(search.skills)}
+    )
+
+
+def posting_terms(job, company_name: str = '') -> set:
+    """Every term a posting can match, in the namespaces of search_terms()."""
+    text = ' '.join([job.title, job.description, job.location, job.skills, company_name])
+    return (
+        {f'kw:{word}' for word in _words(text)}
+        | {f'loc:{word}' for word in _words(job.location)}
+        | {f'skill:{skill}' for skill in normalize_skills(job.skills)}
+    )
+
+
+def choose_key_term(terms) -> str:
+    """
+    Picks the term a search is indexed under.
+
+    A search is checked for every posting containing its key, so the key
+    should be the term the fewest postings contain. Lacking term statistics,
+    skills and keywords beat location words (a city matches a large part of
+    the feed), and longer words beat shorter ones.
+    """
+    if not terms:
+        return ''  # never a candidate; the form does not allow such searches
+    rank = {'skill': 0, 'kw': 1, 'loc': 2}
+    return min(terms, key=lambda term: (rank[term.split(':', 1)[0]], -len(term), term))
+
+
+def match_jobs(jobs) -> int:
+    """
+    Files new or edited postings in the inboxes of the seekers whose saved
+    searches they match.
+
+    Inactive postings are skipped, and a posting already in a seeker's inbox
+    is not added again. Costs one employer lookup, one candidate lookup per
+    500 distinct terms across the batch, and, when anything matched, one
+    lookup of existing entries and one INSERT.
+
+    Returns:
+        The number of inbox entries created.
+    """
+    jobs = [job for job in jobs if job.is_active]
+    if not jobs:
+        return 0
+    company_names = dict(
+        EmployerProfile.objects.filter(id__in={job.employer_id for job in jobs}).values_list('id', 'company_name')
+    )
+    terms_by_job = {job.id: posting_terms(job, company_names.get(job.employer_id, '')) for job in jobs}
+
+    all_terms = sorted(set().union(*terms_by_job.values()))
+    candidates = defaultdict(list)
+    for start in range(0, len(all_terms), _LOOKUP_CHUNK):
+        for search in SavedSearch.objects.filter(key_term__in=all_terms[start:start + _LOOKUP_CHUNK]):
+            candidates[search.key_term].append(search)
+
+    required = {}
+    matches = {}
+    for job_id, terms in terms_by_job.items():
+        for key in terms & candidates.keys():
+            for search in candidates[key]:
+                if search.id not in required:
+                    required[search.id] = search_terms(search)
+                if required[search.id] <= terms:
+                    matches.setdefault((search.seeker_id, job_id), search.id)
+    if not matches:
+        return 0
+
+    existing = set(
+        SavedSearchMatch.objects.filter(job_id__in=terms_by_job, seeker_id__in={seeker_id for seeker_id, _ in matches})
+        .values_list('seeker_id', 'job_id')
+    )
+    new = [
+        SavedSearchMatch(search_id=search_id, seeker_id=seeker_id, job_id=job_id)
+        for (seeker_id, job_id), search_id in matches.items() if (seeker_id, job_id) not in existing
+    ]
+    # A concurrent edit of the same posting may have filed some already
+    SavedSearchMatch.objects.bulk_create(new, ignore_conflicts=True)
+    return len(new)
+
+
+def inbox_for_seeker(seeker_id):
+    """A seeker's matched postings, newest first."""
+    return SavedSearchMatch.objects.filter(seeker_id=seeker_id).select_related('job__employer', 'search').order_by(
+        '-matched_on', '-id'
+    )
+
+
+# --- Email Digests ---
+
+def _build_digest(user, matches) -> EmailMessage:
+    subject = (
+        f"New job matching your saved search: {matches[0].job.title}" if len(matches) == 1
+        else f"{len(matches)} new jobs matching your saved searches"
+    )
+    body = render_to_string('jobs/email/search_digest.txt', {'user': user, 'matches': matches})
+    return EmailMessage(subject, body, settings.DEFAULT_FROM_EMAIL, [user.email])
+
+
+def send_digests(batch_size: int = DIGEST_BATCH_SIZE) -> dict:
+    """
+    Emails every seeker with undigested inbox entries one message listing
+    the ones whose postings are still open, then marks them digested.
+
+    Seekers are handled `batch_size` at a time over one mail connection. A
+    failed send leaves that seeker's entries for the next run.
+
+    Returns:
+        {'sent': emails sent, 'matches': entries settled, 'failed': seekers
+        whose email could not be sent}
+    """
+    summary = {'sent': 0, 'matches': 0, 'failed': 0}
+    failed_seekers = set()
+    connection = get_connection()
+    try:
+        while True:
+            seeker_ids = list(
+                SavedSearchMatch.objects.filter(digested_on__isnull=True).exclude(seeker_id__in=failed_seekers)
+                .order_by('seeker_id').values_list('seeker_id', flat=True).distinct()[:batch_size]
+            )
+            if not seeker_ids:
+                return summary
+
+            pending = defaultdict(list)
+            for match in (
+                SavedSearchMatch.objects.filter(digested_on__isnull=True, seeker_id__in=seeker_ids)
+                .select_related('seeker__user', 'job__employer').order_by('matched_on', 'id')
+            ):
+                pending[match.seeker_id].append(match)
+
+            for seeker_matches in pending.values():
+                user = seeker_matches[0].seeker.user
+                open_matches = [match for match in seeker_matches if match.job.is_active]
+                if open_matches and user.email:
+                    try:
+                        connection.send_messages([_build_digest(user, open_matches)])
+                    except Exception:
+                        failed_seekers.add(seeker_matches[0].seeker_id)
+                        summary['failed'] += 1
+                        continue
+                    summary['sent'] += 1
+                # Closed postings and seekers without an address are settled unsent
+                SavedSearchMatch.objects.filter(id__in=[match.id for match in seeker_matches]).update(
+                    digested_on=timezone.now()
+                )
+                summary['matches'] += len(seeker_matches)
+    finally:
+        connection.close()
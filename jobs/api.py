@@ -0,0 +1,117 @@
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET, require_POST
+
+from .counters import APPLY_DUPLICATE, APPLY_UNAVAILABLE, submit_application
+from .models import Application, Interview, JobPosting, JobSeekerProfile
+from .pagination import akeyset_page
+from .utils import ROLE_EMPLOYEE, attach_role
+
+# --- Async JSON API ---
+#
+# Async views using the async ORM, so under uvicorn workers a slow client
+# holds a coroutine rather than a thread. Authentication is the normal
+# session cookie (POSTs need the CSRF token, as for the HTML views).
+
+API_PAGE_SIZE = 20
+
+
+def api_role_required(role):
+    """Async counterpart of utils.role_required that answers with JSON errors."""
+    def decorator(view_func):
+        @wraps(view_func)
+        async def wrapper(request, *args, **kwargs):
+            if request.role != role:
+                # The session role may predate a profile made by another process
+                await sync_to_async(attach_role)(request, refresh=True)
+            if request.role is None:
+                return JsonResponse({'error': 'Authentication required.'}, status=401)
+            if request.role != role:
+                return JsonResponse({'error': 'Permission denied.'}, status=403)
+            return await view_func(request, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _job_data(job, detail=False) -> dict:
+    data = {
+        'id': job.id,
+        'title': job.title,
+        'company': job.employer.company_name,
+        'location': job.location,
+        'skills': job.skills,
+        'posted_on': job.posted_on.isoformat(),
+    }
+    if detail:
+        data['description'] = job.description
+        data['is_active'] = job.is_active
+    return data
+
+
+def _application_data(application) -> dict:
+    try:
+        interview = application.interview
+    except Interview.DoesNotExist:
+        interview = None
+    return {
+        'id': application.id,
+        'job': {'id': application.job_id, 'title': application.job.title, 'company': application.job.employer.company_name},
+        'status': application.status,
+        'applied_on': application.applied_on.isoformat(),
+        'interview': interview and {
+            'scheduled_time': interview.scheduled_time.isoformat(),
+            'duration_minutes': interview.duration_minutes,
+            'location_link': interview.location_link,
+        },
+    }
+
+
+@require_GET
+async def job_list(request):
+    """Active jobs, newest first, paged with ?cursor= (see pagination.keyset_page)."""
+    jobs, next_cursor = await akeyset_page(
+        JobPosting.objects.filter(is_active=True).select_related('employer'),
+        cursor=request.GET.get('cursor'),
+        page_size=API_PAGE_SIZE,
+    )
+    return JsonResponse({'results': [_job_data(job) for job in jobs], 'next_cursor': next_cursor})
+
+
+@require_GET
+async def job_detail(request, job_id):
+    try:
+        job = await JobPosting.objects.select_related('employer').aget(pk=job_id)
+    except JobPosting.DoesNotExist:
+        return JsonResponse({'error': 'Job not found.'}, status=404)
+    return JsonResponse(_job_data(job, detail=True))
+
+
+@require_POST
+@api_role_required(ROLE_EMPLOYEE)
+async def apply(request, job_id):
+    """Applies the signed-in seeker to a job; 201 on success, 409 if already applied."""
+    resume = await JobSeekerProfile.objects.filter(pk=request.profile_id).values_list('resume', flat=True).afirst()
+    if not resume:
+        return JsonResponse({'error': 'Upload a resume before applying.'}, status=400)
+
+    # One conflict-safe INSERT plus the counter update, in one transaction
+    outcome, job, application_id = await sync_to_async(submit_application)(job_id, request.profile_id)
+    if job is None:
+        return JsonResponse({'error': 'Job not found.'}, status=404)
+    if outcome == APPLY_DUPLICATE:
+        return JsonResponse({'error': 'You have already applied for this job.'}, status=409)
+    if outcome == APPLY_UNAVAILABLE:
+        return JsonResponse({'error': 'This job is no longer accepting applications.'}, status=410)
+    return JsonResponse({'id': application_id, 'job': {'id': job_id, 'title': job['title']}, 'status': 'APPLIED'}, status=201)
+
+
+@require_GET
+@api_role_required(ROLE_EMPLOYEE)
+async def my_applications(request):
+    """The signed-in seeker's applications, newest first, with interview details."""
+    applications = Application.objects.filter(seeker_id=request.profile_id).select_related(
+        'job__employer', 'interview'
+    ).order_by('-applied_on', '-id')
+    return JsonResponse({'results': [_application_data(app) async for app in applications.aiterator()]})
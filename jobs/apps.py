@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class JobsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'jobs'
+
+    def ready(self):
+        # Register signal handlers (search and skill index sync)
+        from . import signals  # noqa: F401
+        # Register the deployment checks (manage.py check --deploy)
+        from . import checks  # noqa: F401
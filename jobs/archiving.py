@@ -0,0 +1,128 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .caching import invalidate_employer
+from .counters import recount_jobs
+from .fragments import bump_job_card
+from .models import Application, ArchivedApplication, Interview, JobPosting, NotificationOutbox
+from .pagination import FEED_COUNT_CACHE_KEY
+from .search import index_jobs
+
+# --- Job Expiry and Application Archival ---
+#
+# Both passes work in small batches, each in its own short transaction, so
+# the SQLite write lock is never held for long and the portal stays
+# writable while they run.
+
+ARCHIVE_BATCH_SIZE = 200
+
+
+def expire_jobs(max_age_days: int, batch_size: int = ARCHIVE_BATCH_SIZE, now=None) -> int:
+    """
+    Closes active postings older than `max_age_days`.
+
+    Returns:
+        The number of jobs closed.
+    """
+    now = now or timezone.now()
+    cutoff = now - timedelta(days=max_age_days)
+    expired = 0
+    while True:
+        batch = list(
+            JobPosting.objects.filter(is_active=True, posted_on__lt=cutoff)
+            .order_by('pk').values_list('pk', 'employer_id')[:batch_size]
+        )
+        if not batch:
+            break
+        job_ids = [job_id for job_id, _ in batch]
+        with transaction.atomic():
+            JobPosting.objects.filter(pk__in=job_ids).update(is_active=False, closed_on=now, updated_at=now)
+            # Queryset updates send no post_save; re-indexing drops inactive jobs
+            index_jobs(job_ids)
+        for job_id in job_ids:
+            bump_job_card(job_id)
+        for employer_id in {employer_id for _, employer_id in batch}:
+            invalidate_employer(employer_id)
+        expired += len(job_ids)
+
+    if expired:
+        cache.delete(FEED_COUNT_CACHE_KEY)
+    return expired
+
+
+def _delete_rows(model, column: str, ids):
+    """Plain DELETE by id list, without the per-row signals of QuerySet.delete()."""
+    placeholders = ', '.join(['%s'] * len(ids))
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {model._meta.db_table} WHERE {column} IN ({placeholders})', ids)
+
+
+def archive_applications(closed_days: int, batch_size: int = ARCHIVE_BATCH_SIZE, now=None) -> int:
+    """
+    Moves applications of jobs closed for over `closed_days` into
+    ArchivedApplication, interview details included.
+
+    Each batch copies the rows, deletes them (with their interviews and
+    outbox events) and recounts the affected jobs in one transaction.
+
+    Returns:
+        The number of applications archived.
+    """
+    now = now or timezone.now()
+    cutoff = now - timedelta(days=closed_days)
+    archived = 0
+    while True:
+        rows = list(
+            Application.objects.filter(job__is_active=False, job__closed_on__lt=cutoff).order_by('pk').values(
+                'id', 'job_id', 'seeker_id', 'applied_on', 'status', 'job__employer_id',
+                'interview__scheduled_time', 'interview__duration_minutes',
+                'interview__location_link', 'interview__notes',
+            )[:batch_size]
+        )
+        if not rows:
+            return archived
+
+        app_ids = [row['id'] for row in rows]
+        job_ids = {row['job_id'] for row in rows}
+        employer_ids = {row['job__employer_id'] for row in rows}
+        with transaction.atomic():
+            ArchivedApplication.objects.bulk_create([
+                ArchivedApplication(
+                    id=row['id'], job_id=row['job_id'], seeker_id=row['seeker_id'],
+                    applied_on=row['applied_on'], status=row['status'], archived_on=now,
+                    interview_time=row['interview__scheduled_time'],
+                    interview_duration_minutes=row['interview__duration_minutes'],
+                    interview_location_link=row['interview__location_link'],
+                    interview_notes=row['interview__notes'],
+                )
+                for row in rows
+            ])
+            _delete_rows(NotificationOutbox, 'application_id', app_ids)
+            _delete_rows(Interview, 'application_id', app_ids)
+            _delete_rows(Application, 'id', app_ids)
+            recount_jobs(job_ids)
+        for employer_id in employer_ids:
+            invalidate_employer(employer_id)
+        archived += len(rows)
+
+
+# --- Archived History (slow path) ---
+#
+# Off the dashboards on purpose: these read the archive table, which only
+# grows, so they are separate paginated pages.
+
+def archived_applications_for_seeker(seeker_id):
+    """A seeker's archived applications, newest first."""
+    return ArchivedApplication.objects.filter(seeker_id=seeker_id).select_related('job__employer').order_by(
+        '-applied_on', '-id'
+    )
+
+
+def archived_applications_for_job(job_id):
+    """A job's archived applications, newest first."""
+    return ArchivedApplication.objects.filter(job_id=job_id).select_related('seeker__user').order_by(
+        '-applied_on', '-id'
+    )
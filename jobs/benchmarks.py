@@ -0,0 +1,184 @@
+import asyncio
+import time
+import tracemalloc
+
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.db import connection
+from django.test import AsyncClient, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from .instrumentation import percentile
+from .models import EmployerProfile, JobPosting, JobSeekerProfile
+from .seeding import flush_seeded, seed_portal
+
+# --- Load Benchmarks ---
+
+def sizes_for(scale: int) -> dict:
+    """seed_portal() arguments for one data size; `scale` is the number of jobs."""
+    return {
+        'employers': max(1, scale // 20),
+        'jobs': scale,
+        'seekers': scale,
+        'applications': scale * 5,
+    }
+
+
+def _measure(client, method, url, requests):
+    """
+    Runs one request `requests` times and summarises time, queries and memory.
+
+    Timings include tracemalloc's overhead, so only compare them with
+    baselines recorded by this same runner.
+    """
+    timings, queries = [], []
+    tracemalloc.start()
+    try:
+        for _ in range(requests):
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                response = getattr(client, method)(url(), follow=False)
+                timings.append((time.perf_counter() - started) * 1000)
+            if response.status_code >= 400:
+                raise RuntimeError(f"{method.upper()} returned {response.status_code}")
+            queries.append(len(captured))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    timings.sort()
+    return {
+        'requests': requests,
+        'p50_ms': round(percentile(timings, 0.50), 2),
+        'p95_ms': round(percentile(timings, 0.95), 2),
+        'p99_ms': round(percentile(timings, 0.99), 2),
+        'queries': max(queries, default=0),
+        'peak_memory_kb': round(peak / 1024, 1),
+    }
+
+
+def run_benchmarks(scales, requests: int = 20, seed: int = 0) -> dict:
+    """
+    Seeds each data size in turn and times the benchmarked views against it.
+
+    Runs against whatever database is current, replacing its seeded data;
+    the benchmark command points it at a throwaway test database.
+
+    Returns:
+        {str(scale): {view_name: {p50_ms, p95_ms, p99_ms, queries, peak_memory_kb}}}
+    """
+    results = {}
+    for scale in scales:
+        flush_seeded()
+        cache.clear()
+        seed_portal(seed=seed, **sizes_for(scale))
+
+        # The employer of the most applied-for job, and a seeker who can apply
+        # (queryset update: no file behind this name, so keep the blob signals out of it)
+        employer = EmployerProfile.objects.get(pk=JobPosting.objects.order_by('-application_count', 'id')[0].employer_id)
+        seeker = JobSeekerProfile.objects.filter(user__username__startswith='seed-').order_by('id').first()
+        JobSeekerProfile.objects.filter(pk=seeker.pk).update(resume='resumes/benchmark.pdf')
+        open_jobs = iter(
+            JobPosting.objects.filter(is_active=True).exclude(applications__seeker=seeker)
+            .order_by('id').values_list('id', flat=True)[:requests]
+        )
+
+        client = Client()
+        views = {}
+        client.force_login(employer.user)
+        views['employer_dashboard'] = _measure(client, 'get', lambda: reverse('employer_dashboard'), requests)
+        client.force_login(seeker.user)
+        views['employee_dashboard'] = _measure(client, 'get', lambda: reverse('employee_dashboard'), requests)
+        views['apply_for_job'] = _measure(
+            client, 'post', lambda: reverse('apply_for_job', args=[next(open_jobs)]),
+            min(requests, JobPosting.objects.filter(is_active=True).exclude(applications__seeker=seeker).count()),
+        )
+        results[str(scale)] = views
+    flush_seeded()
+    return results
+
+
+# Same data for both sides: the seeker's dashboard renders the first feed
+# page and their applications, which the API serves as two JSON endpoints
+THROUGHPUT_PATHS = {
+    'html:employee_dashboard': ('employee_dashboard', ''),
+    'api:job_list': ('api_job_list', ''),
+    'api:my_applications': ('api_my_applications', ''),
+}
+
+
+async def _throughput(client, url, requests, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            response = await client.get(url)
+            if response.status_code != 200:
+                raise RuntimeError(f"GET {url} returned {response.status_code}")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return requests / (time.perf_counter() - started)
+
+
+def run_throughput(scale: int = 1000, requests: int = 200, concurrency: int = 20, seed: int = 0) -> dict:
+    """
+    Requests per second of the HTML dashboard and the async API, with
+    `concurrency` requests in flight, through Django's ASGI handler.
+
+    This runs in process, so it compares the views against each other; the
+    absolute numbers for a deployment come from uvicorn behind a load tool.
+
+    Returns:
+        {'html:employee_dashboard': {'requests_per_second': float}, 'api:...': ...}
+    """
+    flush_seeded()
+    cache.clear()
+    seed_portal(seed=seed, **sizes_for(scale))
+    seeker = JobSeekerProfile.objects.filter(user__username__startswith='seed-').select_related('user').order_by('id').first()
+
+    async def measure():
+        client = AsyncClient()
+        await client.aforce_login(seeker.user)
+        results = {}
+        for name, (url_name, query) in THROUGHPUT_PATHS.items():
+            rate = await _throughput(client, reverse(url_name) + query, requests, concurrency)
+            results[name] = {'requests_per_second': round(rate, 1)}
+        return results
+
+    try:
+        return async_to_sync(measure)()
+    finally:
+        flush_seeded()
+
+
+def compare_to_baseline(results: dict, baseline: dict, tolerance: float = 0.25) -> list:
+    """
+    Lists every regression of `results` against a stored baseline.
+
+    p95 latency and peak memory may grow, and throughput drop, by `tolerance`
+    (a fraction) before they count; any increase in query count is a
+    regression, since query counts do not depend on how fast the machine is.
+    """
+    regressions = []
+    for name, current in results.get('throughput', {}).items():
+        previous = baseline.get('throughput', {}).get(name)
+        if previous and current['requests_per_second'] < previous['requests_per_second'] * (1 - tolerance):
+            regressions.append(
+                f"{name}: {current['requests_per_second']} req/s (baseline {previous['requests_per_second']})"
+            )
+
+    for scale, views in results.items():
+        if scale == 'throughput':
+            continue
+        for view, current in views.items():
+            previous = baseline.get(scale, {}).get(view)
+            if previous is None:
+                continue
+            if current['queries'] > previous['queries']:
+                regressions.append(f"{view} @ {scale}: {current['queries']} queries (baseline {previous['queries']})")
+            for metric in ('p95_ms', 'peak_memory_kb'):
+                if current[metric] > previous[metric] * (1 + tolerance):
+                    regressions.append(f"{view} @ {scale}: {metric} {current[metric]} (baseline {previous[metric]})")
+    return regressions
@@ -0,0 +1,90 @@
+import time
+
+from django.core.cache import cache
+
+# --- Versioned Per-Employer Caching ---
+
+DASHBOARD_CACHE_TTL = 300  # seconds; invalidation is explicit, this only bounds memory
+STATS_PREFIX = 'jobs:cache_stats'
+
+
+def _version_key(employer_id) -> str:
+    return f'jobs:employer:{employer_id}:version'
+
+
+def employer_version(employer_id) -> int:
+    """
+    Returns the current cache version for an employer.
+
+    A missing version (first use, or evicted) is seeded from the clock rather
+    than 1, so it can never collide with a version used before the eviction.
+    """
+    version = cache.get(_version_key(employer_id))
+    if version is None:
+        version = time.time_ns()
+        if not cache.add(_version_key(employer_id), version, None):
+            version = cache.get(_version_key(employer_id), version)
+    return version
+
+
+def invalidate_employer(employer_id):
+    """
+    Moves the employer to a new cache version.
+
+    Entries under the old version are never read again and simply expire,
+    so a stale dashboard cannot be served even if a delete races a write.
+    """
+    if employer_id is None:
+        return
+    try:
+        cache.incr(_version_key(employer_id))
+    except ValueError:
+        cache.set(_version_key(employer_id), time.time_ns(), None)
+
+
+def get_employer_cached(employer_id, name: str, build, timeout: int = DASHBOARD_CACHE_TTL, version=None):
+    """
+    Returns build() for this employer, served from the cache when current.
+
+    Args:
+        employer_id: Employer whose data is cached.
+        name: Short name of the cached value, also used for hit/miss stats.
+        build: Zero-argument callable producing the value on a miss.
+        version: What the value is built from, e.g. a digest of database
+            state. Defaults to the employer's cache version, which only
+            moves for changes made in this process (or all processes, with
+            a shared cache).
+    """
+    if version is None:
+        version = employer_version(employer_id)
+    key = f'jobs:employer:{employer_id}:{name}:v{version}'
+    value = cache.get(key)
+    if value is not None:
+        _count(name, 'hits')
+        return value
+    _count(name, 'misses')
+    value = build()
+    cache.set(key, value, timeout)
+    return value
+
+
+# --- Hit/Miss Counters ---
+
+def _count(name: str, outcome: str):
+    key = f'{STATS_PREFIX}:{name}:{outcome}'
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
+
+def cache_stats(name: str) -> dict:
+    """Returns {'hits': int, 'misses': int, 'hit_rate': float} for a cached value."""
+    hits = cache.get(f'{STATS_PREFIX}:{name}:hits', 0)
+    misses = cache.get(f'{STATS_PREFIX}:{name}:misses', 0)
+    total = hits + misses
+    return {'hits': hits, 'misses': misses, 'hit_rate': hits / total if total else 0.0}
+
+
+def reset_cache_stats(name: str):
+    cache.delete_many([f'{STATS_PREFIX}:{name}:hits', f'{STATS_PREFIX}:{name}:misses'])
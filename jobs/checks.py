@@ -0,0 +1,30 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+# --- Deployment Checks ---
+
+PER_PROCESS_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+@register(Tags.caches, deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    """
+    Session roles and the employer cache version are invalidated through the
+    default cache; with a per-process backend, invalidations made by one
+    worker, the admin or a management command never reach the others.
+    """
+    backend = settings.CACHES.get('default', {}).get('BACKEND', '')
+    if backend not in PER_PROCESS_CACHES:
+        return []
+    return [Warning(
+        f"The default cache ({backend}) is not shared between processes.",
+        hint=(
+            "Role and cache invalidations only reach the process that made them. "
+            "With more than one worker, set CACHE_BACKEND to a shared backend, e.g. "
+            "django.core.cache.backends.redis.RedisCache with CACHE_LOCATION=redis://..."
+        ),
+        id='jobs.W001',
+    )]
@@ -0,0 +1,143 @@
+import hashlib
+from functools import wraps
+
+from django.contrib import messages
+from django.db.models import Count, Max, Subquery
+from django.middleware.csrf import get_token
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from .models import Application, JobPosting, JobSeekerProfile
+from .pagination import cached_active_job_count
+
+# --- Conditional GET for Per-User Pages ---
+#
+# Dashboards are re-requested constantly (polling, back/forward navigation)
+# while their data rarely changes. A page declares a cheap summary of what
+# it shows; a client that already holds that state gets a 304 before the
+# view runs any of its heavy queries or renders a template.
+
+
+def _pending_messages(request) -> bool:
+    # Counting does not mark the messages as read
+    return len(messages.get_messages(request)) > 0
+
+
+def page_etag(request, state) -> str:
+    """
+    Weak ETag for one user's view of a page in a given data state.
+
+    Mixes in the URL (cursors, partial renders) and the CSRF secret, so a
+    page whose forms carry an outdated token is never revalidated.
+    """
+    get_token(request)  # first visit: create the secret the rendered forms will use
+    key = repr((request.user.pk, request.get_full_path(), request.META['CSRF_COOKIE'], state))
+    return 'W/"%s"' % hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+
+
+def conditional_page(validators):
+    """
+    Answers conditional GETs for a per-user page before the view runs.
+
+    Args:
+        validators: Callable taking the request and returning a
+            (state, last_modified) pair: any hashable summary of what the
+            page shows, and its newest timestamp (a datetime or None).
+
+    Responses are marked `private, no-cache`, so browsers keep the page but
+    revalidate it on every use. Requests with flash messages waiting skip
+    the check, since the messages must be rendered.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD') or _pending_messages(request):
+                return view_func(request, *args, **kwargs)
+
+            state, last_modified = validators(request)
+            etag = page_etag(request, state)
+            timestamp = int(last_modified.timestamp()) if last_modified else None
+            response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+            if response is None:
+                response = view_func(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+            response['ETag'] = etag
+            if last_modified:
+                response['Last-Modified'] = http_date(timestamp)
+            patch_cache_control(response, private=True, no_cache=True)
+            return response
+        return wrapper
+    return decorator
+
+
+def state_digest(state) -> str:
+    """Short, stable digest of a validator state, for use in cache keys."""
+    return hashlib.md5(repr(state).encode(), usedforsecurity=False).hexdigest()
+
+
+def employer_dashboard_validators(request):
+    """
+    Two indexed aggregates, over the employer's jobs and over their
+    applications (with the applicants and interviews they show).
+
+    The dashboard view keys its cached body on this same state, so a new
+    ETag always comes with a rebuilt page, whichever process made the
+    change. Computed once per request.
+    """
+    if getattr(request, '_employer_dashboard_state', None) is None:
+        jobs = JobPosting.objects.filter(employer_id=request.profile_id).aggregate(
+            count=Count('id'),
+            changed=Max('updated_at'),
+        )
+        applications = Application.objects.filter(job__employer_id=request.profile_id).aggregate(
+            count=Count('id'),
+            changed=Max('updated_at'),
+            seekers_changed=Max('seeker__updated_at'),
+            interviews=Count('interview'),
+            interviews_changed=Max('interview__updated_at'),
+        )
+
+        state = (*jobs.values(), *applications.values())
+        timestamps = [
+            stamp for stamp in (jobs['changed'], applications['changed'],
+                                applications['seekers_changed'], applications['interviews_changed'])
+            if stamp is not None
+        ]
+        request._employer_dashboard_state = state, max(timestamps, default=None)
+    return request._employer_dashboard_state
+
+
+def employee_dashboard_validators(request):
+    """
+    One query over the seeker's profile: the newest posting and aggregates
+    over their applications (with the jobs and interviews they show), plus
+    the feed's cached size.
+
+    The annotated profile replaces request.profile, so the view does not
+    load it again.
+    """
+    profile = JobSeekerProfile.objects.filter(pk=request.profile_id).annotate(
+        # Over every posting, so closing a job moves it too
+        feed_changed=Subquery(JobPosting.objects.order_by('-updated_at').values('updated_at')[:1]),
+        application_count=Count('applications'),
+        applications_changed=Max('applications__updated_at'),
+        jobs_changed=Max('applications__job__updated_at'),
+        interview_count=Count('applications__interview'),
+        interviews_changed=Max('applications__interview__updated_at'),
+    ).first()
+    if profile is None:
+        request.profile.pk  # gone: the lazy loader re-resolves the role and raises RoleChanged
+    request.profile = profile
+
+    state = (
+        profile.feed_changed, cached_active_job_count(JobPosting.objects.filter(is_active=True)),
+        profile.updated_at, profile.application_count, profile.applications_changed,
+        profile.jobs_changed, profile.interview_count, profile.interviews_changed,
+    )
+    timestamps = [
+        stamp for stamp in (profile.feed_changed, profile.updated_at, profile.applications_changed,
+                            profile.jobs_changed, profile.interviews_changed)
+        if stamp is not None
+    ]
+    return state, max(timestamps)
@@ -0,0 +1,236 @@
+from collections import defaultdict
+
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Case, Count, F, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .caching import invalidate_employer
+from .models import Application, ArchivedApplication, JobPosting
+from .notifications import enqueue_status_notifications
+
+# --- Denormalised Application Counters ---
+
+# Application.status -> JobPosting counter field
+STATUS_COUNTER_FIELDS = {
+    'APPLIED': 'applied_count',
+    'SHORTLISTED': 'shortlisted_count',
+    'INTERVIEW': 'interview_count',
+    'REJECTED': 'rejected_count',
+}
+
+
+def count_new_application(job_id, status='APPLIED'):
+    """Adds a freshly created application to its job's counters."""
+    field = STATUS_COUNTER_FIELDS[status]
+    JobPosting.objects.filter(pk=job_id).update(
+        application_count=F('application_count') + 1,
+        **{field: F(field) + 1},
+    )
+
+
+# submit_application outcomes
+APPLY_CREATED = 'created'
+APPLY_DUPLICATE = 'duplicate'
+APPLY_UNAVAILABLE = 'unavailable'  # inactive or missing job
+
+
+def _insert_application(job_id, seeker_id):
+    """
+    Inserts an APPLIED application if the job is active, in one statement.
+
+    The unique (job, seeker) constraint decides duplicates, so concurrent
+    submissions cannot both succeed and neither raises.
+
+    Returns:
+        The new application's id, or None if nothing was inserted.
+    """
+    if connection.vendor in ('sqlite', 'postgresql'):
+        quote = connection.ops.quote_name
+        job_table = quote(JobPosting._meta.db_table)
+        now = connection.ops.adapt_datetimefield_value(timezone.now())
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {quote(Application._meta.db_table)} (job_id, seeker_id, applied_on, updated_at, status) '
+                f'SELECT id, %s, %s, %s, %s FROM {job_table} WHERE id = %s AND is_active '
+                'ON CONFLICT (job_id, seeker_id) DO NOTHING RETURNING id',
+                [seeker_id, now, now, 'APPLIED', job_id],
+            )
+            row = cursor.fetchone()
+            return row[0] if row else None
+
+    # No ON CONFLICT: let the constraint fail inside a savepoint instead
+    if not JobPosting.objects.filter(pk=job_id, is_active=True).exists():
+        return None
+    try:
+        with transaction.atomic():
+            return Application.objects.create(job_id=job_id, seeker_id=seeker_id, status='APPLIED').id
+    except IntegrityError:
+        return None
+
+
+def submit_application(job_id, seeker_id):
+    """
+    Applies a seeker to a job; safe to call twice or concurrently.
+
+    Returns:
+        An (outcome, job, application_id) tuple: outcome is APPLY_CREATED,
+        APPLY_DUPLICATE or APPLY_UNAVAILABLE; job is a {'title',
+        'employer_id'} dict, or None if there is no such job; application_id
+        is the new or existing application's id, None if unavailable.
+    """
+    with transaction.atomic():
+        application_id = _insert_application(job_id, seeker_id)
+        if application_id is not None:
+            count_new_application(job_id)
+        job = JobPosting.objects.filter(pk=job_id).values('title', 'employer_id').first()
+        if application_id is not None:
+            # Raw inserts send no post_save, so invalidate explicitly
+            transaction.on_commit(lambda: invalidate_employer(job['employer_id']))
+            return APPLY_CREATED, job, application_id
+
+    if job is not None:
+        application_id = Application.objects.filter(job_id=job_id, seeker_id=seeker_id).values_list('id', flat=True).first()
+        if application_id is not None:
+            return APPLY_DUPLICATE, job, application_id
+    return APPLY_UNAVAILABLE, job, None
+
+
+def change_status(application, new_status) -> bool:
+    """
+    Moves an application to a new status and its job's counters with it.
+
+    The status write is conditional on the status we last read, so two
+    concurrent requests cannot both move the same application (and count it
+    twice); the loser simply gets False back.
+
+    Returns:
+        True if the status changed.
+    """
+    old_status = application.status
+    if old_status == new_status:
+        return False
+
+    with transaction.atomic():
+        changed = Application.objects.filter(pk=application.pk, status=old_status).update(
+            status=new_status, updated_at=timezone.now()
+        )
+        if changed:
+            old_field = STATUS_COUNTER_FIELDS[old_status]
+            new_field = STATUS_COUNTER_FIELDS[new_status]
+            JobPosting.objects.filter(pk=application.job_id).update(
+                **{old_field: F(old_field) - 1, new_field: F(new_field) + 1}
+            )
+            enqueue_status_notifications([application.pk], new_status)
+            # Queryset updates send no post_save, so invalidate explicitly
+            employer_id = JobPosting.objects.filter(pk=application.job_id).values_list('employer_id', flat=True).first()
+            transaction.on_commit(lambda: invalidate_employer(employer_id))
+
+    if changed:
+        application.status = new_status
+    return bool(changed)
+
+
+def bulk_change_status(employer_id, application_ids, new_status):
+    """
+    Moves many applications of one employer to a new status at once.
+
+    Uses a constant number of queries however many ids are given: one joined
+    SELECT that doubles as the permission check, one UPDATE for the status,
+    one INSERT into the notification outbox and one UPDATE applying every
+    job's counter deltas through CASE.
+
+    Returns:
+        The number of applications changed, or None if any id is not an
+        application to one of this employer's jobs (nothing is written then).
+    """
+    application_ids = set(application_ids)
+    with transaction.atomic():
+        owned = list(
+            Application.objects.select_for_update()
+            .filter(id__in=application_ids, job__employer_id=employer_id)
+            .values_list('id', 'job_id', 'status')
+        )
+        if len(owned) != len(application_ids):
+            return None
+
+        to_change = [(app_id, job_id, status) for app_id, job_id, status in owned if status != new_status]
+        if not to_change:
+            return 0
+
+        changed_ids = [app_id for app_id, _, _ in to_change]
+        Application.objects.filter(id__in=changed_ids).update(status=new_status, updated_at=timezone.now())
+        enqueue_status_notifications(changed_ids, new_status)
+
+        # Net counter change per (field, job)
+        deltas = defaultdict(lambda: defaultdict(int))
+        for _, job_id, old_status in to_change:
+            deltas[STATUS_COUNTER_FIELDS[old_status]][job_id] -= 1
+            deltas[STATUS_COUNTER_FIELDS[new_status]][job_id] += 1
+        JobPosting.objects.filter(pk__in={job_id for _, job_id, _ in to_change}).update(**{
+            field: F(field) + Case(
+                *[When(pk=job_id, then=Value(delta)) for job_id, delta in per_job.items()],
+                default=Value(0),
+            )
+            for field, per_job in deltas.items()
+        })
+        transaction.on_commit(lambda: invalidate_employer(employer_id))
+    return len(to_change)
+
+
+def _count_subquery(status=None, model=Application):
+    applications = model.objects.filter(job=OuterRef('pk'))
+    if status is not None:
+        applications = applications.filter(status=status)
+    counts = applications.order_by().values('job').annotate(n=Count('id')).values('n')
+    return Coalesce(Subquery(counts), 0)
+
+
+def _recounted_fields() -> dict:
+    """Counter field -> correlated COUNT subquery, for a JobPosting UPDATE."""
+    counters = {'application_count': _count_subquery()}
+    counters.update({field: _count_subquery(status) for status, field in STATUS_COUNTER_FIELDS.items()})
+    counters['archived_count'] = _count_subquery(model=ArchivedApplication)
+    return counters
+
+
+def recount_jobs(job_ids):
+    """Recomputes the counters of a few jobs in one UPDATE, e.g. after archiving."""
+    JobPosting.objects.filter(pk__in=job_ids).update(**_recounted_fields(), updated_at=timezone.now())
+
+
+def reconcile_counts(batch_size: int = 1000) -> int:
+    """
+    Recomputes every job's counters from the Application and
+    ArchivedApplication tables.
+
+    Each batch is one UPDATE with correlated COUNT subqueries over a primary
+    key range, committed on its own so the write lock is held only briefly.
+    Only jobs whose counters were wrong are written, so the dashboards'
+    validators move only when a page actually changes.
+
+    Returns:
+        The number of jobs processed.
+    """
+    counters = _recounted_fields()
+
+    processed = 0
+    last_id = 0
+    while True:
+        ids = list(
+            JobPosting.objects.filter(pk__gt=last_id).order_by('pk').values_list('pk', flat=True)[:batch_size]
+        )
+        if not ids:
+            return processed
+        # Only jobs whose counters drifted are written, and get a new updated_at
+        drifted = JobPosting.objects.filter(pk__gte=ids[0], pk__lte=ids[-1]).alias(
+            **{f'actual_{field}': subquery for field, subquery in counters.items()}
+        ).exclude(**{field: F(f'actual_{field}') for field in counters})
+        with transaction.atomic():
+            employer_ids = set(drifted.values_list('employer_id', flat=True))
+            if employer_ids:
+                JobPosting.objects.filter(pk__in=drifted.values('pk')).update(**counters, updated_at=timezone.now())
+        for employer_id in employer_ids:
+            invalidate_employer(employer_id)
+        processed += len(ids)
+        last_id = ids[-1]
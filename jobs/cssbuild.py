@@ -0,0 +1,457 @@
+import re
+from pathlib import Path
+
+# --- Purged Utility CSS Build ---
+#
+# The templates are styled with Tailwind-style utility classes. Instead of
+# compiling them in the browser from the CDN on every page load, build_css
+# scans the templates and Python sources for the classes actually used and
+# writes only their rules, after the hand-written styles/base.css, into one
+# minified static file. New utilities must be added to the rules below; the
+# build reports any class it does not know.
+
+APP_DIR = Path(__file__).resolve().parent
+CONTENT_PATHS = [
+    APP_DIR / 'templates',
+    APP_DIR / 'forms.py',
+    APP_DIR / 'views.py',  # model form widgets
+]
+BASE_CSS = APP_DIR / 'styles' / 'base.css'
+OUTPUT_CSS = APP_DIR / 'static' / 'jobs' / 'css' / 'app.css'
+
+# Tailwind's default palette, for the colour families the portal uses
+COLORS = {
+    'gray': ['#f9fafb', '#f3f4f6', '#e5e7eb', '#d1d5db', '#9ca3af', '#6b7280', '#4b5563', '#374151', '#1f2937', '#111827'],
+    'red': ['#fef2f2', '#fee2e2', '#fecaca', '#fca5a5', '#f87171', '#ef4444', '#dc2626', '#b91c1c', '#991b1b', '#7f1d1d'],
+    'yellow': ['#fefce8', '#fef9c3', '#fef08a', '#fde047', '#facc15', '#eab308', '#ca8a04', '#a16207', '#854d0e', '#713f12'],
+    'green': ['#f0fdf4', '#dcfce7', '#bbf7d0', '#86efac', '#4ade80', '#22c55e', '#16a34a', '#15803d', '#166534', '#14532d'],
+    'blue': ['#eff6ff', '#dbeafe', '#bfdbfe', '#93c5fd', '#60a5fa', '#3b82f6', '#2563eb', '#1d4ed8', '#1e40af', '#1e3a8a'],
+    'indigo': ['#eef2ff', '#e0e7ff', '#c7d2fe', '#a5b4fc', '#818cf8', '#6366f1', '#4f46e5', '#4338ca', '#3730a3', '#312e81'],
+    'purple': ['#faf5ff', '#f3e8ff', '#e9d5ff', '#d8b4fe', '#c084fc', '#a855f7', '#9333ea', '#7e22ce', '#6b21a8', '#581c87'],
+}
+SHADES = ['50', '100', '200', '300', '400', '500', '600', '700', '800', '900']
+NAMED_COLORS = {'white': '#fff', 'black': '#000', 'transparent': 'transparent', 'current': 'currentColor'}
+
+SPACING_STEPS = {
+    '0', '0.5', '1', '1.5', '2', '2.5', '3', '3.5', '4', '5', '6', '7', '8', '9', '10', '11', '12',
+    '14', '16', '20', '24', '28', '32', '36', '40', '44', '48', '52', '56', '60', '64', '72', '80', '96',
+}
+FONT_SIZES = {
+    'xs': ('0.75rem', '1rem'), 'sm': ('0.875rem', '1.25rem'), 'base': ('1rem', '1.5rem'),
+    'lg': ('1.125rem', '1.75rem'), 'xl': ('1.25rem', '1.75rem'), '2xl': ('1.5rem', '2rem'),
+    '3xl': ('1.875rem', '2.25rem'), '4xl': ('2.25rem', '2.5rem'), '5xl': ('3rem', '1'),
+}
+FONT_WEIGHTS = {
+    'thin': '100', 'light': '300', 'normal': '400', 'medium': '500',
+    'semibold': '600', 'bold': '700', 'extrabold': '800', 'black': '900',
+}
+FONT_FAMILIES = {
+    'sans': 'ui-sans-serif, system-ui, sans-serif',
+    'serif': 'ui-serif, Georgia, Cambria, serif',
+    'mono': 'ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, monospace',
+}
+MAX_WIDTHS = {
+    'xs': '20rem', 'sm': '24rem', 'md': '28rem', 'lg': '32rem', 'xl': '36rem', '2xl': '42rem',
+    '3xl': '48rem', '4xl': '56rem', '5xl': '64rem', '6xl': '72rem', '7xl': '80rem', 'full': '100%', 'none': 'none',
+}
+RADII = {'': '0.25rem', 'none': '0px', 'sm': '0.125rem', 'md': '0.375rem', 'lg': '0.5rem',
+         'xl': '0.75rem', '2xl': '1rem', '3xl': '1.5rem', 'full': '9999px'}
+SHADOWS = {
+    'sm': '0 1px 2px 0 rgb(0 0 0 / 0.05)',
+    '': '0 1px 3px 0 rgb(0 0 0 / 0.1), 0 1px 2px -1px rgb(0 0 0 / 0.1)',
+    'md': '0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)',
+    'lg': '0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1)',
+    'xl': '0 20px 25px -5px rgb(0 0 0 / 0.1), 0 8px 10px -6px rgb(0 0 0 / 0.1)',
+    '2xl': '0 25px 50px -12px rgb(0 0 0 / 0.25)',
+    'none': '0 0 #0000',
+}
+GRADIENT_DIRECTIONS = {'t': 'top', 'tr': 'top right', 'r': 'right', 'br': 'bottom right',
+                       'b': 'bottom', 'bl': 'bottom left', 'l': 'left', 'tl': 'top left'}
+SIDES = {'t': ['top'], 'r': ['right'], 'b': ['bottom'], 'l': ['left'],
+         'x': ['left', 'right'], 'y': ['top', 'bottom'], '': [None]}
+
+# Variant prefix -> media query, pseudo-element or pseudo-class
+BREAKPOINTS = {'sm': '640px', 'md': '768px', 'lg': '1024px', 'xl': '1280px', '2xl': '1536px'}
+PSEUDO_ELEMENTS = {'file': '::file-selector-button', 'placeholder': '::placeholder'}
+PSEUDO_CLASSES = {'hover': ':hover', 'focus': ':focus', 'disabled': ':disabled'}
+
+# Between siblings, for the space-* and divide-* utilities
+SIBLINGS = ' > :not([hidden]) ~ :not([hidden])'
+
+
+def _spacing(value):
+    if value == 'px':
+        return '1px'
+    if value in SPACING_STEPS:
+        return '0px' if value == '0' else f"{float(value) / 4:g}rem"
+    return None
+
+
+def _color(name):
+    if name in NAMED_COLORS:
+        return NAMED_COLORS[name]
+    family, _, shade = name.rpartition('-')
+    if family in COLORS and shade in SHADES:
+        return COLORS[family][SHADES.index(shade)]
+    return None
+
+
+def _box_side(prop, side, value):
+    return {f'{prop}-{edge}' if edge else prop: value for edge in SIDES[side]}
+
+
+def _shadow(value):
+    return {
+        '--tw-shadow': value,
+        'box-shadow': 'var(--tw-ring-offset-shadow, 0 0 #0000), var(--tw-ring-shadow, 0 0 #0000), var(--tw-shadow)',
+    }
+
+
+# Each rule maps a utility name to its declarations, or to (selector
+# suffix, declarations). Rules are emitted in registration order, which
+# follows Tailwind's, so later utilities win as they do there.
+_RULES = []
+
+
+def _rule(pattern):
+    def register(func):
+        _RULES.append((re.compile(pattern), func))
+        return func
+    return register
+
+
+@_rule(r'm([xytrbl]?)-(.+)')
+def _margin(side, value):
+    value = 'auto' if value == 'auto' else _spacing(value)
+    return value and _box_side('margin', side, value)
+
+@_rule(r'(block|inline-block|inline|flex|inline-flex|grid|table|hidden)')
+def _display(value):
+    return {'display': 'none' if value == 'hidden' else value}
+
+@_rule(r'(h|w)-(.+)')
+def _size(axis, value):
+    prop = 'height' if axis == 'h' else 'width'
+    value = {'full': '100%', 'screen': '100vh' if axis == 'h' else '100vw', 'auto': 'auto'}.get(value) or _spacing(value)
+    return value and {prop: value}
+
+@_rule(r'max-h-(.+)')
+def _max_height(value):
+    value = {'full': '100%', 'screen': '100vh'}.get(value) or _spacing(value)
+    return value and {'max-height': value}
+
+@_rule(r'min-h-(full|screen)')
+def _min_height(value):
+    return {'min-height': '100%' if value == 'full' else '100vh'}
+
+@_rule(r'min-w-(0|full)')
+def _min_width(value):
+    return {'min-width': '0px' if value == '0' else '100%'}
+
+@_rule(r'max-w-(.+)')
+def _max_width(value):
+    return value in MAX_WIDTHS and {'max-width': MAX_WIDTHS[value]}
+
+@_rule(r'grid-cols-(\d+)')
+def _grid_columns(count):
+    return {'grid-template-columns': f'repeat({count}, minmax(0, 1fr))'}
+
+@_rule(r'flex-(row|col|wrap|1)')
+def _flex(value):
+    return {'row': {'flex-direction': 'row'}, 'col': {'flex-direction': 'column'},
+            'wrap': {'flex-wrap': 'wrap'}, '1': {'flex': '1 1 0%'}}[value]
+
+@_rule(r'items-(start|end|center|baseline|stretch)')
+def _align_items(value):
+    return {'align-items': {'start': 'flex-start', 'end': 'flex-end'}.get(value, value)}
+
+@_rule(r'justify-(start|end|center|between|around)')
+def _justify(value):
+    return {'justify-content': {'start': 'flex-start', 'end': 'flex-end', 'between': 'space-between',
+                                'around': 'space-around'}.get(value, value)}
+
+@_rule(r'gap-(.+)')
+def _gap(value):
+    value = _spacing(value)
+    return value and {'gap': value}
+
+@_rule(r'space-(x|y)-(.+)')
+def _space(axis, value):
+    value = _spacing(value)
+    return value and (SIBLINGS, {'margin-left' if axis == 'x' else 'margin-top': value})
+
+@_rule(r'divide-(x|y)')
+def _divide(axis):
+    if axis == 'x':
+        return SIBLINGS, {'border-left-width': '1px', 'border-right-width': '0px'}
+    return SIBLINGS, {'border-top-width': '1px', 'border-bottom-width': '0px'}
+
+@_rule(r'divide-(.+)')
+def _divide_color(name):
+    value = _color(name)
+    return value and (SIBLINGS, {'border-color': value})
+
+@_rule(r'overflow(?:-(x|y))?-(auto|hidden|scroll|visible)')
+def _overflow(axis, value):
+    return {f'overflow-{axis}' if axis else 'overflow': value}
+
+@_rule(r'truncate')
+def _truncate():
+    return {'overflow': 'hidden', 'text-overflow': 'ellipsis', 'white-space': 'nowrap'}
+
+@_rule(r'whitespace-(normal|nowrap|pre|pre-line|pre-wrap)')
+def _whitespace(value):
+    return {'white-space': value}
+
+@_rule(r'rounded(?:-(none|sm|md|lg|xl|2xl|3xl|full))?')
+def _rounded(size):
+    return {'border-radius': RADII[size or '']}
+
+@_rule(r'border(?:-([trblxy]))?(?:-(0|2|4|8))?')
+def _border_width(side, width):
+    width = f"{width or 1}px"
+    if not side:
+        return {'border-width': width}
+    return {f'border-{edge}-width': width for edge in SIDES[side]}
+
+@_rule(r'border-(.+)')
+def _border_color(name):
+    value = _color(name)
+    return value and {'border-color': value}
+
+@_rule(r'bg-gradient-to-(t|tr|r|br|b|bl|l|tl)')
+def _gradient(direction):
+    return {'background-image': f'linear-gradient(to {GRADIENT_DIRECTIONS[direction]}, var(--tw-gradient-stops))'}
+
+@_rule(r'bg-(.+)')
+def _background(name):
+    value = _color(name)
+    return value and {'background-color': value}
+
+@_rule(r'from-(.+)')
+def _gradient_from(name):
+    value = _color(name)
+    return value and {
+        '--tw-gradient-from': value,
+        '--tw-gradient-to': 'rgb(255 255 255 / 0)',
+        '--tw-gradient-stops': 'var(--tw-gradient-from), var(--tw-gradient-to)',
+    }
+
+@_rule(r'to-(.+)')
+def _gradient_to(name):
+    value = _color(name)
+    return value and {'--tw-gradient-to': value}
+
+@_rule(r'p([xytrbl]?)-(.+)')
+def _padding(side, value):
+    value = _spacing(value)
+    return value and _box_side('padding', side, value)
+
+@_rule(r'text-(left|center|right|justify)')
+def _text_align(value):
+    return {'text-align': value}
+
+@_rule(r'align-(top|middle|bottom|baseline)')
+def _vertical_align(value):
+    return {'vertical-align': value}
+
+@_rule(r'font-(sans|serif|mono)')
+def _font_family(value):
+    return {'font-family': FONT_FAMILIES[value]}
+
+@_rule(r'text-(xs|sm|base|lg|xl|2xl|3xl|4xl|5xl)')
+def _font_size(size):
+    font_size, line_height = FONT_SIZES[size]
+    return {'font-size': font_size, 'line-height': line_height}
+
+@_rule(r'font-(.+)')
+def _font_weight(value):
+    return value in FONT_WEIGHTS and {'font-weight': FONT_WEIGHTS[value]}
+
+@_rule(r'(uppercase|lowercase|capitalize|normal-case)')
+def _text_transform(value):
+    return {'text-transform': 'none' if value == 'normal-case' else value}
+
+@_rule(r'(italic|not-italic)')
+def _font_style(value):
+    return {'font-style': 'italic' if value == 'italic' else 'normal'}
+
+@_rule(r'leading-(.+)')
+def _line_height(value):
+    named = {'none': '1', 'tight': '1.25', 'snug': '1.375', 'normal': '1.5', 'relaxed': '1.625', 'loose': '2'}
+    value = named.get(value) or _spacing(value)
+    return value and {'line-height': value}
+
+@_rule(r'tracking-(tighter|tight|normal|wide|wider|widest)')
+def _letter_spacing(value):
+    return {'letter-spacing': {'tighter': '-0.05em', 'tight': '-0.025em', 'normal': '0em',
+                               'wide': '0.025em', 'wider': '0.05em', 'widest': '0.1em'}[value]}
+
+@_rule(r'text-(.+)')
+def _text_color(name):
+    value = _color(name)
+    return value and {'color': value}
+
+@_rule(r'(underline|line-through|no-underline)')
+def _text_decoration(value):
+    return {'text-decoration-line': 'none' if value == 'no-underline' else value}
+
+@_rule(r'shadow(?:-(sm|md|lg|xl|2xl|none))?')
+def _box_shadow(size):
+    return _shadow(SHADOWS[size or ''])
+
+@_rule(r'outline-none')
+def _outline_none():
+    return {'outline': '2px solid transparent', 'outline-offset': '2px'}
+
+@_rule(r'ring(?:-(0|1|2|4|8))?')
+def _ring(width):
+    return {
+        '--tw-ring-offset-shadow': 'var(--tw-ring-inset,) 0 0 0 var(--tw-ring-offset-width) var(--tw-ring-offset-color)',
+        '--tw-ring-shadow': f'var(--tw-ring-inset,) 0 0 0 calc({width or 3}px + var(--tw-ring-offset-width)) var(--tw-ring-color)',
+        'box-shadow': 'var(--tw-ring-offset-shadow), var(--tw-ring-shadow), var(--tw-shadow, 0 0 #0000)',
+    }
+
+@_rule(r'ring-offset-(0|1|2|4|8)')
+def _ring_offset(width):
+    return {'--tw-ring-offset-width': f'{width}px'}
+
+@_rule(r'ring-(.+)')
+def _ring_color(name):
+    value = _color(name)
+    return value and {'--tw-ring-color': value}
+
+@_rule(r'transition(?:-(all|colors|shadow))?')
+def _transition(kind):
+    properties = {
+        None: 'color, background-color, border-color, text-decoration-color, fill, stroke, opacity, box-shadow, transform, filter',
+        'all': 'all',
+        'colors': 'color, background-color, border-color, text-decoration-color, fill, stroke',
+        'shadow': 'box-shadow',
+    }[kind]
+    return {
+        'transition-property': properties,
+        'transition-timing-function': 'cubic-bezier(0.4, 0, 0.2, 1)',
+        'transition-duration': '150ms',
+    }
+
+@_rule(r'duration-(75|100|150|200|300|500|700|1000)')
+def _duration(ms):
+    return {'transition-duration': f'{ms}ms'}
+
+
+def _utility(name):
+    """(rule index, selector suffix, declarations) for a bare utility, or None."""
+    for index, (pattern, func) in enumerate(_RULES):
+        match = pattern.fullmatch(name)
+        if not match:
+            continue
+        result = func(*match.groups())
+        if result:
+            suffix, declarations = result if isinstance(result, tuple) else ('', result)
+            return index, suffix, declarations
+    return None
+
+
+def _escape(class_name):
+    return re.sub(r'([^\w-])', r'\\\1', class_name)
+
+
+def compile_class(class_name):
+    """
+    Compiles one class, with any variant prefixes (md:, hover:, file:, ...).
+
+    Returns:
+        (sort key, media query or None, rule text), or None if the class is
+        not a known utility.
+    """
+    *variants, name = class_name.split(':')
+    media, pseudo_element, pseudo_classes = None, '', ''
+    for variant in variants:
+        if variant in BREAKPOINTS and media is None:
+            media = variant
+        elif variant in PSEUDO_ELEMENTS and not pseudo_element:
+            pseudo_element = PSEUDO_ELEMENTS[variant]
+        elif variant in PSEUDO_CLASSES:
+            pseudo_classes += PSEUDO_CLASSES[variant]
+        else:
+            return None
+    compiled = _utility(name)
+    if compiled is None:
+        return None
+    index, suffix, declarations = compiled
+
+    selector = f'.{_escape(class_name)}{pseudo_element}{pseudo_classes}{suffix}'
+    body = ';'.join(f'{prop}:{value}' for prop, value in declarations.items())
+    breakpoint_order = list(BREAKPOINTS).index(media) + 1 if media else 0
+    # Plain utilities, then pseudo variants, then each breakpoint in turn
+    key = (breakpoint_order, bool(pseudo_element), bool(pseudo_classes), index, class_name)
+    query = f'@media (min-width:{BREAKPOINTS[media]})' if media else None
+    return key, query, f'{selector}{{{body}}}'
+
+
+# Anything between separators may be a class; unknown tokens are ignored
+_CANDIDATE_RE = re.compile(r'''[^\s"'`<>{}%=(),;]+''')
+_CLASS_ATTR_RE = re.compile(r'''class(?:="([^"]*)"|'\s*:\s*'([^']*)'|\s*=\s*"([^"]*)")''')
+_TEMPLATE_VAR_RE = re.compile(r'{{.*?}}')
+_TEMPLATE_TAG_RE = re.compile(r'{%.*?%}')
+_DEFINED_CLASS_RE = re.compile(r'\.([A-Za-z_][\w-]*)')
+
+
+def _content_files(paths):
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            yield from sorted(p for p in path.rglob('*') if p.suffix in ('.html', '.txt', '.py'))
+        elif path.exists():
+            yield path
+
+
+def _class_attributes(text):
+    """Classes written in class attributes; tokens built from {{ variables }} are skipped."""
+    for match in _CLASS_ATTR_RE.finditer(text):
+        value = next(group for group in match.groups() if group is not None)
+        value = _TEMPLATE_TAG_RE.sub(' ', _TEMPLATE_VAR_RE.sub('\0', value))
+        yield from (token for token in value.split() if '\0' not in token)
+
+
+def minify(css: str) -> str:
+    """Strips comments and insignificant whitespace."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.replace(';}', '}').strip()
+
+
+def build_css(paths=CONTENT_PATHS, base_css=BASE_CSS):
+    """
+    Builds the stylesheet for the classes found under `paths`.
+
+    Returns:
+        (css, unknown) where `unknown` is the sorted list of classes used in
+        class attributes that are neither utilities nor defined in base_css.
+    """
+    base = Path(base_css).read_text()
+    defined = set(_DEFINED_CLASS_RE.findall(base))
+
+    candidates, attribute_classes = set(), set()
+    for path in _content_files(paths):
+        text = path.read_text(encoding='utf-8')
+        candidates.update(_CANDIDATE_RE.findall(text))
+        attribute_classes.update(_class_attributes(text))
+
+    compiled = {name: compile_class(name) for name in candidates | attribute_classes}
+    rules = sorted(result for result in compiled.values() if result is not None)
+    unknown = sorted(name for name in attribute_classes if compiled[name] is None and name not in defined)
+
+    parts = [base]
+    media_rules = {}
+    for _, query, rule in rules:
+        if query is None:
+            parts.append(rule)
+        else:
+            media_rules.setdefault(query, []).append(rule)
+    for query, grouped in media_rules.items():
+        parts.append(f"{query}{{{''.join(grouped)}}}")
+    return minify(''.join(parts)) + '\n', unknown
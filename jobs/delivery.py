@@ -0,0 +1,136 @@
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.utils.http import http_date, parse_etags, quote_etag
+
+from .storage import digest_from_name
+
+# --- Private File Delivery ---
+#
+# Permission checks happen in the view; the bytes are then handed to the
+# web server (X-Accel-Redirect for nginx, X-Sendfile for Apache/lighttpd)
+# so a slow download never occupies a Django worker. Without a front-end
+# server the file is streamed from here, with Range and ETag support.
+
+DELIVERY_CHUNK_SIZE = 64 * 1024
+_RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class RangeNotSatisfiable(ValueError):
+    """The Range header asks for bytes outside the file."""
+
+
+def parse_range(header: str, size: int):
+    """
+    Parses a single-range "bytes=" header.
+
+    Returns:
+        (start, end) with `end` inclusive, or None to send the whole file
+        (no header, or one this does not handle, such as multiple ranges).
+
+    Raises:
+        RangeNotSatisfiable: for a syntactically valid but impossible range.
+    """
+    match = _RANGE_RE.match((header or '').strip())
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if start >= size or (last and int(last) < start):
+            raise RangeNotSatisfiable(header)
+    else:
+        # "bytes=-500" is the last 500 bytes
+        if int(last) == 0:
+            raise RangeNotSatisfiable(header)
+        start, end = max(size - int(last), 0), size - 1
+    return start, end
+
+
+def file_etag(name: str, stat) -> str:
+    """Content digest for content-addressed names, else size and mtime."""
+    return quote_etag(digest_from_name(name) or f'{stat.st_size:x}-{int(stat.st_mtime):x}')
+
+
+def _read_range(handle, start, length):
+    try:
+        handle.seek(start)
+        while length > 0:
+            chunk = handle.read(min(DELIVERY_CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+    finally:
+        handle.close()
+
+
+def private_file_response(request, storage, name: str, download_name: str):
+    """
+    Delivers a stored file the caller has already authorised.
+
+    settings.PRIVATE_FILE_DELIVERY chooses how: 'x-accel' answers with an
+    X-Accel-Redirect to settings.PRIVATE_FILE_ACCEL_PREFIX + name, 'x-sendfile'
+    with the file's absolute path, and '' streams it from Django.
+    """
+    content_type = mimetypes.guess_type(download_name)[0] or 'application/octet-stream'
+    disposition = f"inline; filename*=UTF-8''{quote(download_name)}"
+
+    mode = settings.PRIVATE_FILE_DELIVERY
+    if mode in ('x-accel', 'x-sendfile'):
+        response = HttpResponse(content_type=content_type)
+        if mode == 'x-accel':
+            response['X-Accel-Redirect'] = settings.PRIVATE_FILE_ACCEL_PREFIX + quote(name)
+        else:
+            response['X-Sendfile'] = storage.path(name)
+        response['Content-Disposition'] = disposition
+        return response
+
+    path = storage.path(name)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return HttpResponse(status=404)
+    etag = file_etag(name, stat)
+    validators = {
+        'ETag': etag,
+        'Last-Modified': http_date(stat.st_mtime),
+        # Revalidate every time, so the permission check runs on each view
+        'Cache-Control': 'private, no-cache',
+    }
+
+    if_none_match = request.headers.get('If-None-Match')
+    if if_none_match and (etag in parse_etags(if_none_match) or if_none_match.strip() == '*'):
+        response = HttpResponseNotModified()
+        for header, value in validators.items():
+            response[header] = value
+        return response
+
+    byte_range = None
+    if_range = request.headers.get('If-Range')
+    if request.method == 'GET' and (not if_range or if_range.strip() == etag):
+        try:
+            byte_range = parse_range(request.headers.get('Range'), stat.st_size)
+        except RangeNotSatisfiable:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{stat.st_size}'
+            return response
+
+    handle = open(path, 'rb')
+    if byte_range is None:
+        response = FileResponse(handle, content_type=content_type)
+    else:
+        start, end = byte_range
+        response = StreamingHttpResponse(_read_range(handle, start, end - start + 1), status=206, content_type=content_type)
+        response['Content-Range'] = f'bytes {start}-{end}/{stat.st_size}'
+        response['Content-Length'] = str(end - start + 1)
+    for header, value in validators.items():
+        response[header] = value
+    response['Accept-Ranges'] = 'bytes'
+    response['Content-Disposition'] = disposition
+    return response
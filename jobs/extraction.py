@@ -0,0 +1,202 @@
+import os
+import re
+import signal
+import time
+import zipfile
+from multiprocessing import TimeoutError as PoolTimeoutError
+from xml.etree import ElementTree
+
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .caching import invalidate_employer
+from .matching import index_seeker_skills
+from .search import index_resumes
+from .models import JobPosting, JobSeekerProfile, ResumeText
+
+# --- Resume Text Extraction (runs inside pool worker processes) ---
+
+DEFAULT_TIMEOUT = 30  # seconds allowed per file
+MAX_TEXT_LENGTH = 200_000  # characters kept per resume
+
+_WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_BLANK_LINES_RE = re.compile(r'\n\s*\n+')
+
+
+class ExtractionTimeout(Exception):
+    """Raised inside a worker when a file takes longer than its time budget."""
+
+
+def extract_pdf_text(path: str) -> str:
+    """Extracts the text layer of every page of a PDF."""
+    from pypdf import PdfReader  # imported lazily so only workers pay for it
+
+    reader = PdfReader(path)
+    return '\n'.join(page.extract_text() or '' for page in reader.pages)
+
+
+def extract_docx_text(path: str) -> str:
+    """Extracts paragraph text from a DOCX file using only the standard library."""
+    with zipfile.ZipFile(path) as archive:
+        root = ElementTree.fromstring(archive.read('word/document.xml'))
+    paragraphs = []
+    for paragraph in root.iter(f'{_WORD_NS}p'):
+        paragraphs.append(''.join(node.text or '' for node in paragraph.iter(f'{_WORD_NS}t')))
+    return '\n'.join(paragraphs)
+
+
+def extract_text(path: str) -> str:
+    """
+    Returns normalised plain text for a PDF or DOCX resume.
+
+    Raises:
+        ValueError: If the file type is not supported.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.pdf':
+        text = extract_pdf_text(path)
+    elif extension == '.docx':
+        text = extract_docx_text(path)
+    else:
+        raise ValueError(f"Unsupported resume type: {extension or 'unknown'}")
+    text = text.replace('\x00', '')
+    return _BLANK_LINES_RE.sub('\n\n', text).strip()[:MAX_TEXT_LENGTH]
+
+
+def _raise_timeout(signum, frame):
+    raise ExtractionTimeout()
+
+
+def extract_in_worker(task):
+    """
+    Pool entry point: extracts one file under a SIGALRM time budget.
+
+    Never raises, so one malformed resume cannot take down the pool.
+
+    Returns:
+        A (record_id, text, error, seconds) tuple.
+    """
+    record_id, path, timeout = task
+    started = time.monotonic()
+    signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.alarm(timeout)
+    try:
+        text, error = extract_text(path), ''
+    except ExtractionTimeout:
+        text, error = '', f"Timed out after {timeout}s"
+    except Exception as exc:
+        text, error = '', f"{type(exc).__name__}: {exc}"
+    finally:
+        signal.alarm(0)
+    return record_id, text, error, time.monotonic() - started
+
+
+# --- Queue Management (runs in the web process / daemon) ---
+
+def enqueue_resumes(profiles):
+    """
+    Marks the given profiles' resumes as waiting for extraction.
+
+    This is the only work done on the request path: a single upsert per
+    batch, no file parsing.
+    """
+    now = timezone.now()
+    records = [
+        ResumeText(profile=profile, status='PENDING', source_name=profile.resume.name,
+                   queued_on=now, error='')
+        for profile in profiles if profile.resume
+    ]
+    ResumeText.objects.bulk_create(
+        records,
+        update_conflicts=True,
+        unique_fields=['profile'],
+        update_fields=['status', 'source_name', 'queued_on', 'error'],
+    )
+    # The old file's text stops being searchable until the new one is extracted
+    index_resumes(record.profile_id for record in records)
+    return len(records)
+
+
+def enqueue_backfill(batch_size: int = 500) -> int:
+    """
+    Queues every stored resume that has no extraction for its current file.
+
+    Returns:
+        The number of resumes queued.
+    """
+    profiles = (
+        JobSeekerProfile.objects.exclude(resume='').exclude(resume__isnull=True)
+        .filter(Q(resume_text__isnull=True) | ~Q(resume_text__source_name=F('resume')))
+        .only('id', 'resume')
+    )
+    queued, batch = 0, []
+    for profile in profiles.iterator(chunk_size=batch_size):
+        batch.append(profile)
+        if len(batch) >= batch_size:
+            queued += enqueue_resumes(batch)
+            batch = []
+    return queued + enqueue_resumes(batch)
+
+
+def claim_batch(size: int):
+    """Moves up to `size` pending records to PROCESSING and returns them."""
+    ids = list(
+        ResumeText.objects.filter(status='PENDING').order_by('queued_on')
+        .values_list('id', flat=True)[:size]
+    )
+    ResumeText.objects.filter(id__in=ids, status='PENDING').update(status='PROCESSING')
+    return list(ResumeText.objects.filter(id__in=ids, status='PROCESSING').select_related('profile'))
+
+
+def release_stale_claims() -> int:
+    """Requeues records left in PROCESSING by a worker that died mid-batch."""
+    return ResumeText.objects.filter(status='PROCESSING').update(status='PENDING')
+
+
+def process_batch(pool, records, timeout: int = DEFAULT_TIMEOUT):
+    """
+    Extracts a batch of claimed records on the pool and stores the results.
+
+    Returns:
+        A (done, failed, pool_healthy) tuple; pool_healthy is False when a
+        worker stopped responding and the pool should be recycled.
+    """
+    pending = {}
+    for record in records:
+        path = record.profile.resume.path if record.profile.resume else ''
+        pending[record.id] = (record, pool.apply_async(extract_in_worker, ((record.id, path, timeout),)))
+
+    done = failed = 0
+    pool_healthy = True
+    for record, result in pending.values():
+        try:
+            _, text, error, seconds = result.get(timeout=timeout + 5)
+        except PoolTimeoutError:
+            # The in-worker alarm failed to fire (e.g. stuck in C code)
+            text, error, seconds = '', f"Worker did not respond within {timeout}s", float(timeout)
+            pool_healthy = False
+
+        # Only store the result if the resume was not re-uploaded meanwhile
+        stored = ResumeText.objects.filter(id=record.id, status='PROCESSING').update(
+            status='FAILED' if error else 'DONE',
+            text=text,
+            error=error,
+            extraction_seconds=seconds,
+            extracted_on=timezone.now(),
+        )
+        if not stored:
+            continue
+        if error:
+            failed += 1
+        else:
+            done += 1
+            # Resume text contributes skills to matching
+            index_seeker_skills(record.profile)
+        index_resumes([record.profile_id])
+        # Recommendations and match scores may have changed; moves both dashboards' validators
+        JobSeekerProfile.objects.filter(id=record.profile_id).update(updated_at=timezone.now())
+        for employer_id in JobPosting.objects.filter(applications__seeker_id=record.profile_id).values_list(
+            'employer_id', flat=True
+        ).distinct():
+            invalidate_employer(employer_id)
+    return done, failed, pool_healthy
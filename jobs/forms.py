@@ -35,3 +35,11 @@ class LoginForm(forms.Form):
         label="Log in as",
         initial="employee"  # default selection, change to "employer" if you want
     )
+
+
+# Simple Job Posting Form (also validates bulk-imported rows, see jobs.importing)
+class JobPostingForm(forms.Form):
+    title = forms.CharField(max_length=200, widget=forms.TextInput(attrs={'class': 'w-full px-3 py-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-indigo-500'}))
+    description = forms.CharField(widget=forms.Textarea(attrs={'class': 'w-full px-3 py-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-indigo-500', 'rows': 5}))
+    location = forms.CharField(max_length=100, widget=forms.TextInput(attrs={'class': 'w-full px-3 py-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-indigo-500'}))
+    skills = forms.CharField(max_length=255, required=False, widget=forms.TextInput(attrs={'placeholder': 'e.g., Python, SQL, AWS', 'class': 'w-full px-3 py-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-indigo-500'}))
@@ -0,0 +1,66 @@
+import time
+
+from django.core.cache import cache
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+
+# --- Cached Job Card Fragments ---
+
+JOB_CARD_TEMPLATE = 'jobs/_job_card.html'
+JOB_CARD_TTL = 24 * 60 * 60
+
+
+def _version_key(job_id) -> str:
+    return f'jobs:card:{job_id}:version'
+
+
+def bump_job_card(job_id):
+    """Makes the next render of this job's card start from fresh data."""
+    try:
+        cache.incr(_version_key(job_id))
+    except ValueError:
+        cache.set(_version_key(job_id), time.time_ns(), None)
+
+
+def _card_versions(job_ids) -> dict:
+    """Current card version per job id, seeding missing ones like caching.employer_version."""
+    keys = {job_id: _version_key(job_id) for job_id in job_ids}
+    found = cache.get_many(keys.values())
+    versions = {}
+    for job_id, key in keys.items():
+        version = found.get(key)
+        if version is None:
+            version = time.time_ns()
+            if not cache.add(key, version, None):
+                version = cache.get(key, version)
+        versions[job_id] = version
+    return versions
+
+
+def render_job_cards(jobs, applied_job_ids) -> list:
+    """
+    Returns the HTML card of each job, in order, for one seeker.
+
+    A card is rendered once per job version in both of its states (already
+    applied / apply now) and cached; the seeker's applied set then only picks
+    a variant. A page of cards costs two cache reads plus template work for
+    the cards that changed since they were last shown.
+    """
+    versions = _card_versions([job.id for job in jobs])
+    keys = {job.id: f'jobs:card:{job.id}:v{versions[job.id]}' for job in jobs}
+    cached = cache.get_many(keys.values())
+
+    missing = {}
+    cards = []
+    for job in jobs:
+        variants = cached.get(keys[job.id])
+        if variants is None:
+            variants = {
+                applied: render_to_string(JOB_CARD_TEMPLATE, {'job': job, 'applied': applied})
+                for applied in (True, False)
+            }
+            missing[keys[job.id]] = variants
+        cards.append(mark_safe(variants[job.id in applied_job_ids]))
+    if missing:
+        cache.set_many(missing, JOB_CARD_TTL)
+    return cards
@@ -0,0 +1,146 @@
+import codecs
+import csv
+import json
+import os
+
+from django.core.cache import cache
+from django.db import transaction
+
+from .alerts import match_jobs
+from .caching import invalidate_employer
+from .locations import assign_locations
+from .forms import JobPostingForm
+from .matching import index_new_jobs_skills
+from .models import JobPosting
+from .pagination import FEED_COUNT_CACHE_KEY
+from .search import index_jobs
+
+# --- Streaming Bulk Import of Job Postings ---
+
+IMPORT_FORMATS = ('csv', 'jsonl')
+IMPORT_FIELDS = ('title', 'description', 'location', 'skills')
+IMPORT_BATCH_SIZE = 500
+
+
+class RowError(ValueError):
+    """A row that could not be parsed at all (bad JSON, wrong shape)."""
+
+
+def detect_format(filename: str) -> str:
+    """Guesses the import format from a file name ('.csv', '.jsonl' or '.ndjson')."""
+    extension = os.path.splitext(filename or '')[1].lower()
+    if extension == '.csv':
+        return 'csv'
+    if extension in ('.jsonl', '.ndjson'):
+        return 'jsonl'
+    raise ValueError(f"Unsupported file type '{extension or filename}'; use .csv or .jsonl.")
+
+
+def iter_rows(binary_file, file_format: str):
+    """
+    Yields (row_number, row) for each record, reading one line at a time.
+
+    Row numbers are 1-based data rows (the CSV header is not counted). Rows
+    that cannot be parsed are yielded as a RowError instead of a dict, so one
+    bad line never stops the import.
+    """
+    lines = codecs.getreader('utf-8-sig')(binary_file, errors='replace')
+    if file_format == 'csv':
+        reader = csv.DictReader(lines)
+        for number, row in enumerate(reader, start=1):
+            if None in row:
+                yield number, RowError("Row has more columns than the header.")
+            else:
+                yield number, row
+        return
+
+    number = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        number += 1
+        try:
+            row = json.loads(line)
+        except ValueError as exc:
+            yield number, RowError(f"Invalid JSON: {exc}")
+            continue
+        if not isinstance(row, dict):
+            yield number, RowError("Each line must be a JSON object.")
+            continue
+        yield number, row
+
+
+def validate_row(row: dict):
+    """
+    Applies the JobPostingForm rules to one row.
+
+    Returns:
+        (cleaned_data, None) for a valid row, or (None, {field: [messages]}).
+    """
+    data = {field: '' if row.get(field) is None else str(row.get(field)) for field in IMPORT_FIELDS}
+    form = JobPostingForm(data)
+    if form.is_valid():
+        return form.cleaned_data, None
+    return None, {field: list(messages) for field, messages in form.errors.items()}
+
+
+def import_jobs(employer_id, rows, batch_size: int = IMPORT_BATCH_SIZE, on_error=None, max_rows=None) -> dict:
+    """
+    Validates and inserts job postings for one employer from a row stream.
+
+    Valid rows are buffered up to `batch_size` and written with one
+    bulk_create per batch, each batch in its own transaction together with
+    its search and skill index entries. Only one batch is held in memory, so
+    the size of the input does not matter.
+
+    Args:
+        rows: Iterable of (row_number, dict or RowError), e.g. from iter_rows().
+        on_error: Called as on_error(row_number, {field: [messages]}) for every
+            rejected row.
+        max_rows: Stop after this many rows (the rest is reported as one error).
+
+    Returns:
+        {'rows': int, 'created': int, 'failed': int, 'truncated': bool}
+    """
+    on_error = on_error or (lambda number, errors: None)
+    summary = {'rows': 0, 'created': 0, 'failed': 0, 'truncated': False}
+    batch = []
+
+    def flush():
+        # bulk_create skips pre_save too, so resolve the batch's locations here
+        assign_locations(batch)
+        with transaction.atomic():
+            created = JobPosting.objects.bulk_create(batch)
+            # bulk_create sends no post_save, so index and match the batch here
+            index_jobs(job.id for job in created)
+            index_new_jobs_skills(created)
+            match_jobs(created)
+        summary['created'] += len(created)
+        batch.clear()
+
+    for number, row in rows:
+        if max_rows is not None and summary['rows'] >= max_rows:
+            summary['truncated'] = True
+            on_error(number, {'__all__': [f"Import stopped: at most {max_rows} rows per file."]})
+            break
+        summary['rows'] += 1
+
+        if isinstance(row, RowError):
+            errors = {'__all__': [str(row)]}
+        else:
+            cleaned, errors = validate_row(row)
+        if errors:
+            summary['failed'] += 1
+            on_error(number, errors)
+            continue
+
+        batch.append(JobPosting(employer_id=employer_id, **cleaned))
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+
+    if summary['created']:
+        invalidate_employer(employer_id)
+        cache.delete(FEED_COUNT_CACHE_KEY)
+    return summary
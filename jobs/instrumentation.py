@@ -0,0 +1,164 @@
+import logging
+import math
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.template.backends.django import DjangoTemplates, Template
+
+# --- Per-View Query/Latency Instrumentation ---
+
+logger = logging.getLogger('jobs.performance')
+
+METRICS = ('queries', 'sql_ms', 'template_ms', 'total_ms')
+ROLLING_WINDOW = 1000  # most recent requests kept per view and metric
+PUBLISH_INTERVAL = 30  # seconds between snapshots pushed to the shared cache
+SNAPSHOT_TTL = 10 * 60
+WORKERS_KEY = 'jobs:view_stats:workers'
+
+DEFAULT_BUDGET = {'queries': 25, 'ms': 500}
+
+
+class RequestMetrics:
+    """Counters for the request currently being served."""
+    __slots__ = ('queries', 'sql_seconds', 'template_seconds')
+
+    def __init__(self):
+        self.queries = 0
+        self.sql_seconds = 0.0
+        self.template_seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        # Installed as a database execute_wrapper
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_seconds += time.perf_counter() - started
+            self.queries += 1
+
+
+current_metrics = ContextVar('current_metrics', default=None)
+
+
+# --- Template Render Timing ---
+
+class TimedTemplate(Template):
+    """Adds its render time to the current request's metrics."""
+
+    def render(self, context=None, request=None):
+        metrics = current_metrics.get()
+        if metrics is None:
+            return super().render(context, request)
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            metrics.template_seconds += time.perf_counter() - started
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """The standard Django template backend, with render timing."""
+
+    def from_string(self, template_code):
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        template = super().get_template(template_name)
+        return TimedTemplate(template.template, self)
+
+
+# --- Rolling Histograms ---
+
+class ViewStats:
+    """
+    Fixed-size rolling samples per view, held in process memory.
+
+    Recording is a deque append, so it is cheap enough to leave on in
+    production. Every PUBLISH_INTERVAL seconds a snapshot is copied into the
+    shared cache so one worker can report on all of them.
+    """
+
+    def __init__(self, window=ROLLING_WINDOW):
+        self.window = window
+        self.samples = defaultdict(lambda: {metric: deque(maxlen=self.window) for metric in METRICS})
+        self.lock = threading.Lock()
+        self.last_published = time.monotonic()
+
+    def record(self, view_name, values: dict):
+        with self.lock:
+            series = self.samples[view_name]
+            for metric in METRICS:
+                series[metric].append(values[metric])
+        if time.monotonic() - self.last_published >= PUBLISH_INTERVAL:
+            self.publish()
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                view: {metric: list(values) for metric, values in series.items()}
+                for view, series in self.samples.items()
+            }
+
+    def publish(self):
+        """Stores this worker's samples in the cache for collect_view_stats()."""
+        self.last_published = time.monotonic()
+        worker_key = f'jobs:view_stats:{os.getpid()}'
+        cache.set(worker_key, self.snapshot(), SNAPSHOT_TTL)
+        workers = cache.get(WORKERS_KEY, set())
+        if worker_key not in workers:
+            cache.set(WORKERS_KEY, workers | {worker_key}, None)
+
+
+view_stats = ViewStats()
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def collect_view_stats() -> dict:
+    """
+    Merges every live worker's samples and summarises them per view.
+
+    Returns:
+        {view_name: {metric: {'count', 'p50', 'p95', 'p99'}}}
+    """
+    view_stats.publish()
+    merged = defaultdict(lambda: defaultdict(list))
+    workers = cache.get(WORKERS_KEY, set())
+    snapshots = cache.get_many(list(workers))
+    # Forget workers whose snapshot expired (restarted or stopped)
+    if set(snapshots) != workers:
+        cache.set(WORKERS_KEY, set(snapshots), None)
+    for snapshot in snapshots.values():
+        for view, series in snapshot.items():
+            for metric, values in series.items():
+                merged[view][metric].extend(values)
+
+    report = {}
+    for view, series in sorted(merged.items()):
+        report[view] = {}
+        for metric, values in series.items():
+            values.sort()
+            report[view][metric] = {
+                'count': len(values),
+                'p50': round(percentile(values, 0.50), 2),
+                'p95': round(percentile(values, 0.95), 2),
+                'p99': round(percentile(values, 0.99), 2),
+            }
+    return report
+
+
+def budget_for(view_name) -> dict:
+    """Query/latency budget for a view from settings.VIEW_BUDGETS."""
+    budgets = getattr(settings, 'VIEW_BUDGETS', {})
+    return {**DEFAULT_BUDGET, **budgets.get('default', {}), **budgets.get(view_name, {})}
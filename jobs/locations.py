@@ -0,0 +1,291 @@
+import csv
+import math
+import re
+import unicodedata
+from functools import reduce
+from operator import or_
+from pathlib import Path
+
+from django.db.models import Q
+
+from .models import JobPosting, Location, LocationAlias
+from .search import SEARCH_PAGE_SIZE
+
+# --- Gazetteer and Location Resolution ---
+#
+# Job locations are typed as free text ("Chennai", "chennai, TN",
+# "Chennai, India"). They are resolved against a small gazetteer bundled
+# with the app, so jobs in one place share one Location row with
+# coordinates, whatever the spelling.
+
+GAZETTEER_PATH = Path(__file__).resolve().parent / 'data' / 'gazetteer.csv'
+
+# Ways of naming a country that are neither its name nor its ISO code
+COUNTRY_ALIASES = {
+    'usa': 'US', 'u.s.': 'US', 'u.s.a.': 'US', 'united states of america': 'US', 'america': 'US',
+    'uk': 'GB', 'great britain': 'GB', 'britain': 'GB',
+    'uae': 'AE',
+}
+
+_PARENTHESES_RE = re.compile(r'\([^)]*\)')
+_SPACES_RE = re.compile(r'\s+')
+
+
+def normalize_place(text: str) -> str:
+    """Lowercase, accent-free, single-spaced: "  São  Paulo" -> "sao paulo"."""
+    text = unicodedata.normalize('NFKD', text or '')
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return _SPACES_RE.sub(' ', text).strip().lower()
+
+
+def read_gazetteer(path=GAZETTEER_PATH):
+    """Yields the gazetteer's rows as dicts, aliases split into a list."""
+    with open(path, newline='', encoding='utf-8') as handle:
+        for row in csv.DictReader(handle):
+            row['latitude'] = float(row['latitude'])
+            row['longitude'] = float(row['longitude'])
+            row['aliases'] = [alias for alias in row['aliases'].split('|') if alias]
+            yield row
+
+
+def load_gazetteer(path=GAZETTEER_PATH, location_model=Location, alias_model=LocationAlias) -> int:
+    """
+    Creates or updates a Location per gazetteer row, with its aliases.
+
+    The model arguments let the data migration pass its historical models.
+
+    Returns:
+        The number of rows loaded.
+    """
+    loaded = 0
+    for row in read_gazetteer(path):
+        location, _ = location_model.objects.update_or_create(
+            name=row['name'], region=row['region'], country_code=row['country_code'],
+            defaults={
+                'region_code': row['region_code'],
+                'country': row['country'],
+                'latitude': row['latitude'],
+                'longitude': row['longitude'],
+                'geohash': encode_geohash(row['latitude'], row['longitude']),
+            },
+        )
+        aliases = {normalize_place(name) for name in [row['name'], *row['aliases']]}
+        alias_model.objects.bulk_create(
+            [alias_model(alias=alias[:100], location=location) for alias in aliases], ignore_conflicts=True
+        )
+        loaded += 1
+    return loaded
+
+
+def _qualifies(location, qualifier: str) -> bool:
+    """Whether a trailing part like "TN", "India" or "USA" describes the location."""
+    names = {normalize_place(location.region), normalize_place(location.country),
+             location.region_code.lower(), location.country_code.lower()}
+    return qualifier in names or COUNTRY_ALIASES.get(qualifier) == location.country_code
+
+
+def resolve_locations(texts, alias_model=LocationAlias) -> dict:
+    """
+    Resolves free-text locations to gazetteer places, in one query.
+
+    The first comma-separated part names the place; any later parts ("TN",
+    "India") must each match its region or country. A name shared by
+    several places goes to the one listed first in the gazetteer.
+
+    Returns:
+        {text: Location or None} for every distinct text given.
+    """
+    parsed = {}
+    for text in set(texts):
+        parts = [normalize_place(part) for part in _PARENTHESES_RE.sub('', text or '').split(',')]
+        parts = [part for part in parts if part]
+        parsed[text] = (parts[0], parts[1:]) if parts else (None, [])
+
+    candidates = {}
+    heads = {head for head, _ in parsed.values() if head}
+    if heads:
+        for link in alias_model.objects.filter(alias__in=heads).select_related('location').order_by('location_id'):
+            candidates.setdefault(link.alias, []).append(link.location)
+
+    resolved = {}
+    for text, (head, qualifiers) in parsed.items():
+        matching = [
+            location for location in candidates.get(head, [])
+            if all(_qualifies(location, qualifier) for qualifier in qualifiers)
+        ]
+        resolved[text] = matching[0] if matching else None
+    return resolved
+
+
+def assign_locations(jobs):
+    """Sets canonical_location on unsaved postings, e.g. before a bulk_create."""
+    resolved = resolve_locations(job.location for job in jobs)
+    for job in jobs:
+        job.canonical_location = resolved[job.location]
+
+
+def normalize_job_locations(job_model=JobPosting, alias_model=LocationAlias) -> int:
+    """
+    Re-resolves the location of every posting, e.g. after the gazetteer changed.
+
+    One UPDATE per distinct location text, so it does not touch updated_at:
+    what seekers see is unchanged.
+
+    Returns:
+        The number of postings that have a canonical location afterwards.
+    """
+    texts = list(job_model.objects.values_list('location', flat=True).distinct())
+    resolved = resolve_locations(texts, alias_model=alias_model)
+    normalized = 0
+    for text, location in resolved.items():
+        changed = job_model.objects.filter(location=text).update(canonical_location=location)
+        if location is not None:
+            normalized += changed
+    return normalized
+
+
+# --- Geohash Grid Index ---
+#
+# A geohash interleaves longitude and latitude bits into base32, so every
+# prefix is a grid cell and places in one cell share that prefix: a cell's
+# places are one index range scan on Location.geohash.
+
+GEOHASH_PRECISION = 9  # ~5 m cells; stored values are refined enough for any radius
+_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'  # ascending, so prefix order is string order
+
+
+def encode_geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    """Geohash of a point, e.g. (57.64911, 10.40744) -> "u4pruydqq" at precision 9."""
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars = []
+    bits = value = 0
+    even = True  # longitude first
+    while len(chars) < precision:
+        ranges, coordinate = (lon_range, longitude) if even else (lat_range, latitude)
+        middle = (ranges[0] + ranges[1]) / 2
+        value <<= 1
+        if coordinate >= middle:
+            value |= 1
+            ranges[0] = middle
+        else:
+            ranges[1] = middle
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_BASE32[value])
+            bits = value = 0
+    return ''.join(chars)
+
+
+def geohash_cell_size(precision: int):
+    """(height, width) in degrees of one cell at the given precision."""
+    lat_bits = 5 * precision // 2
+    lon_bits = 5 * precision - lat_bits
+    return 180.0 / 2 ** lat_bits, 360.0 / 2 ** lon_bits
+
+
+# --- Radius Search ---
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+MAX_COVERING_CELLS = 16
+
+
+def distance_km(lat1, lon1, lat2, lon2) -> float:
+    """Great-circle (haversine) distance."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi, d_lambda = phi2 - phi1, math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_boxes(latitude: float, longitude: float, radius_km: float) -> list:
+    """
+    The (min_lat, max_lat, min_lon, max_lon) boxes enclosing the circle.
+
+    Two boxes when the circle crosses the antimeridian; the full longitude
+    range when it reaches a pole.
+    """
+    d_lat = radius_km / KM_PER_DEGREE
+    min_lat, max_lat = max(latitude - d_lat, -90.0), min(latitude + d_lat, 90.0)
+    if min_lat == -90.0 or max_lat == 90.0:
+        return [(min_lat, max_lat, -180.0, 180.0)]
+    d_lon = d_lat / max(math.cos(math.radians(max(abs(min_lat), abs(max_lat)))), 1e-9)
+    if d_lon >= 180:
+        return [(min_lat, max_lat, -180.0, 180.0)]
+    min_lon, max_lon = longitude - d_lon, longitude + d_lon
+    if min_lon < -180:
+        return [(min_lat, max_lat, min_lon + 360, 180.0), (min_lat, max_lat, -180.0, max_lon)]
+    if max_lon > 180:
+        return [(min_lat, max_lat, min_lon, 180.0), (min_lat, max_lat, -180.0, max_lon - 360)]
+    return [(min_lat, max_lat, min_lon, max_lon)]
+
+
+def _cells(boxes, precision: int, limit=None):
+    """The cells of one precision covering the boxes, or None if over `limit`."""
+    height, width = geohash_cell_size(precision)
+    cells = set()
+    for min_lat, max_lat, min_lon, max_lon in boxes:
+        rows = range(int((min_lat + 90) // height), min(int((max_lat + 90) // height), round(180 / height) - 1) + 1)
+        columns = range(int((min_lon + 180) // width), min(int((max_lon + 180) // width), round(360 / width) - 1) + 1)
+        if limit is not None and len(cells) + len(rows) * len(columns) > limit:
+            return None
+        for row in rows:
+            for column in columns:
+                cells.add(encode_geohash(-90 + (row + 0.5) * height, -180 + (column + 0.5) * width, precision))
+    return cells
+
+
+def covering_cells(boxes) -> list:
+    """
+    Geohash prefixes of the cells covering the boxes.
+
+    Uses the finest precision that needs at most MAX_COVERING_CELLS cells,
+    so a small radius reads few places and a large one a bounded number of
+    index ranges (at worst the 32 cells of precision 1).
+    """
+    for precision in range(GEOHASH_PRECISION, 1, -1):
+        cells = _cells(boxes, precision, limit=MAX_COVERING_CELLS)
+        if cells is not None:
+            return sorted(cells)
+    return sorted(_cells(boxes, 1))
+
+
+def locations_within(latitude: float, longitude: float, radius_km: float) -> list:
+    """
+    Gazetteer places within `radius_km` of a point, nearest first.
+
+    Candidates come from the geohash cells covering the circle's bounding
+    box, narrowed by the box itself, in one indexed query; only those get
+    an exact distance.
+
+    Returns:
+        A list of (Location, distance_km) pairs.
+    """
+    boxes = bounding_boxes(latitude, longitude, radius_km)
+    in_cells = reduce(or_, [Q(geohash__gte=cell, geohash__lt=cell + '~') for cell in covering_cells(boxes)])
+    in_boxes = reduce(or_, [
+        Q(latitude__range=(min_lat, max_lat), longitude__range=(min_lon, max_lon))
+        for min_lat, max_lat, min_lon, max_lon in boxes
+    ])
+    found = []
+    for location in Location.objects.filter(in_cells, in_boxes):
+        distance = distance_km(latitude, longitude, location.latitude, location.longitude)
+        if distance <= radius_km:
+            found.append((location, distance))
+    return sorted(found, key=lambda pair: pair[1])
+
+
+def nearby_jobs(location_ids, page: int = 1, page_size: int = SEARCH_PAGE_SIZE):
+    """
+    Active postings at any of the given places, newest first.
+
+    Returns:
+        A (jobs, has_next) tuple for the requested 1-based page, like search.search_jobs.
+    """
+    offset = (max(page, 1) - 1) * page_size
+    jobs = list(
+        JobPosting.objects.filter(is_active=True, canonical_location_id__in=location_ids)
+        .select_related('employer').order_by('-posted_on', '-id')[offset:offset + page_size + 1]
+    )
+    return jobs[:page_size], len(jobs) > page_size
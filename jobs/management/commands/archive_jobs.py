@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from jobs.archiving import ARCHIVE_BATCH_SIZE, archive_applications, expire_jobs
+
+
+class Command(BaseCommand):
+    help = (
+        "Closes job postings past their expiry and moves the applications of "
+        "long-closed jobs to the archive. Meant to run daily from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--expire-days', type=int, default=settings.JOB_EXPIRY_DAYS,
+                            help=f"Close postings this many days old (default: {settings.JOB_EXPIRY_DAYS}).")
+        parser.add_argument('--archive-days', type=int, default=settings.APPLICATION_ARCHIVE_DAYS,
+                            help="Archive applications of jobs closed this many days ago "
+                                 f"(default: {settings.APPLICATION_ARCHIVE_DAYS}).")
+        parser.add_argument('--batch-size', type=int, default=ARCHIVE_BATCH_SIZE,
+                            help=f"Rows changed per transaction (default: {ARCHIVE_BATCH_SIZE}).")
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        expired = expire_jobs(options['expire_days'], batch_size=batch_size)
+        self.stdout.write(f"Closed {expired} expired job posting(s).")
+        archived = archive_applications(options['archive_days'], batch_size=batch_size)
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} application(s)."))
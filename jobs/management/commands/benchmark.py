@@ -0,0 +1,62 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from jobs.benchmarks import compare_to_baseline, run_benchmarks, run_throughput
+
+
+class Command(BaseCommand):
+    help = ("Benchmarks the dashboards and apply_for_job at increasing data sizes in a throwaway "
+            "test database and prints the results as JSON.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='100,1000,5000',
+                            help="Comma-separated numbers of jobs to seed (default: 100,1000,5000).")
+        parser.add_argument('--requests', type=int, default=20, help="Requests per view and size (default: 20).")
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--throughput', action='store_true',
+                            help="Also compare requests/second of the HTML dashboard and the async API.")
+        parser.add_argument('--concurrency', type=int, default=20,
+                            help="Requests in flight for --throughput (default: 20).")
+        parser.add_argument('--output', help="Also write the JSON results to this file.")
+        parser.add_argument('--baseline', help="Fail if results regress against this earlier --output file.")
+        parser.add_argument('--tolerance', type=float, default=0.25,
+                            help="Allowed fractional growth of p95 latency and peak memory (default: 0.25).")
+
+    def handle(self, *args, **options):
+        try:
+            scales = [int(size) for size in options['sizes'].split(',')]
+        except ValueError:
+            raise CommandError("--sizes must be a comma-separated list of integers.")
+
+        baseline = None
+        if options['baseline']:
+            with open(options['baseline']) as handle:
+                baseline = json.load(handle)
+
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            results = run_benchmarks(scales, requests=options['requests'], seed=options['seed'])
+            if options['throughput']:
+                results['throughput'] = run_throughput(
+                    scale=scales[-1], requests=options['requests'] * 10,
+                    concurrency=options['concurrency'], seed=options['seed'],
+                )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        report = json.dumps(results, indent=2)
+        self.stdout.write(report)
+        if options['output']:
+            with open(options['output'], 'w') as handle:
+                handle.write(report)
+
+        if baseline is not None:
+            regressions = compare_to_baseline(results, baseline, options['tolerance'])
+            if regressions:
+                raise CommandError("Regressed against baseline:\n  " + "\n  ".join(regressions))
+            self.stdout.write(self.style.SUCCESS("No regressions against baseline."))
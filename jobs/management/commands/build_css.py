@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.cssbuild import OUTPUT_CSS, build_css
+
+
+class Command(BaseCommand):
+    help = (
+        "Builds jobs/static/jobs/css/app.css from the utility classes used in the "
+        "templates and form widgets. Run before collectstatic."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--check', action='store_true',
+                            help="Fail if the built file is missing or out of date instead of writing it.")
+
+    def handle(self, *args, **options):
+        css, unknown = build_css()
+        for name in unknown:
+            self.stderr.write(f"Unknown class (add a rule to jobs/cssbuild.py or styles/base.css): {name}")
+
+        current = OUTPUT_CSS.read_text() if OUTPUT_CSS.exists() else None
+        if options['check']:
+            if unknown or css != current:
+                raise CommandError(f"{OUTPUT_CSS} is out of date; run 'manage.py build_css'.")
+            self.stdout.write(self.style.SUCCESS(f"{OUTPUT_CSS} is up to date."))
+            return
+
+        OUTPUT_CSS.parent.mkdir(parents=True, exist_ok=True)
+        OUTPUT_CSS.write_text(css)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {OUTPUT_CSS} ({len(css.encode())} bytes)."))
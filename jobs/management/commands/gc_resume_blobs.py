@@ -0,0 +1,128 @@
+import os
+from datetime import timedelta
+
+from django.core.files import File
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from jobs.models import JobSeekerProfile, ResumeBlob
+from jobs.signals import retain_blob
+from jobs.storage import INCOMING_DIR, digest_from_name, resume_storage
+
+RESUME_DIR = 'resumes'
+
+
+class Command(BaseCommand):
+    help = (
+        "Deletes resume files that no profile references any more: released "
+        "content-addressed blobs, orphaned legacy uploads and abandoned "
+        "temporary uploads."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--min-age', type=float, default=24,
+                            help="Only delete files unreferenced for at least this many hours (default: 24).")
+        parser.add_argument('--recount', action='store_true',
+                            help="Recompute every blob's reference count from the profiles first.")
+        parser.add_argument('--adopt-legacy', action='store_true',
+                            help="Move profiles still pointing at legacy uploads onto deduplicated blobs.")
+        parser.add_argument('--dry-run', action='store_true',
+                            help="Report what would be deleted without deleting anything.")
+
+    def handle(self, *args, **options):
+        self.dry_run = options['dry_run']
+        cutoff = timezone.now() - timedelta(hours=options['min_age'])
+
+        if options['adopt_legacy'] and not self.dry_run:
+            self.adopt_legacy()
+        if options['recount'] and not self.dry_run:
+            self.recount()
+
+        freed = self.collect_released_blobs(cutoff)
+        freed += self.sweep_unreferenced_files(cutoff.timestamp())
+
+        verb = "Would free" if self.dry_run else "Freed"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {freed} byte(s)."))
+
+    def adopt_legacy(self):
+        """Re-stores legacy, randomly-named uploads under their digest."""
+        adopted = 0
+        legacy = JobSeekerProfile.objects.exclude(resume='').exclude(resume__isnull=True).only('id', 'resume')
+        for profile in legacy.iterator():
+            name = profile.resume.name
+            if digest_from_name(name) or not resume_storage.exists(name):
+                continue
+            with resume_storage.open(name) as handle:
+                profile.resume.save(os.path.basename(name), File(handle), save=False)
+            profile.save(update_fields=['resume'])
+            adopted += 1
+        self.stdout.write(f"Adopted {adopted} legacy resume(s).")
+
+    def recount(self):
+        """Rebuilds ref_count from the profiles actually pointing at each blob."""
+        counts = dict(
+            JobSeekerProfile.objects.exclude(resume='').exclude(resume__isnull=True)
+            .values('resume').annotate(n=Count('id')).values_list('resume', 'n')
+        )
+        now = timezone.now()
+        for blob in ResumeBlob.objects.iterator():
+            refs = counts.pop(blob.name, 0)
+            if blob.ref_count != refs:
+                blob.ref_count = refs
+                blob.released_on = None if refs else now
+                blob.save(update_fields=['ref_count', 'released_on'])
+        # Referenced blobs that never got a row
+        for name, refs in counts.items():
+            if digest_from_name(name):
+                retain_blob(name)
+                ResumeBlob.objects.filter(name=name).update(ref_count=refs)
+        self.stdout.write("Recounted resume references.")
+
+    def collect_released_blobs(self, cutoff):
+        freed = 0
+        released = ResumeBlob.objects.filter(ref_count__lte=0, released_on__lte=cutoff)
+        for blob in released.iterator():
+            # Uploads take the same row before deduplicating against the file,
+            # so re-check it under the lock and delete both before letting go
+            with transaction.atomic():
+                if not released.select_for_update().filter(pk=blob.pk).exists():
+                    continue  # claimed or retained since the scan
+                # Guard against a drifted counter before deleting anything
+                if JobSeekerProfile.objects.filter(resume=blob.name).exists():
+                    continue
+                freed += blob.size
+                self.stdout.write(f"Released blob: {blob.name}")
+                if not self.dry_run:
+                    ResumeBlob.objects.filter(pk=blob.pk).delete()
+                    resume_storage.delete(blob.name)
+        return freed
+
+    def sweep_unreferenced_files(self, cutoff_timestamp):
+        """Deletes old files under resumes/ that neither a profile nor a blob row knows."""
+        root = resume_storage.path(RESUME_DIR)
+        if not os.path.isdir(root):
+            return 0
+        referenced = set(
+            JobSeekerProfile.objects.exclude(resume='').exclude(resume__isnull=True)
+            .values_list('resume', flat=True).iterator()
+        )
+        tracked = set(ResumeBlob.objects.values_list('name', flat=True).iterator())
+
+        freed = 0
+        for directory, _, filenames in os.walk(root):
+            for filename in filenames:
+                path = os.path.join(directory, filename)
+                name = os.path.relpath(path, resume_storage.location).replace(os.sep, '/')
+                stat = os.stat(path)
+                if name in referenced or stat.st_mtime > cutoff_timestamp:
+                    continue
+                # Abandoned temporary uploads are always garbage
+                if name in tracked and INCOMING_DIR not in name.split('/'):
+                    continue
+                freed += stat.st_size
+                self.stdout.write(f"Unreferenced file: {name}")
+                if not self.dry_run:
+                    os.remove(path)
+        return freed
@@ -0,0 +1,59 @@
+import csv
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.importing import IMPORT_BATCH_SIZE, IMPORT_FORMATS, detect_format, import_jobs, iter_rows
+from jobs.models import EmployerProfile
+
+
+class Command(BaseCommand):
+    help = ("Streams job postings for one employer from a CSV or JSONL file "
+            "(columns/keys: title, description, location, skills).")
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="File to import; '-' reads standard input.")
+        parser.add_argument('--employer', required=True, help="Employer username or profile id.")
+        parser.add_argument('--format', choices=IMPORT_FORMATS,
+                            help="File format (default: from the file extension).")
+        parser.add_argument('--batch-size', type=int, default=IMPORT_BATCH_SIZE,
+                            help=f"Rows per bulk INSERT and transaction (default: {IMPORT_BATCH_SIZE}).")
+        parser.add_argument('--errors', help="Write rejected rows to this CSV report instead of standard error.")
+
+    def handle(self, *args, **options):
+        employer = options['employer']
+        lookup = {'pk': int(employer)} if employer.isdigit() else {'user__username': employer}
+        employer_id = EmployerProfile.objects.filter(**lookup).values_list('id', flat=True).first()
+        if employer_id is None:
+            raise CommandError(f"No employer '{employer}'.")
+
+        path = options['path']
+        try:
+            file_format = options['format'] or detect_format(path)
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        report_file = open(options['errors'], 'w', newline='') if options['errors'] else self.stderr
+        report = csv.writer(report_file)
+        report.writerow(['row', 'field', 'message'])
+
+        def on_error(number, errors):
+            for field, messages in errors.items():
+                for message in messages:
+                    report.writerow([number, field, message])
+
+        source = sys.stdin.buffer if path == '-' else open(path, 'rb')
+        try:
+            summary = import_jobs(
+                employer_id, iter_rows(source, file_format),
+                batch_size=max(1, options['batch_size']), on_error=on_error,
+            )
+        finally:
+            if source is not sys.stdin.buffer:
+                source.close()
+            if options['errors']:
+                report_file.close()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Read {summary['rows']} row(s): {summary['created']} job(s) created, {summary['failed']} rejected."
+        ))
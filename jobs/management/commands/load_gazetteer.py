@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from jobs.locations import GAZETTEER_PATH, load_gazetteer, normalize_job_locations
+
+
+class Command(BaseCommand):
+    help = (
+        "Loads the place gazetteer (new and changed rows) and re-resolves the "
+        "location of every job posting against it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default=str(GAZETTEER_PATH),
+                            help="Gazetteer CSV to load (default: the bundled jobs/data/gazetteer.csv).")
+
+    def handle(self, *args, **options):
+        loaded = load_gazetteer(options['path'])
+        self.stdout.write(f"Loaded {loaded} place(s).")
+        normalized = normalize_job_locations()
+        self.stdout.write(self.style.SUCCESS(f"{normalized} job posting(s) have a known location."))
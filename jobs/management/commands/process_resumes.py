@@ -0,0 +1,71 @@
+import os
+import time
+from multiprocessing import Pool
+
+from django.core.management.base import BaseCommand
+
+from jobs.extraction import (
+    DEFAULT_TIMEOUT, claim_batch, enqueue_backfill, process_batch, release_stale_claims,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Extracts plain text from queued resumes on a bounded process pool. "
+        "Runs as a daemon unless --once is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=min(os.cpu_count() or 1, 4),
+                            help="Number of extraction processes (default: CPU count, at most 4).")
+        parser.add_argument('--batch-size', type=int, default=20,
+                            help="Resumes claimed from the queue per batch.")
+        parser.add_argument('--timeout', type=int, default=DEFAULT_TIMEOUT,
+                            help="Seconds allowed per file before it is marked as failed.")
+        parser.add_argument('--poll-interval', type=float, default=5.0,
+                            help="Seconds to sleep when the queue is empty.")
+        parser.add_argument('--backfill', action='store_true',
+                            help="Queue every stored resume without extracted text first.")
+        parser.add_argument('--once', action='store_true',
+                            help="Exit once the queue is empty instead of polling.")
+
+    def handle(self, *args, **options):
+        # Assumes a single daemon: anything still PROCESSING was orphaned
+        released = release_stale_claims()
+        if released:
+            self.stdout.write(f"Requeued {released} interrupted extraction(s).")
+
+        if options['backfill']:
+            queued = enqueue_backfill()
+            self.stdout.write(f"Queued {queued} existing resume(s) for extraction.")
+
+        total_done = total_failed = 0
+        pool = self._new_pool(options['workers'])
+        try:
+            while True:
+                records = claim_batch(options['batch_size'])
+                if not records:
+                    if options['once']:
+                        break
+                    time.sleep(options['poll_interval'])
+                    continue
+
+                done, failed, pool_healthy = process_batch(pool, records, options['timeout'])
+                total_done += done
+                total_failed += failed
+                self.stdout.write(f"Extracted {done} resume(s), {failed} failed.")
+
+                if not pool_healthy:
+                    # Kill the stuck worker rather than wait on it forever
+                    pool.terminate()
+                    pool = self._new_pool(options['workers'])
+        finally:
+            pool.terminate()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Finished: {total_done} extracted, {total_failed} failed."
+        ))
+
+    def _new_pool(self, workers):
+        # Recycle workers periodically so leaks in parsers cannot accumulate
+        return Pool(processes=max(workers, 1), maxtasksperchild=100)
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from jobs.search import fts_enabled, rebuild_index
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the full-text job search index from the JobPosting table."
+
+    def handle(self, *args, **options):
+        if not fts_enabled():
+            self.stdout.write(self.style.WARNING(
+                "Full-text index is only used on SQLite; nothing to rebuild."
+            ))
+            return
+        count = rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {count} active job(s)."))
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from jobs.matching import index_job_skills, index_seeker_skills
+from jobs.models import JobPosting, JobSeekerProfile
+
+
+class Command(BaseCommand):
+    help = "Re-synchronises the skill index for every job posting and seeker profile."
+
+    def handle(self, *args, **options):
+        jobs = 0
+        for job in JobPosting.objects.only('id', 'skills').iterator():
+            index_job_skills(job)
+            jobs += 1
+
+        seekers = 0
+        for seeker in JobSeekerProfile.objects.only('id', 'skills').iterator():
+            index_seeker_skills(seeker)
+            seekers += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Indexed skills for {jobs} job(s) and {seekers} seeker(s)."))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from jobs.counters import reconcile_counts
+
+
+class Command(BaseCommand):
+    help = "Recomputes the per-job application counters from the Application and archive tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help="Jobs updated per transaction (default: 1000).")
+
+    def handle(self, *args, **options):
+        processed = reconcile_counts(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Reconciled counters for {processed} job(s)."))
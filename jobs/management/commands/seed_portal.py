@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from jobs.seeding import flush_seeded, seed_portal
+
+
+class Command(BaseCommand):
+    help = "Creates reproducible synthetic employers, jobs, seekers, applications and interviews."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--employers', type=int, default=10)
+        parser.add_argument('--jobs', type=int, default=200)
+        parser.add_argument('--seekers', type=int, default=500)
+        parser.add_argument('--applications', type=int, default=2000)
+        parser.add_argument('--interview-ratio', type=float, default=0.5,
+                            help="Share of INTERVIEW applications given an Interview (default: 0.5).")
+        parser.add_argument('--seed', type=int, default=0, help="Random seed; the same seed gives the same data.")
+        parser.add_argument('--batch-size', type=int, default=500, help="Rows per bulk INSERT (default: 500).")
+        parser.add_argument('--flush', action='store_true', help="Delete previously seeded data first.")
+
+    def handle(self, *args, **options):
+        if options['flush']:
+            deleted = flush_seeded()
+            self.stdout.write(f"Deleted {deleted} previously seeded row(s).")
+        created = seed_portal(
+            employers=max(1, options['employers']),
+            jobs=options['jobs'],
+            seekers=options['seekers'],
+            applications=options['applications'],
+            interview_ratio=options['interview_ratio'],
+            seed=options['seed'],
+            batch_size=options['batch_size'],
+        )
+        summary = ', '.join(f"{count} {name}" for name, count in created.items())
+        self.stdout.write(self.style.SUCCESS(f"Seeded {summary}."))
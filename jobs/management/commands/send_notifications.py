@@ -0,0 +1,50 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from jobs.notifications import MAX_ATTEMPTS, claim_batch, deliver_batch, release_stale_claims
+
+
+class Command(BaseCommand):
+    help = (
+        "Emails queued application status changes, coalescing events per candidate. "
+        "Runs as a daemon unless --once is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=200,
+                            help="Outbox events claimed per batch (default: 200).")
+        parser.add_argument('--max-attempts', type=int, default=MAX_ATTEMPTS,
+                            help=f"Send attempts before an event is marked failed (default: {MAX_ATTEMPTS}).")
+        parser.add_argument('--poll-interval', type=float, default=5.0,
+                            help="Seconds to sleep when nothing is due.")
+        parser.add_argument('--once', action='store_true',
+                            help="Exit once nothing is due instead of polling.")
+
+    def handle(self, *args, **options):
+        # Assumes a single daemon: anything still PROCESSING was orphaned
+        released = release_stale_claims()
+        if released:
+            self.stdout.write(f"Requeued {released} interrupted notification(s).")
+
+        totals = {'sent': 0, 'events': 0, 'retried': 0, 'failed': 0}
+        while True:
+            event_ids = claim_batch(max(1, options['batch_size']))
+            if not event_ids:
+                if options['once']:
+                    break
+                time.sleep(options['poll_interval'])
+                continue
+
+            summary = deliver_batch(event_ids, max_attempts=options['max_attempts'])
+            for key, value in summary.items():
+                totals[key] += value
+            self.stdout.write(
+                f"Sent {summary['sent']} email(s) for {summary['events']} event(s); "
+                f"{summary['retried']} to retry, {summary['failed']} failed."
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Finished: {totals['sent']} email(s) sent, {totals['retried']} event(s) to retry, "
+            f"{totals['failed']} failed."
+        ))
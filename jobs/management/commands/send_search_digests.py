@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from jobs.alerts import DIGEST_BATCH_SIZE, send_digests
+
+
+class Command(BaseCommand):
+    help = (
+        "Emails each seeker one digest of the new jobs that matched their saved "
+        "searches since the last digest. Meant to run periodically from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=DIGEST_BATCH_SIZE,
+                            help=f"Seekers handled per batch (default: {DIGEST_BATCH_SIZE}).")
+
+    def handle(self, *args, **options):
+        summary = send_digests(batch_size=max(1, options['batch_size']))
+        self.stdout.write(self.style.SUCCESS(
+            f"Sent {summary['sent']} digest(s) covering {summary['matches']} match(es); "
+            f"{summary['failed']} failed and will be retried next run."
+        ))
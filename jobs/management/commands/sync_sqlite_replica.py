@@ -0,0 +1,36 @@
+import sqlite3
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from JobPortal.database import SQLITE_ENGINE
+
+
+class Command(BaseCommand):
+    help = ("Copies the SQLite primary into every SQLite replica, standing in for replication "
+            "when trying DATABASE_REPLICA_URLS locally.")
+
+    def handle(self, *args, **options):
+        primary = settings.DATABASES['default']
+        replicas = getattr(settings, 'DATABASE_REPLICAS', [])
+        if primary['ENGINE'] != SQLITE_ENGINE:
+            raise CommandError("Only SQLite primaries can be copied; use the database's own replication.")
+        if not replicas:
+            raise CommandError("No replicas configured; set DATABASE_REPLICA_URLS.")
+
+        source = sqlite3.connect(primary['NAME'])
+        try:
+            for alias in replicas:
+                replica = settings.DATABASES[alias]
+                if replica['ENGINE'] != SQLITE_ENGINE:
+                    raise CommandError(f"Replica '{alias}' is not SQLite.")
+                # The online backup API copies a consistent snapshot even
+                # while the primary is being written to
+                target = sqlite3.connect(replica['NAME'])
+                try:
+                    source.backup(target)
+                finally:
+                    target.close()
+                self.stdout.write(f"Copied primary to {alias} ({replica['NAME']}).")
+        finally:
+            source.close()
@@ -0,0 +1,32 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from jobs.instrumentation import METRICS, collect_view_stats
+
+
+class Command(BaseCommand):
+    help = ("Prints p50/p95/p99 query count and latency per view, merged from every worker's "
+            "published samples (needs a shared CACHE_BACKEND to see other processes).")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--json', action='store_true', help="Print the raw report as JSON.")
+
+    def handle(self, *args, **options):
+        report = collect_view_stats()
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+        if not report:
+            self.stdout.write("No samples recorded yet.")
+            return
+
+        header = f"{'view':<32} {'metric':<12} {'count':>6} {'p50':>9} {'p95':>9} {'p99':>9}"
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+        for view, series in report.items():
+            for metric in METRICS:
+                row = series[metric]
+                self.stdout.write(
+                    f"{view:<32} {metric:<12} {row['count']:>6} {row['p50']:>9} {row['p95']:>9} {row['p99']:>9}"
+                )
@@ -0,0 +1,248 @@
+import re
+
+import numpy as np
+from django.db.models import Count, OuterRef, Subquery
+
+from .models import Skill, JobSkill, SeekerSkill, JobPosting, Application, ResumeText
+
+# --- Skill Normalisation ---
+
+# Common spellings mapped onto one canonical token
+SKILL_ALIASES = {
+    'js': 'javascript',
+    'ts': 'typescript',
+    'reactjs': 'react',
+    'react.js': 'react',
+    'node.js': 'node',
+    'nodejs': 'node',
+    'golang': 'go',
+    'postgres': 'postgresql',
+    'py': 'python',
+    'ml': 'machine learning',
+    'amazon web services': 'aws',
+    'k8s': 'kubernetes',
+}
+
+_SEPARATOR_RE = re.compile(r'[,;/|\n]+')
+_WORD_RE = re.compile(r'[\w.+#]+')
+_LOOKUP_CHUNK = 500  # names per IN (...) lookup, well under SQLite's parameter limit
+
+
+def normalize_skills(text: str) -> list:
+    """
+    Splits a free-text skill list into canonical, de-duplicated tokens.
+
+    Example:
+        "Python, SQL ,  ReactJS; py" -> ['python', 'sql', 'react']
+    """
+    tokens = []
+    for raw in _SEPARATOR_RE.split(text or ''):
+        token = ' '.join(raw.lower().split())
+        token = SKILL_ALIASES.get(token, token)[:100]
+        if token and token not in tokens:
+            tokens.append(token)
+    return tokens
+
+
+def skills_in_text(text: str) -> list:
+    """
+    Finds already-known skills mentioned anywhere in free text (e.g. a resume).
+
+    Only names present in the Skill vocabulary are returned, so arbitrary
+    resume words never create new skills. Phrases of up to three words are
+    considered, which covers names like "machine learning".
+    """
+    words = [word.strip('.') for word in _WORD_RE.findall((text or '').lower())]
+    words = [SKILL_ALIASES.get(word, word) for word in words if word]
+    terms = set(words)
+    for size in (2, 3):
+        terms.update(' '.join(words[i:i + size]) for i in range(len(words) - size + 1))
+
+    terms = sorted(terms)
+    found = []
+    for start in range(0, len(terms), _LOOKUP_CHUNK):
+        found.extend(Skill.objects.filter(name__in=terms[start:start + _LOOKUP_CHUNK]).values_list('name', flat=True))
+    return found
+
+
+# --- Incremental Index Maintenance ---
+
+def _skill_id_map(names) -> dict:
+    """Returns {name: Skill id} for the given names, creating any that are new."""
+    names = list(names)
+    if not names:
+        return {}
+    existing = dict(Skill.objects.filter(name__in=names).values_list('name', 'id'))
+    missing = [name for name in names if name not in existing]
+    if missing:
+        Skill.objects.bulk_create([Skill(name=name) for name in missing], ignore_conflicts=True)
+        existing.update(Skill.objects.filter(name__in=missing).values_list('name', 'id'))
+    return existing
+
+
+def _skill_ids(names: list) -> set:
+    """Returns Skill ids for the given names, creating any that are new."""
+    return set(_skill_id_map(names).values())
+
+
+def _sync_links(link_model, owner_field: str, owner_id: int, names: list):
+    """Applies only the difference between stored and current skill links."""
+    wanted = _skill_ids(names)
+    current = set(link_model.objects.filter(**{owner_field: owner_id}).values_list('skill_id', flat=True))
+
+    removed = current - wanted
+    if removed:
+        link_model.objects.filter(**{owner_field: owner_id, 'skill_id__in': removed}).delete()
+    added = wanted - current
+    if added:
+        link_model.objects.bulk_create(
+            [link_model(**{owner_field: owner_id, 'skill_id': skill_id}) for skill_id in added],
+            ignore_conflicts=True,
+        )
+
+
+def index_job_skills(job):
+    """Updates the skill -> postings index for one job."""
+    _sync_links(JobSkill, 'job_id', job.id, normalize_skills(job.skills))
+
+
+def index_new_jobs_skills(jobs):
+    """
+    Links a batch of newly inserted jobs to their skills.
+
+    For bulk_create callers: the jobs have no links yet, so this is one
+    skill lookup and one bulk INSERT for the whole batch.
+    """
+    names_by_job = {job.id: normalize_skills(job.skills) for job in jobs}
+    skill_ids = _skill_id_map({name for names in names_by_job.values() for name in names})
+    JobSkill.objects.bulk_create(
+        [JobSkill(job_id=job_id, skill_id=skill_ids[name]) for job_id, names in names_by_job.items() for name in names],
+        ignore_conflicts=True,
+    )
+
+
+def index_seeker_skills(seeker):
+    """
+    Updates the skill -> seekers index for one seeker profile.
+
+    Skills typed on the profile are combined with known skills found in the
+    extracted resume text, when the background worker has produced it.
+    """
+    names = normalize_skills(seeker.skills)
+    resume_text = ResumeText.objects.filter(profile_id=seeker.id, status='DONE').values_list('text', flat=True).first()
+    if resume_text:
+        names += [name for name in skills_in_text(resume_text) if name not in names]
+    _sync_links(SeekerSkill, 'seeker_id', seeker.id, names)
+
+
+# --- Vectorised Scoring ---
+
+def _rarity_weights(skill_ids):
+    """
+    Weights each skill occurrence by how rare the skill is in the batch.
+
+    A shared niche skill says more about a match than a shared "sql", so
+    weights fall off with document frequency: 1 / log2(1 + df).
+
+    Returns:
+        An array aligned with skill_ids.
+    """
+    _, inverse, df = np.unique(skill_ids, return_inverse=True, return_counts=True)
+    return (1.0 / np.log2(1.0 + df))[inverse]
+
+
+def recommend_jobs(seeker, limit: int = 5):
+    """
+    Ranks active jobs the seeker has not applied to by skill overlap.
+
+    Only postings sharing at least one skill are touched (via the inverted
+    index), and all candidates are scored in one NumPy pass. The score is an
+    IDF-weighted cosine similarity between the two skill sets, in [0, 1].
+
+    Returns:
+        A list of (job, score) tuples, best match first.
+    """
+    seeker_skill_ids = list(SeekerSkill.objects.filter(seeker=seeker).values_list('skill_id', flat=True))
+    if not seeker_skill_ids:
+        return []
+
+    candidate_links = JobSkill.objects.filter(
+        skill_id__in=seeker_skill_ids, job__is_active=True
+    ).exclude(
+        job_id__in=Application.objects.filter(seeker=seeker).values('job_id')
+    )
+    # Each link carries its job's skill count, so sizes need no second query
+    job_size = JobSkill.objects.filter(job_id=OuterRef('job_id')).order_by().values('job_id').annotate(n=Count('id')).values('n')
+    rows = np.array(list(candidate_links.values_list('job_id', 'skill_id', Subquery(job_size))), dtype=np.int64)
+    if not len(rows):
+        return []
+
+    job_ids, first, job_index = np.unique(rows[:, 0], return_index=True, return_inverse=True)
+    overlap = np.bincount(job_index, weights=_rarity_weights(rows[:, 1]))
+
+    sizes = rows[first, 2].astype(np.float64)
+    scores = overlap / np.sqrt(sizes * len(seeker_skill_ids))
+
+    limit = min(limit, len(scores))
+    top = np.argpartition(-scores, limit - 1)[:limit]
+    top = top[np.argsort(-scores[top], kind='stable')]
+
+    top_ids = job_ids[top].tolist()
+    jobs_by_id = JobPosting.objects.select_related('employer').in_bulk(top_ids)
+    return [
+        (jobs_by_id[job_id], float(score))
+        for job_id, score in zip(top_ids, scores[top].tolist())
+        if job_id in jobs_by_id
+    ]
+
+
+def score_applicants(employer) -> dict:
+    """
+    Scores every application to the employer's jobs in a single batch.
+
+    Each application is expanded into its seeker's skills, and a vectorised
+    membership test against the (job, skill) pairs of the employer's jobs
+    finds the overlap, so the cost does not depend on per-applicant queries.
+
+    Returns:
+        A dict mapping application id -> score in [0, 1].
+    """
+    apps = np.array(list(
+        Application.objects.filter(job__employer=employer).values_list('id', 'job_id', 'seeker_id')
+    ), dtype=np.int64).reshape(-1, 3)
+    job_pairs = np.array(list(
+        JobSkill.objects.filter(job__employer=employer).values_list('job_id', 'skill_id')
+    ), dtype=np.int64).reshape(-1, 2)
+    if not len(apps) or not len(job_pairs):
+        return {}
+    seeker_pairs = np.array(list(
+        SeekerSkill.objects.filter(
+            seeker_id__in=Application.objects.filter(job__employer=employer).values('seeker_id')
+        ).order_by('seeker_id').values_list('seeker_id', 'skill_id')
+    ), dtype=np.int64).reshape(-1, 2)
+    if not len(seeker_pairs):
+        return {}
+
+    # Locate each applicant's run of skills in the seeker-sorted pairs
+    lo = np.searchsorted(seeker_pairs[:, 0], apps[:, 2], side='left')
+    hi = np.searchsorted(seeker_pairs[:, 0], apps[:, 2], side='right')
+    seeker_sizes = hi - lo
+
+    # Expand to one row per (application, seeker skill)
+    app_rows = np.repeat(np.arange(len(apps)), seeker_sizes)
+    offsets = np.arange(len(app_rows)) - np.repeat(np.cumsum(seeker_sizes) - seeker_sizes, seeker_sizes)
+    skills = seeker_pairs[np.repeat(lo, seeker_sizes) + offsets, 1]
+
+    # A row matches when its (job, skill) key is one of the job's own skills
+    width = int(max(skills.max(initial=0), job_pairs[:, 1].max())) + 1
+    matched = np.isin(apps[app_rows, 1] * width + skills, job_pairs[:, 0] * width + job_pairs[:, 1])
+    weights = _rarity_weights(skills)
+    overlap = np.bincount(app_rows[matched], weights=weights[matched], minlength=len(apps))
+
+    job_ids, job_sizes = np.unique(job_pairs[:, 0], return_counts=True)
+    position = np.searchsorted(job_ids, apps[:, 1]).clip(max=len(job_ids) - 1)
+    app_job_sizes = np.where(job_ids[position] == apps[:, 1], job_sizes[position], 0)
+
+    denominator = np.sqrt(app_job_sizes * seeker_sizes)
+    scores = np.divide(overlap, denominator, out=np.zeros(len(apps)), where=denominator > 0)
+    return dict(zip(apps[:, 0].tolist(), scores.tolist()))
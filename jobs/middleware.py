@@ -0,0 +1,209 @@
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from .instrumentation import RequestMetrics, budget_for, current_metrics, logger, view_stats
+from .routers import replica_reads, wrote_primary
+from .utils import attach_role
+
+# Every middleware here handles both sync (gunicorn/WSGI) and async
+# (uvicorn/ASGI) requests. A single sync-only middleware would make Django
+# run the async API views through async_to_sync, one thread per request.
+
+# --- Request-Scoped Role Resolution ---
+
+class RoleMiddleware:
+    """
+    Resolves the user's role and profile once per request.
+
+    Exposes request.role ('employer', 'employee' or None), request.profile_id
+    and a lazily loaded request.profile to the decorators and views. Must come
+    after AuthenticationMiddleware.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        attach_role(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        # Session, cache and ORM access are sync; one thread hop covers them all
+        await sync_to_async(attach_role)(request)
+        return await self.get_response(request)
+
+
+# --- Per-View Query/Latency Instrumentation ---
+
+class ViewMetricsMiddleware:
+    """
+    Records query count, SQL time, template time and total time per view.
+
+    Samples are keyed by URL name and kept in rolling windows (see
+    jobs.instrumentation); requests over their settings.VIEW_BUDGETS budget
+    are logged to the 'jobs.performance' logger. Goes first in MIDDLEWARE so
+    the queries made by the other middleware are counted too.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        started = time.perf_counter()
+        try:
+            with self._wrap_connections(metrics):
+                response = self.get_response(request)
+        finally:
+            current_metrics.reset(token)
+        self._record(request, metrics, started)
+        return response
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        started = time.perf_counter()
+        # Async ORM calls run in the request's sync thread, so the wrappers
+        # must be installed on that thread's connections
+        wrappers = await sync_to_async(self._wrap_connections)(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(wrappers.close)()
+            current_metrics.reset(token)
+        self._record(request, metrics, started)
+        return response
+
+    @staticmethod
+    def _wrap_connections(metrics) -> ExitStack:
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(metrics))
+        return stack
+
+    @staticmethod
+    def _record(request, metrics, started):
+        match = getattr(request, 'resolver_match', None)
+        if match is None:
+            return
+        view_name = match.view_name or match._func_path
+        values = {
+            'queries': metrics.queries,
+            'sql_ms': metrics.sql_seconds * 1000,
+            'template_ms': metrics.template_seconds * 1000,
+            'total_ms': (time.perf_counter() - started) * 1000,
+        }
+        view_stats.record(view_name, values)
+
+        budget = budget_for(view_name)
+        if values['queries'] > budget['queries'] or values['total_ms'] > budget['ms']:
+            logger.warning(
+                'Budget exceeded by %s (%s %s): %d queries (budget %d), %.1f ms (budget %d), '
+                'sql %.1f ms, template %.1f ms',
+                view_name, request.method, request.path, values['queries'], budget['queries'],
+                values['total_ms'], budget['ms'], values['sql_ms'], values['template_ms'],
+            )
+
+
+# --- Read Replica Routing ---
+
+PIN_COOKIE = 'jobs_primary'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Decides per request whether jobs.routers.PrimaryReplicaRouter may read
+    from a replica.
+
+    Safe requests read from replicas unless the client wrote something in
+    the last settings.REPLICA_PIN_SECONDS, which is remembered in a short
+    cookie. That gives read-your-writes across the usual POST -> redirect ->
+    GET dashboard round trip while replication catches up.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        tokens = self._start(request)
+        try:
+            response = self.get_response(request)
+            return self._finish(response)
+        finally:
+            self._reset(tokens)
+
+    async def __acall__(self, request):
+        tokens = self._start(request)
+        try:
+            response = await self.get_response(request)
+            return self._finish(response)
+        finally:
+            self._reset(tokens)
+
+    @staticmethod
+    def _start(request):
+        allowed = request.method in SAFE_METHODS and PIN_COOKIE not in request.COOKIES
+        return replica_reads.set(allowed), wrote_primary.set(False)
+
+    @staticmethod
+    def _finish(response):
+        if wrote_primary.get():
+            response.set_cookie(PIN_COOKIE, '1', max_age=settings.REPLICA_PIN_SECONDS, httponly=True, samesite='Lax')
+        return response
+
+    @staticmethod
+    def _reset(tokens):
+        replica_reads.reset(tokens[0])
+        wrote_primary.reset(tokens[1])
+
+
+# --- Static Files ---
+
+class AsyncWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """WhiteNoiseMiddleware that also runs natively under ASGI."""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, settings=settings):
+        super().__init__(get_response, settings)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
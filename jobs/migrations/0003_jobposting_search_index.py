@@ -0,0 +1,34 @@
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS jobs_jobposting_fts USING fts5("
+        "title, description, location, company_name, "
+        "tokenize = 'porter unicode61 remove_diacritics 2')"
+    )
+    schema_editor.execute(
+        "INSERT INTO jobs_jobposting_fts (rowid, title, description, location, company_name) "
+        "SELECT j.id, j.title, j.description, j.location, e.company_name "
+        "FROM jobs_jobposting j JOIN jobs_employerprofile e ON e.id = j.employer_id "
+        "WHERE j.is_active"
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute("DROP TABLE IF EXISTS jobs_jobposting_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0002_alter_jobseekerprofile_resume_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0003_jobposting_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='skills',
+            field=models.CharField(blank=True, default='', help_text='e.g., Python, SQL, AWS. Used to recommend this job to matching seekers.', max_length=255),
+        ),
+        migrations.CreateModel(
+            name='SeekerSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('seeker', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_links', to='jobs.jobseekerprofile')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='seeker_links', to='jobs.skill')),
+            ],
+            options={
+                'unique_together': {('seeker', 'skill')},
+            },
+        ),
+        migrations.CreateModel(
+            name='JobSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_links', to='jobs.jobposting')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_links', to='jobs.skill')),
+            ],
+            options={
+                'unique_together': {('job', 'skill')},
+            },
+        ),
+    ]
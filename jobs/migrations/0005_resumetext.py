@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:10
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_skill_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeText',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('PROCESSING', 'Processing'), ('DONE', 'Done'), ('FAILED', 'Failed')], db_index=True, default='PENDING', max_length=20)),
+                ('source_name', models.CharField(blank=True, default='', max_length=255)),
+                ('text', models.TextField(blank=True, default='')),
+                ('queued_on', models.DateTimeField(default=django.utils.timezone.now)),
+                ('extracted_on', models.DateTimeField(blank=True, null=True)),
+                ('extraction_seconds', models.FloatField(blank=True, null=True)),
+                ('error', models.TextField(blank=True, default='')),
+                ('profile', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='resume_text', to='jobs.jobseekerprofile')),
+            ],
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:12
+
+import django.core.validators
+import jobs.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0005_resumetext'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('size', models.PositiveBigIntegerField(default=0)),
+                ('ref_count', models.IntegerField(default=0)),
+                ('created_on', models.DateTimeField(auto_now_add=True)),
+                ('released_on', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='jobseekerprofile',
+            name='resume',
+            field=models.FileField(blank=True, null=True, storage=jobs.storage.ContentAddressedStorage(), upload_to='resumes/', validators=[django.core.validators.FileExtensionValidator(allowed_extensions=['pdf', 'docx'])]),
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:14
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_counters(apps, schema_editor):
+    JobPosting = apps.get_model('jobs', 'JobPosting')
+    Application = apps.get_model('jobs', 'Application')
+
+    def count(status=None):
+        applications = Application.objects.filter(job=OuterRef('pk'))
+        if status is not None:
+            applications = applications.filter(status=status)
+        return Coalesce(Subquery(applications.order_by().values('job').annotate(n=Count('id')).values('n')), 0)
+
+    JobPosting.objects.update(
+        application_count=count(),
+        applied_count=count('APPLIED'),
+        shortlisted_count=count('SHORTLISTED'),
+        interview_count=count('INTERVIEW'),
+        rejected_count=count('REJECTED'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0006_resume_blob_storage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobposting',
+            name='application_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='applied_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='interview_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='rejected_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='shortlisted_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
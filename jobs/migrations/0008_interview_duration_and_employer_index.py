@@ -0,0 +1,45 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:17
+
+import django.core.validators
+import django.db.models.deletion
+from datetime import timedelta
+
+from django.db import migrations, models
+
+
+def populate_interview_window(apps, schema_editor):
+    Interview = apps.get_model('jobs', 'Interview')
+    for interview in Interview.objects.select_related('application__job').iterator():
+        interview.employer_id = interview.application.job.employer_id
+        interview.ends_at = interview.scheduled_time + timedelta(minutes=interview.duration_minutes)
+        interview.save(update_fields=['employer', 'ends_at'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0007_jobposting_application_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interview',
+            name='duration_minutes',
+            field=models.PositiveIntegerField(default=30, validators=[django.core.validators.MinValueValidator(5), django.core.validators.MaxValueValidator(480)]),
+        ),
+        migrations.AddField(
+            model_name='interview',
+            name='employer',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='interviews', to='jobs.employerprofile'),
+        ),
+        migrations.AddField(
+            model_name='interview',
+            name='ends_at',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='interview',
+            index=models.Index(fields=['employer', 'scheduled_time'], name='interview_employer_time_idx'),
+        ),
+        migrations.RunPython(populate_interview_window, migrations.RunPython.noop),
+    ]
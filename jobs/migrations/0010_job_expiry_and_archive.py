@@ -0,0 +1,50 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:34
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def stamp_closed_jobs(apps, schema_editor):
+    # Jobs already closed start their archive clock now
+    JobPosting = apps.get_model('jobs', 'JobPosting')
+    JobPosting.objects.filter(is_active=False).update(closed_on=django.utils.timezone.now())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0009_notification_outbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobposting',
+            name='archived_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='closed_on',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.CreateModel(
+            name='ArchivedApplication',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('applied_on', models.DateTimeField()),
+                ('status', models.CharField(choices=[('APPLIED', 'Applied'), ('SHORTLISTED', 'Shortlisted'), ('INTERVIEW', 'Interview Scheduled'), ('REJECTED', 'Rejected')], max_length=20)),
+                ('archived_on', models.DateTimeField(default=django.utils.timezone.now)),
+                ('interview_time', models.DateTimeField(blank=True, null=True)),
+                ('interview_duration_minutes', models.PositiveIntegerField(blank=True, null=True)),
+                ('interview_location_link', models.URLField(blank=True, max_length=255, null=True)),
+                ('interview_notes', models.TextField(blank=True, null=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_applications', to='jobs.jobposting')),
+                ('seeker', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_applications', to='jobs.jobseekerprofile')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['seeker', '-applied_on'], name='archived_app_seeker_idx')],
+            },
+        ),
+        migrations.RunPython(stamp_closed_jobs, migrations.RunPython.noop),
+    ]
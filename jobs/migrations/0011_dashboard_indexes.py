@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0010_job_expiry_and_archive'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['seeker', '-applied_on', '-id'], name='application_seeker_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-posted_on', '-id'], name='jobposting_active_feed_idx'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:47
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0012_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SavedSearch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('keywords', models.CharField(blank=True, default='', help_text='Words that must all appear in the posting.', max_length=200)),
+                ('location', models.CharField(blank=True, default='', max_length=100)),
+                ('skills', models.CharField(blank=True, default='', help_text='e.g., Python, SQL. All must be listed on the posting.', max_length=255)),
+                ('key_term', models.CharField(db_index=True, editable=False, max_length=110)),
+                ('created_on', models.DateTimeField(auto_now_add=True)),
+                ('seeker', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='saved_searches', to='jobs.jobseekerprofile')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='SavedSearchMatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('matched_on', models.DateTimeField(default=django.utils.timezone.now)),
+                ('digested_on', models.DateTimeField(blank=True, null=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_matches', to='jobs.jobposting')),
+                ('search', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='matches', to='jobs.savedsearch')),
+                ('seeker', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_matches', to='jobs.jobseekerprofile')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['seeker', '-matched_on', '-id'], name='search_match_inbox_idx'), models.Index(condition=models.Q(('digested_on__isnull', True)), fields=['seeker'], name='search_match_pending_idx')],
+                'unique_together': {('seeker', 'job')},
+            },
+        ),
+    ]
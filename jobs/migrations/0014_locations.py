@@ -0,0 +1,58 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def load_locations(apps, schema_editor):
+    """Loads the bundled gazetteer and resolves the existing postings' locations."""
+    from jobs.locations import load_gazetteer, normalize_job_locations
+
+    Location = apps.get_model('jobs', 'Location')
+    LocationAlias = apps.get_model('jobs', 'LocationAlias')
+    load_gazetteer(location_model=Location, alias_model=LocationAlias)
+    normalize_job_locations(job_model=apps.get_model('jobs', 'JobPosting'), alias_model=LocationAlias)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0013_saved_searches'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Location',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('region', models.CharField(blank=True, default='', max_length=100)),
+                ('region_code', models.CharField(blank=True, default='', max_length=10)),
+                ('country', models.CharField(max_length=100)),
+                ('country_code', models.CharField(max_length=2)),
+                ('latitude', models.FloatField()),
+                ('longitude', models.FloatField()),
+                ('geohash', models.CharField(db_index=True, editable=False, max_length=12)),
+            ],
+            options={
+                'unique_together': {('name', 'region', 'country_code')},
+            },
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='canonical_location',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='jobs', to='jobs.location'),
+        ),
+        migrations.CreateModel(
+            name='LocationAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alias', models.CharField(db_index=True, max_length=100)),
+                ('location', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='jobs.location')),
+            ],
+            options={
+                'unique_together': {('alias', 'location')},
+            },
+        ),
+        migrations.RunPython(load_locations, migrations.RunPython.noop),
+    ]
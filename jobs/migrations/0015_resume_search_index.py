@@ -0,0 +1,31 @@
+from django.db import migrations
+
+
+def create_resume_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS jobs_resumetext_fts USING fts5("
+        "text, tokenize = 'porter unicode61 remove_diacritics 2')"
+    )
+    schema_editor.execute(
+        "INSERT INTO jobs_resumetext_fts (rowid, text) "
+        "SELECT profile_id, text FROM jobs_resumetext WHERE status = 'DONE'"
+    )
+
+
+def drop_resume_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute("DROP TABLE IF EXISTS jobs_resumetext_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0014_locations'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_resume_index, drop_resume_index),
+    ]
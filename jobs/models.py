@@ -1,6 +1,11 @@
+from datetime import timedelta
+
 from django.db import models
 from django.conf import settings
-from django.core.validators import FileExtensionValidator
+from django.core.validators import FileExtensionValidator, MinValueValidator, MaxValueValidator
+from django.utils import timezone
+
+from .storage import resume_storage
 
 # --- Profile Models ---
 
@@ -10,6 +15,7 @@ class EmployerProfile(models.Model):
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='employer_profile')
     company_name = models.CharField(max_length=150)
     company_description = models.TextField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.company_name
@@ -23,13 +29,87 @@ class JobSeekerProfile(models.Model):
     # Allow null/blank resume until the user uploads one
     resume = models.FileField(
         upload_to='resumes/',
+        storage=resume_storage,  # deduplicated by content hash
         null=True, blank=True,
         validators=[FileExtensionValidator(allowed_extensions=['pdf', 'docx'])]
     )
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"Profile for {self.user.username}"
 
+class ResumeBlob(models.Model):
+    """A unique stored resume file and the number of profiles pointing at it."""
+    name = models.CharField(max_length=255, unique=True)  # storage name, e.g. resumes/ab/ab12...pdf
+    size = models.PositiveBigIntegerField(default=0)
+    ref_count = models.IntegerField(default=0)
+    created_on = models.DateTimeField(auto_now_add=True)
+    released_on = models.DateTimeField(null=True, blank=True)  # when ref_count last dropped to zero
+
+    def __str__(self):
+        return f"{self.name} ({self.ref_count} refs)"
+
+class ResumeText(models.Model):
+    """Plain text extracted from a seeker's resume by the background worker."""
+    STATUS_CHOICES = [
+        ('PENDING', 'Pending'),
+        ('PROCESSING', 'Processing'),
+        ('DONE', 'Done'),
+        ('FAILED', 'Failed'),
+    ]
+
+    profile = models.OneToOneField(JobSeekerProfile, on_delete=models.CASCADE, related_name='resume_text')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='PENDING', db_index=True)
+    # Name of the resume file the text was (or will be) extracted from
+    source_name = models.CharField(max_length=255, blank=True, default='')
+    text = models.TextField(blank=True, default='')
+    queued_on = models.DateTimeField(default=timezone.now)
+    extracted_on = models.DateTimeField(null=True, blank=True)
+    extraction_seconds = models.FloatField(null=True, blank=True)
+    error = models.TextField(blank=True, default='')
+
+    def __str__(self):
+        return f"Resume text for {self.profile_id} ({self.status})"
+
+# --- Locations ---
+
+class Location(models.Model):
+    """
+    A place from the bundled gazetteer (jobs/data/gazetteer.csv), which job
+    locations typed as free text are resolved to (see jobs.locations).
+    """
+    name = models.CharField(max_length=100)
+    region = models.CharField(max_length=100, blank=True, default='')
+    region_code = models.CharField(max_length=10, blank=True, default='')
+    country = models.CharField(max_length=100)
+    country_code = models.CharField(max_length=2)
+    latitude = models.FloatField()
+    longitude = models.FloatField()
+    # Grid cell index for radius searches: nearby places share a prefix
+    geohash = models.CharField(max_length=12, db_index=True, editable=False)
+
+    class Meta:
+        unique_together = ('name', 'region', 'country_code')
+
+    def __str__(self):
+        # "Chennai, Tamil Nadu, India"; "Singapore", not "Singapore, Singapore, Singapore"
+        parts = []
+        for part in (self.name, self.region, self.country):
+            if part and part not in parts:
+                parts.append(part)
+        return ', '.join(parts)
+
+class LocationAlias(models.Model):
+    """A normalised spelling of a place name ("madras", "chennai"), for resolution."""
+    alias = models.CharField(max_length=100, db_index=True)
+    location = models.ForeignKey(Location, on_delete=models.CASCADE, related_name='aliases')
+
+    class Meta:
+        unique_together = ('alias', 'location')
+
+    def __str__(self):
+        return f"{self.alias} -> {self.location_id}"
+
 # --- Job Posting and Application Models (No Major Change) ---
 
 class JobPosting(models.Model):
@@ -38,8 +118,43 @@ class JobPosting(models.Model):
     title = models.CharField(max_length=200)
     description = models.TextField()
     location = models.CharField(max_length=100)
+    # The gazetteer place `location` resolves to, if any; set by jobs.signals
+    canonical_location = models.ForeignKey(Location, on_delete=models.SET_NULL, null=True, blank=True, editable=False, related_name='jobs')
+    skills = models.CharField(max_length=255, blank=True, default='', help_text="e.g., Python, SQL, AWS. Used to recommend this job to matching seekers.")
     posted_on = models.DateTimeField(auto_now_add=True)
+    # Last change to what seekers see; the counter UPDATEs below leave it alone
+    updated_at = models.DateTimeField(auto_now=True)
     is_active = models.BooleanField(default=True)
+    # When the posting stopped accepting applications; starts the archive clock
+    closed_on = models.DateTimeField(null=True, blank=True, editable=False)
+
+    # Denormalised application counters, kept exact by jobs.counters
+    application_count = models.IntegerField(default=0)
+    applied_count = models.IntegerField(default=0)
+    shortlisted_count = models.IntegerField(default=0)
+    interview_count = models.IntegerField(default=0)
+    rejected_count = models.IntegerField(default=0)
+    archived_count = models.IntegerField(default=0)  # moved to ArchivedApplication
+
+    class Meta:
+        indexes = [
+            # Active feed, newest first (keyset pages on (posted_on, id)), and the active count.
+            # Partial, because the ORM filters booleans as a bare "WHERE is_active",
+            # which SQLite cannot seek on as the first column of a composite index
+            models.Index(fields=['-posted_on', '-id'], condition=models.Q(is_active=True), name='jobposting_active_feed_idx'),
+            # Latest change to any posting (closing one included), for the dashboard page validators
+            models.Index(fields=['updated_at'], name='jobposting_updated_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        # Start the archive clock when the job is closed; reopening resets it
+        if self.is_active:
+            self.closed_on = None
+        elif self.closed_on is None:
+            self.closed_on = timezone.now()
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = {*kwargs['update_fields'], 'closed_on', 'updated_at', 'canonical_location'}
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return self.title
@@ -57,19 +172,182 @@ class Application(models.Model):
     seeker = models.ForeignKey(JobSeekerProfile, on_delete=models.CASCADE, related_name='applications')
     applied_on = models.DateTimeField(auto_now_add=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='APPLIED')
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         unique_together = ('job', 'seeker') # Prevent duplicate applications
+        indexes = [
+            # A seeker's applications, newest first; lookups by job use the unique index
+            models.Index(fields=['seeker', '-applied_on', '-id'], name='application_seeker_idx'),
+        ]
 
     def __str__(self):
         return f"{self.seeker.user.username} applied for {self.job.title} ({self.status})"
 
 class Interview(models.Model):
     """Scheduling details for an interview."""
+    # Upper bound on duration; it bounds how far back an overlap search must look
+    MAX_DURATION_MINUTES = 8 * 60
+
     application = models.OneToOneField(Application, on_delete=models.CASCADE, related_name='interview')
     scheduled_time = models.DateTimeField()
+    duration_minutes = models.PositiveIntegerField(
+        default=30,
+        validators=[MinValueValidator(5), MaxValueValidator(MAX_DURATION_MINUTES)],
+    )
     location_link = models.URLField(max_length=255, blank=True, null=True, help_text="e.g., Google Meet or Zoom link")
     notes = models.TextField(blank=True, null=True)
 
+    # Denormalised from application.job so calendar and conflict queries
+    # are a range scan on one index instead of a join
+    employer = models.ForeignKey(EmployerProfile, on_delete=models.CASCADE, related_name='interviews', null=True, editable=False)
+    ends_at = models.DateTimeField(null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['employer', 'scheduled_time'], name='interview_employer_time_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        if self.employer_id is None:
+            self.employer_id = JobPosting.objects.filter(applications__id=self.application_id).values_list('employer_id', flat=True).first()
+        self.ends_at = self.scheduled_time + timedelta(minutes=self.duration_minutes)
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = {*kwargs['update_fields'], 'employer', 'ends_at', 'updated_at'}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"Interview for {self.application.seeker.user.username} on {self.scheduled_time.strftime('%Y-%m-%d %H:%M')}"
+
+class ArchivedApplication(models.Model):
+    """
+    An application moved out of the hot Application table once its job had
+    been closed for settings.APPLICATION_ARCHIVE_DAYS (see jobs.archiving).
+
+    Keeps the original id, with the interview (if any) copied inline so
+    history pages read a single table.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    job = models.ForeignKey(JobPosting, on_delete=models.CASCADE, related_name='archived_applications')
+    seeker = models.ForeignKey(JobSeekerProfile, on_delete=models.CASCADE, related_name='archived_applications')
+    applied_on = models.DateTimeField()
+    status = models.CharField(max_length=20, choices=Application.STATUS_CHOICES)
+    archived_on = models.DateTimeField(default=timezone.now)
+
+    interview_time = models.DateTimeField(null=True, blank=True)
+    interview_duration_minutes = models.PositiveIntegerField(null=True, blank=True)
+    interview_location_link = models.URLField(max_length=255, blank=True, null=True)
+    interview_notes = models.TextField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['seeker', '-applied_on'], name='archived_app_seeker_idx'),
+        ]
+
+    def __str__(self):
+        return f"Archived application {self.id} for job {self.job_id} ({self.status})"
+
+# --- Skill Matching Index ---
+
+class Skill(models.Model):
+    """A normalized skill token shared by job postings and seeker profiles."""
+    name = models.CharField(max_length=100, unique=True)
+
+    def __str__(self):
+        return self.name
+
+class JobSkill(models.Model):
+    """Inverted index entry: a skill required by a job posting."""
+    job = models.ForeignKey(JobPosting, on_delete=models.CASCADE, related_name='skill_links')
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='job_links')
+
+    class Meta:
+        unique_together = ('job', 'skill')
+
+class SeekerSkill(models.Model):
+    """Inverted index entry: a skill listed on a seeker profile."""
+    seeker = models.ForeignKey(JobSeekerProfile, on_delete=models.CASCADE, related_name='skill_links')
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='seeker_links')
+
+    class Meta:
+        unique_together = ('seeker', 'skill')
+
+# --- Notification Outbox ---
+
+class NotificationOutbox(models.Model):
+    """
+    An application status change waiting to be emailed to the candidate.
+
+    Rows are written in the same transaction as the status change, so a
+    notification exists exactly when the change committed. The
+    send_notifications worker drains them (see jobs.notifications).
+    """
+    STATE_CHOICES = [
+        ('PENDING', 'Pending'),
+        ('PROCESSING', 'Processing'),
+        ('SENT', 'Sent'),
+        ('SUPERSEDED', 'Superseded'),  # coalesced into a later event's email
+        ('SKIPPED', 'Skipped'),  # candidate has no email address
+        ('FAILED', 'Failed'),  # gave up after the maximum number of attempts
+    ]
+
+    application = models.ForeignKey(Application, on_delete=models.CASCADE, related_name='notifications')
+    status = models.CharField(max_length=20, choices=Application.STATUS_CHOICES)
+    state = models.CharField(max_length=20, choices=STATE_CHOICES, default='PENDING')
+    created_on = models.DateTimeField(default=timezone.now)
+    # Not sent before this time: gives later changes a window to coalesce, and delays retries
+    available_at = models.DateTimeField(default=timezone.now)
+    attempts = models.PositiveIntegerField(default=0)
+    sent_on = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default='')
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['state', 'available_at'], name='outbox_state_available_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.status} notification for application {self.application_id} ({self.state})"
+
+# --- Saved Searches ---
+
+class SavedSearch(models.Model):
+    """
+    A seeker's standing query, matched against postings as they are created
+    or edited (see jobs.alerts).
+
+    Every term is required. The search is filed in the term index under one
+    of its own terms, `key_term`, so a posting is only ever checked against
+    the searches keyed by a term it contains.
+    """
+    seeker = models.ForeignKey(JobSeekerProfile, on_delete=models.CASCADE, related_name='saved_searches')
+    keywords = models.CharField(max_length=200, blank=True, default='', help_text="Words that must all appear in the posting.")
+    location = models.CharField(max_length=100, blank=True, default='')
+    skills = models.CharField(max_length=255, blank=True, default='', help_text="e.g., Python, SQL. All must be listed on the posting.")
+    # Set from the terms above by jobs.signals; e.g. "kw:django" or "skill:python"
+    key_term = models.CharField(max_length=110, editable=False, db_index=True)
+    created_on = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Search {self.id} for seeker {self.seeker_id} ({self.key_term})"
+
+class SavedSearchMatch(models.Model):
+    """A posting that matched one of a seeker's saved searches: an entry in their inbox."""
+    search = models.ForeignKey(SavedSearch, on_delete=models.CASCADE, related_name='matches')
+    # Denormalised from search.seeker: the inbox and the digests read by seeker
+    seeker = models.ForeignKey(JobSeekerProfile, on_delete=models.CASCADE, related_name='search_matches')
+    job = models.ForeignKey(JobPosting, on_delete=models.CASCADE, related_name='search_matches')
+    matched_on = models.DateTimeField(default=timezone.now)
+    digested_on = models.DateTimeField(null=True, blank=True)  # when it went out in an email digest
+
+    class Meta:
+        unique_together = ('seeker', 'job')  # one entry per posting, however many searches match it
+        indexes = [
+            models.Index(fields=['seeker', '-matched_on', '-id'], name='search_match_inbox_idx'),
+            # Matches still waiting for a digest
+            models.Index(fields=['seeker'], condition=models.Q(digested_on__isnull=True), name='search_match_pending_idx'),
+        ]
+
+    def __str__(self):
+        return f"Job {self.job_id} for seeker {self.seeker_id}"
@@ -0,0 +1,148 @@
+import random
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from .models import Application, NotificationOutbox
+
+# --- Transactional Outbox for Status Notifications ---
+
+DEFAULT_COALESCE_SECONDS = 60
+MAX_ATTEMPTS = 6
+BACKOFF_BASE_SECONDS = 30
+BACKOFF_MAX_SECONDS = 60 * 60
+
+
+def enqueue_status_notifications(application_ids, status):
+    """
+    Records that these applications moved to `status`.
+
+    Call inside the transaction that changes the status: one INSERT for any
+    number of applications, and nothing is queued if the change rolls back.
+    """
+    now = timezone.now()
+    delay = timedelta(seconds=getattr(settings, 'NOTIFICATION_COALESCE_SECONDS', DEFAULT_COALESCE_SECONDS))
+    NotificationOutbox.objects.bulk_create([
+        NotificationOutbox(application_id=app_id, status=status, created_on=now, available_at=now + delay)
+        for app_id in application_ids
+    ])
+
+
+def claim_batch(size: int):
+    """Moves up to `size` due events to PROCESSING and returns their ids."""
+    ids = list(
+        NotificationOutbox.objects.filter(state='PENDING', available_at__lte=timezone.now())
+        .order_by('available_at', 'id').values_list('id', flat=True)[:size]
+    )
+    NotificationOutbox.objects.filter(id__in=ids, state='PENDING').update(state='PROCESSING')
+    return list(NotificationOutbox.objects.filter(id__in=ids, state='PROCESSING').values_list('id', flat=True))
+
+
+def release_stale_claims() -> int:
+    """Requeues events left in PROCESSING by a worker that died mid-batch."""
+    return NotificationOutbox.objects.filter(state='PROCESSING').update(state='PENDING')
+
+
+def backoff_delay(attempts: int) -> timedelta:
+    """Exponential backoff with jitter: ~30s, 1m, 2m, ... capped at an hour."""
+    seconds = min(BACKOFF_BASE_SECONDS * 2 ** (attempts - 1), BACKOFF_MAX_SECONDS)
+    return timedelta(seconds=seconds * random.uniform(0.8, 1.2))
+
+
+def _build_message(user, applications) -> EmailMessage:
+    subject = (
+        f"Update on your application for {applications[0].job.title}" if len(applications) == 1
+        else f"Updates on {len(applications)} of your applications"
+    )
+    lines = [notification_summary(application) for application in applications]
+    body = render_to_string('jobs/email/status_update.txt', {'user': user, 'lines': lines})
+    return EmailMessage(subject, body, settings.DEFAULT_FROM_EMAIL, [user.email])
+
+
+def deliver_batch(event_ids, max_attempts: int = MAX_ATTEMPTS) -> dict:
+    """
+    Emails the claimed events, one message per candidate.
+
+    Events for the same candidate are coalesced: the email lists each
+    application once, with its current status and interview details, and
+    older events for an application are marked SUPERSEDED. A failed send
+    puts that candidate's events back to PENDING with a backoff, until
+    `max_attempts`, after which they are marked FAILED.
+
+    Returns:
+        {'sent': emails sent, 'events': events settled (sent, superseded or
+        skipped), 'retried': events requeued, 'failed': events given up on}
+    """
+    events = list(
+        NotificationOutbox.objects.filter(id__in=event_ids, state='PROCESSING')
+        .select_related('application__seeker__user', 'application__job__employer', 'application__interview')
+        .order_by('id')
+    )
+    by_user = defaultdict(list)
+    for event in events:
+        by_user[event.application.seeker.user].append(event)
+
+    summary = {'sent': 0, 'events': 0, 'retried': 0, 'failed': 0}
+    now = timezone.now()
+    connection = get_connection()
+    try:
+        # One connection for the batch; if it cannot open now, send_messages
+        # retries the open and the error is handled per candidate below
+        connection.open()
+    except Exception:
+        pass
+    try:
+        for user, user_events in by_user.items():
+            # Latest event per application; its current row holds the details
+            latest = {}
+            for event in user_events:
+                latest[event.application_id] = event
+            superseded = [event.id for event in user_events if latest[event.application_id] is not event]
+            current = [event.id for event in latest.values()]
+            NotificationOutbox.objects.filter(id__in=superseded).update(state='SUPERSEDED')
+            summary['events'] += len(superseded)
+
+            if not user.email:
+                NotificationOutbox.objects.filter(id__in=current).update(state='SKIPPED')
+                summary['events'] += len(current)
+                continue
+
+            applications = [event.application for event in latest.values()]
+            try:
+                connection.send_messages([_build_message(user, applications)])
+            except Exception as exc:
+                attempts = max(event.attempts for event in latest.values()) + 1
+                if attempts >= max_attempts:
+                    NotificationOutbox.objects.filter(id__in=current).update(
+                        state='FAILED', attempts=attempts, last_error=repr(exc)
+                    )
+                    summary['failed'] += len(current)
+                else:
+                    NotificationOutbox.objects.filter(id__in=current).update(
+                        state='PENDING', attempts=attempts, last_error=repr(exc),
+                        available_at=now + backoff_delay(attempts),
+                    )
+                    summary['retried'] += len(current)
+                continue
+
+            NotificationOutbox.objects.filter(id__in=current).update(state='SENT', sent_on=timezone.now())
+            summary['sent'] += 1
+            summary['events'] += len(current)
+    finally:
+        connection.close()
+    return summary
+
+
+def notification_summary(application: Application) -> str:
+    """One line describing an application's current status, for the email body."""
+    line = f"{application.job.title} at {application.job.employer.company_name}: {application.get_status_display()}"
+    interview = getattr(application, 'interview', None) if application.status == 'INTERVIEW' else None
+    if interview is not None:
+        line += f" on {timezone.localtime(interview.scheduled_time):%b %d, %Y %H:%M} ({interview.duration_minutes} min)"
+        if interview.location_link:
+            line += f" - {interview.location_link}"
+    return line
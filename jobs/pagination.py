@@ -0,0 +1,93 @@
+import base64
+import json
+from datetime import datetime
+
+from django.core.cache import cache
+from django.db.models import Q
+
+# --- Keyset (Cursor) Pagination Helpers ---
+
+FEED_PAGE_SIZE = 20
+FEED_COUNT_CACHE_KEY = 'jobs:active_job_count'
+FEED_COUNT_TTL = 60  # seconds; the header count may lag new postings by this much
+
+
+def encode_cursor(job) -> str:
+    """
+    Builds an opaque, URL-safe cursor pointing just after the given job.
+
+    The cursor holds the (posted_on, id) pair the feed is ordered by, so it
+    stays valid even when new jobs are posted while a seeker is paging.
+    """
+    payload = json.dumps([job.posted_on.isoformat(), job.id])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token: str):
+    """
+    Reverses encode_cursor.
+
+    Returns:
+        A (posted_on, id) tuple, or None if the token is missing or malformed.
+    """
+    if not token:
+        return None
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        posted_on, job_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(posted_on), int(job_id)
+    except (ValueError, TypeError):
+        return None
+
+
+def keyset_page(queryset, cursor: str = None, page_size: int = FEED_PAGE_SIZE):
+    """
+    Returns one page of a queryset ordered newest first by (posted_on, id).
+
+    Instead of OFFSET, the page starts strictly after the cursor position, so
+    the cost of a page does not grow with how deep the seeker has scrolled.
+
+    Returns:
+        A (items, next_cursor) tuple; next_cursor is None on the last page.
+    """
+    # Fetch one extra row to learn whether another page exists
+    items = list(_after_cursor(queryset, cursor)[:page_size + 1])
+    return _split_page(items, page_size)
+
+
+async def akeyset_page(queryset, cursor: str = None, page_size: int = FEED_PAGE_SIZE):
+    """keyset_page for async views; rows are streamed with aiterator()."""
+    items = [item async for item in _after_cursor(queryset, cursor)[:page_size + 1].aiterator()]
+    return _split_page(items, page_size)
+
+
+def _after_cursor(queryset, cursor):
+    queryset = queryset.order_by('-posted_on', '-id')
+    position = decode_cursor(cursor)
+    if position is not None:
+        posted_on, job_id = position
+        queryset = queryset.filter(
+            Q(posted_on__lt=posted_on) | Q(posted_on=posted_on, id__lt=job_id)
+        )
+    return queryset
+
+
+def _split_page(items, page_size):
+    if len(items) > page_size:
+        items = items[:page_size]
+        return items, encode_cursor(items[-1])
+    return items, None
+
+
+def cached_active_job_count(queryset) -> int:
+    """
+    Returns the number of active jobs, served from the cache when possible.
+
+    COUNT(*) over every active posting is the one remaining full scan on the
+    dashboard, so the value is cached briefly rather than recomputed per view.
+    """
+    count = cache.get(FEED_COUNT_CACHE_KEY)
+    if count is None:
+        count = queryset.count()
+        cache.set(FEED_COUNT_CACHE_KEY, count, FEED_COUNT_TTL)
+    return count
@@ -0,0 +1,60 @@
+import re
+
+from django.db import connections
+
+# --- Query Plan Regression Checks ---
+#
+# Used by the tests to make sure the views' queries stay on indexes as the
+# schema and views change: each captured SELECT is EXPLAINed and any step
+# that reads a whole table is reported.
+
+# SQLite: "SCAN jobs_application" is a full table scan; "SCAN t USING
+# [COVERING] INDEX i" walks an index (for ORDER BY ... LIMIT) and is fine
+_SQLITE_FULL_SCAN = re.compile(r'^SCAN (\w+)(?: AS \w+)?$')
+# Postgres: sequential scans (explain() disables them, so one still showing
+# means no index applies at all)
+_POSTGRES_FULL_SCAN = re.compile(r'Seq Scan on (\w+)')
+
+
+def explain(sql: str, using: str = 'default') -> list:
+    """Returns the plan of one SQL statement as a list of lines."""
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            return [row[-1] for row in cursor.fetchall()]
+        if connection.vendor == 'postgresql':
+            # On small test tables the planner prefers seq scans anyway
+            cursor.execute('SET enable_seqscan = off')
+            try:
+                cursor.execute(f'EXPLAIN {sql}')
+                return [row[0] for row in cursor.fetchall()]
+            finally:
+                cursor.execute('RESET enable_seqscan')
+    raise NotImplementedError(f"No query plan support for {connection.vendor}.")
+
+
+def full_scans(queries, using: str = 'default', allowed_tables=()) -> list:
+    """
+    Finds the captured queries whose plan scans a whole table.
+
+    Args:
+        queries: Query dicts as recorded by CaptureQueriesContext or
+            assertNumQueries ({'sql': ..., ...}); only SELECTs are explained.
+        allowed_tables: Tables that may be scanned, e.g. small lookup tables.
+
+    Returns:
+        A list of (table, sql) tuples, one per offending plan step.
+    """
+    vendor = connections[using].vendor
+    pattern = _SQLITE_FULL_SCAN if vendor == 'sqlite' else _POSTGRES_FULL_SCAN
+    found = []
+    for query in queries:
+        sql = query['sql']
+        if not sql.lstrip().upper().startswith('SELECT'):
+            continue
+        for line in explain(sql, using):
+            match = pattern.search(line.strip())
+            if match and match.group(1) not in allowed_tables:
+                found.append((match.group(1), sql))
+    return found
@@ -0,0 +1,44 @@
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# --- Primary/Replica Routing ---
+
+# True only while serving a request that may read from a replica. Everything
+# else (POSTs, management commands, workers, shell) uses the primary.
+replica_reads = ContextVar('replica_reads', default=False)
+# Set once the current request has written to the primary
+wrote_primary = ContextVar('wrote_primary', default=False)
+
+
+class PrimaryReplicaRouter:
+    """
+    Sends reads to a random replica and writes to the primary.
+
+    Reads only go to replicas when ReplicaRoutingMiddleware allowed it for
+    the request (safe method, no recent write by this client), and stop
+    going there as soon as the request writes anything, so a view always
+    reads back what it just wrote. Reads inside transaction.atomic() stay
+    on the primary, so a transaction sees one consistent database even
+    before its first write.
+    """
+
+    def db_for_read(self, model, **hints):
+        replicas = getattr(settings, 'DATABASE_REPLICAS', [])
+        if replicas and replica_reads.get() and not connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return random.choice(replicas)
+        return 'default'
+
+    def db_for_write(self, model, **hints):
+        replica_reads.set(False)
+        wrote_primary.set(True)
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == 'default'
@@ -0,0 +1,67 @@
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+
+from .models import Interview
+
+# --- Interview Conflicts and Calendar ---
+
+
+def find_conflicts(employer_id, start, duration_minutes, exclude_id=None):
+    """
+    Returns the employer's interviews that overlap [start, start + duration).
+
+    Intervals overlap when each starts before the other ends. Because no
+    interview is longer than Interview.MAX_DURATION_MINUTES, any overlapping
+    interview must start within that distance before `start`, so the lookup
+    is a bounded range scan on the (employer, scheduled_time) index rather
+    than a scan of every interview the employer ever scheduled.
+    """
+    end = start + timedelta(minutes=duration_minutes)
+    earliest_start = start - timedelta(minutes=Interview.MAX_DURATION_MINUTES)
+    conflicts = Interview.objects.filter(
+        employer_id=employer_id,
+        scheduled_time__gt=earliest_start,
+        scheduled_time__lt=end,
+        ends_at__gt=start,
+    )
+    if exclude_id is not None:
+        conflicts = conflicts.exclude(pk=exclude_id)
+    return conflicts.select_related('application__seeker__user').order_by('scheduled_time')
+
+
+def week_start_for(value: str = None):
+    """
+    Parses an ISO week such as "2025-W42" into that week's Monday.
+
+    Falls back to the current week for a missing or malformed value.
+    """
+    try:
+        return datetime.strptime(f'{value}-1', '%G-W%V-%u').date()
+    except (TypeError, ValueError):
+        today = timezone.localdate()
+        return today - timedelta(days=today.weekday())
+
+
+def interviews_for_week(employer_id, monday):
+    """
+    Groups the employer's interviews in the week starting on `monday` by day.
+
+    Returns:
+        A list of seven (date, [interviews]) tuples, Monday first.
+    """
+    tz = timezone.get_current_timezone()
+    window_start = timezone.make_aware(datetime.combine(monday, time.min), tz)
+    window_end = window_start + timedelta(days=7)
+
+    interviews = Interview.objects.filter(
+        employer_id=employer_id,
+        scheduled_time__gte=window_start,
+        scheduled_time__lt=window_end,
+    ).select_related('application__seeker__user', 'application__job').order_by('scheduled_time')
+
+    days = [(monday + timedelta(days=offset), []) for offset in range(7)]
+    for interview in interviews:
+        day = timezone.localtime(interview.scheduled_time, tz).date()
+        days[(day - monday).days][1].append(interview)
+    return days
@@ -0,0 +1,253 @@
+import re
+
+from django.db import connection, connections, router
+from django.db.models import Q
+
+from .models import Application, JobPosting
+
+# --- Full-Text Job Search (SQLite FTS5) ---
+
+FTS_TABLE = 'jobs_jobposting_fts'
+SEARCH_PAGE_SIZE = 20
+
+# Relative BM25 weights for (title, description, location, company_name)
+BM25_WEIGHTS = (10.0, 1.0, 3.0, 5.0)
+
+# Copies the searchable columns of active jobs into the FTS table.
+# The WHERE clause is appended by the caller to narrow the copy.
+_INDEX_SQL = f"""
+    INSERT INTO {FTS_TABLE} (rowid, title, description, location, company_name)
+    SELECT j.id, j.title, j.description, j.location, e.company_name
+    FROM jobs_jobposting j
+    JOIN jobs_employerprofile e ON e.id = j.employer_id
+    WHERE j.is_active
+"""
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def fts_enabled() -> bool:
+    """FTS5 is only used on SQLite; other databases fall back to LIKE."""
+    return connection.vendor == 'sqlite'
+
+
+def build_match_query(text: str) -> str:
+    """
+    Turns free text from the search box into a safe FTS5 MATCH expression.
+
+    Every word is quoted so FTS5 operators typed by the user are treated as
+    plain text, and the last word gets a prefix wildcard so results appear
+    while the seeker is still typing ("pyth" matches "python").
+    """
+    tokens = _TOKEN_RE.findall(text or '')
+    if not tokens:
+        return ''
+    terms = [f'"{token}"' for token in tokens]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+def index_job(job_id: int):
+    """Adds, refreshes or drops a single job so the index matches the table."""
+    if not fts_enabled():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [job_id])
+        cursor.execute(_INDEX_SQL + ' AND j.id = %s', [job_id])
+
+
+def index_jobs(job_ids):
+    """Indexes a batch of newly inserted jobs (bulk_create sends no post_save)."""
+    job_ids = list(job_ids)
+    if not fts_enabled() or not job_ids:
+        return
+    placeholders = ', '.join(['%s'] * len(job_ids))
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid IN ({placeholders})', job_ids)
+        cursor.execute(_INDEX_SQL + f' AND j.id IN ({placeholders})', job_ids)
+
+
+def remove_job(job_id: int):
+    """Removes a deleted job from the index."""
+    if not fts_enabled():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [job_id])
+
+
+def index_employer_jobs(employer_id: int):
+    """Re-indexes every job of one employer, e.g. after a company rename."""
+    if not fts_enabled():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {FTS_TABLE} WHERE rowid IN '
+            '(SELECT id FROM jobs_jobposting WHERE employer_id = %s)',
+            [employer_id],
+        )
+        cursor.execute(_INDEX_SQL + ' AND j.employer_id = %s', [employer_id])
+
+
+def rebuild_index() -> int:
+    """
+    Drops and repopulates the whole index from the JobPosting table.
+
+    Returns:
+        The number of jobs indexed.
+    """
+    if not fts_enabled():
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {FTS_TABLE}')
+        cursor.execute(_INDEX_SQL)
+        cursor.execute(f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('optimize')")
+        cursor.execute(f'SELECT COUNT(*) FROM {FTS_TABLE}')
+        return cursor.fetchone()[0]
+
+
+def search_jobs(text: str, page: int = 1, page_size: int = SEARCH_PAGE_SIZE, location_ids=None):
+    """
+    Finds active jobs matching the search text, best match first.
+
+    Ranking and paging both happen inside the FTS index, so only the ids of
+    the requested page are looked up in the JobPosting table.
+
+    Args:
+        location_ids: Only jobs at these Location ids (see locations.locations_within).
+
+    Returns:
+        A (jobs, has_next) tuple for the requested 1-based page.
+    """
+    page = max(page, 1)
+    offset = (page - 1) * page_size
+
+    if not fts_enabled():
+        return _search_jobs_like(text, offset, page_size, location_ids)
+
+    match = build_match_query(text)
+    if not match or location_ids == []:
+        return [], False
+
+    near, near_params = '', []
+    if location_ids is not None:
+        placeholders = ', '.join(['%s'] * len(location_ids))
+        near = f' AND rowid IN (SELECT id FROM jobs_jobposting WHERE canonical_location_id IN ({placeholders}))'
+        near_params = list(location_ids)
+
+    # Same replica for the index lookup and the rows, so both see one snapshot
+    alias = router.db_for_read(JobPosting)
+    weights = ', '.join(str(w) for w in BM25_WEIGHTS)
+    with connections[alias].cursor() as cursor:
+        cursor.execute(
+            f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s{near} '
+            f'ORDER BY bm25({FTS_TABLE}, {weights}) LIMIT %s OFFSET %s',
+            [match, *near_params, page_size + 1, offset],
+        )
+        ids = [row[0] for row in cursor.fetchall()]
+
+    has_next = len(ids) > page_size
+    ids = ids[:page_size]
+    jobs_by_id = JobPosting.objects.using(alias).select_related('employer').in_bulk(ids)
+    # Keep the BM25 order; skip ids a concurrent delete already removed
+    return [jobs_by_id[job_id] for job_id in ids if job_id in jobs_by_id], has_next
+
+
+def _search_jobs_like(text, offset, page_size, location_ids=None):
+    """Unranked substring search for databases without FTS5."""
+    tokens = _TOKEN_RE.findall(text or '')
+    if not tokens:
+        return [], False
+    jobs = JobPosting.objects.filter(is_active=True).select_related('employer')
+    if location_ids is not None:
+        jobs = jobs.filter(canonical_location_id__in=location_ids)
+    for token in tokens:
+        jobs = jobs.filter(
+            Q(title__icontains=token) | Q(description__icontains=token) |
+            Q(location__icontains=token) | Q(employer__company_name__icontains=token)
+        )
+    jobs = list(jobs.order_by('-posted_on', '-id')[offset:offset + page_size + 1])
+    return jobs[:page_size], len(jobs) > page_size
+
+
+# --- Full-Text Resume Search (SQLite FTS5) ---
+#
+# Extracted resume text (see jobs.extraction) is indexed with the seeker
+# profile id as rowid, so employers can search the resumes of the people
+# who applied to their jobs.
+
+RESUME_FTS_TABLE = 'jobs_resumetext_fts'
+APPLICANT_SEARCH_LIMIT = 50
+
+_RESUME_INDEX_SQL = f"""
+    INSERT INTO {RESUME_FTS_TABLE} (rowid, text)
+    SELECT profile_id, text FROM jobs_resumetext WHERE status = 'DONE'
+"""
+
+
+def index_resumes(seeker_ids):
+    """
+    Brings the resume index in step for the given seekers.
+
+    Only finished extractions are indexed; a queued, failed or deleted one
+    drops the seeker's old text, as it does for skill matching.
+    """
+    seeker_ids = list(seeker_ids)
+    if not fts_enabled() or not seeker_ids:
+        return
+    placeholders = ', '.join(['%s'] * len(seeker_ids))
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {RESUME_FTS_TABLE} WHERE rowid IN ({placeholders})', seeker_ids)
+        cursor.execute(_RESUME_INDEX_SQL + f' AND profile_id IN ({placeholders})', seeker_ids)
+
+
+def search_applicants(employer_id: int, text: str, limit: int = APPLICANT_SEARCH_LIMIT):
+    """
+    Finds applications to an employer's jobs whose resume matches the text,
+    best match first.
+
+    Returns:
+        A list of Application objects, each with a `snippet` of the matching
+        resume text ('' without FTS5).
+    """
+    if not fts_enabled():
+        return _search_applicants_like(employer_id, text, limit)
+
+    match = build_match_query(text)
+    if not match:
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT a.id, snippet({RESUME_FTS_TABLE}, 0, '', '', '…', 16) "
+            f'FROM {RESUME_FTS_TABLE} f '
+            'JOIN jobs_application a ON a.seeker_id = f.rowid '
+            'JOIN jobs_jobposting j ON j.id = a.job_id '
+            f'WHERE {RESUME_FTS_TABLE} MATCH %s AND j.employer_id = %s '
+            f'ORDER BY bm25({RESUME_FTS_TABLE}), a.id DESC LIMIT %s',
+            [match, employer_id, limit],
+        )
+        snippets = dict(cursor.fetchall())
+
+    applications = Application.objects.select_related('job', 'seeker__user').in_bulk(snippets)
+    results = []
+    for application_id, snippet in snippets.items():
+        if application_id in applications:
+            application = applications[application_id]
+            application.snippet = snippet
+            results.append(application)
+    return results
+
+
+def _search_applicants_like(employer_id, text, limit):
+    """Unranked substring search for databases without FTS5."""
+    tokens = _TOKEN_RE.findall(text or '')
+    if not tokens:
+        return []
+    applications = Application.objects.filter(
+        job__employer_id=employer_id, seeker__resume_text__status='DONE'
+    ).select_related('job', 'seeker__user')
+    for token in tokens:
+        applications = applications.filter(seeker__resume_text__text__icontains=token)
+    applications = list(applications.order_by('-applied_on', '-id')[:limit])
+    for application in applications:
+        application.snippet = ''
+    return applications
@@ -0,0 +1,159 @@
+import random
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+
+from .counters import reconcile_counts
+from .locations import assign_locations
+from .models import (
+    Application, EmployerProfile, Interview, JobPosting, JobSeekerProfile, JobSkill, SeekerSkill, Skill,
+)
+from .search import rebuild_index
+
+# --- Synthetic Data Generation ---
+
+SEED_PREFIX = 'seed-'
+
+SKILL_POOL = [
+    'python', 'django', 'sql', 'postgresql', 'aws', 'docker', 'kubernetes', 'react', 'javascript',
+    'typescript', 'java', 'spring', 'go', 'rust', 'c++', 'excel', 'tableau', 'pandas', 'numpy',
+    'machine learning', 'figma', 'seo', 'sales', 'accounting', 'linux', 'git', 'graphql', 'redis',
+]
+TITLES = [
+    'Backend Developer', 'Frontend Developer', 'Data Analyst', 'Data Engineer', 'DevOps Engineer',
+    'QA Engineer', 'Product Designer', 'Marketing Associate', 'Account Manager', 'Site Reliability Engineer',
+]
+LEVELS = ['Junior', '', 'Senior', 'Lead']
+CITIES = ['Chennai', 'Bengaluru', 'Mumbai', 'Hyderabad', 'Pune', 'Delhi', 'Coimbatore', 'Remote']
+STATUS_WEIGHTS = {'APPLIED': 60, 'SHORTLISTED': 20, 'INTERVIEW': 10, 'REJECTED': 10}
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _bulk_create(model, objects, batch_size):
+    """bulk_create in batches, returning the saved objects (with primary keys)."""
+    created = []
+    for batch in _chunks(objects, batch_size):
+        created.extend(model.objects.bulk_create(batch))
+    return created
+
+
+def flush_seeded(prefix: str = SEED_PREFIX) -> int:
+    """Deletes every user created by seed_portal (profiles and jobs cascade)."""
+    deleted, _ = get_user_model().objects.filter(username__startswith=prefix).delete()
+    return deleted
+
+
+def seed_portal(employers: int, jobs: int, seekers: int, applications: int, interview_ratio: float = 0.5,
+                seed: int = 0, batch_size: int = 500, prefix: str = SEED_PREFIX) -> dict:
+    """
+    Fills the database with reproducible synthetic employers, jobs, seekers,
+    applications and interviews.
+
+    Rows are inserted with bulk_create, so no signals fire; the counters,
+    search index and skill index are rebuilt in bulk at the end instead. The
+    same seed and sizes always produce the same data.
+
+    Args:
+        applications: Total applications, spread randomly over seekers and
+            jobs (capped at jobs * seekers).
+        interview_ratio: Share of INTERVIEW applications that get an Interview.
+
+    Returns:
+        The number of rows created per model name.
+    """
+    rng = random.Random(seed)
+    User = get_user_model()
+    now = timezone.now()
+
+    with transaction.atomic():
+        skill_ids = _seed_skills()
+
+        users = _bulk_create(User, [
+            User(username=f'{prefix}employer-{n}', email=f'{prefix}employer-{n}@example.com')
+            for n in range(employers)
+        ] + [
+            User(username=f'{prefix}seeker-{n}', email=f'{prefix}seeker-{n}@example.com')
+            for n in range(seekers)
+        ], batch_size)
+        employer_profiles = _bulk_create(EmployerProfile, [
+            EmployerProfile(user=user, company_name=f'Company {n}', company_description='Synthetic employer.')
+            for n, user in enumerate(users[:employers])
+        ], batch_size)
+        seeker_profiles = _bulk_create(JobSeekerProfile, [
+            JobSeekerProfile(user=user, skills=', '.join(rng.sample(SKILL_POOL, rng.randint(2, 6))))
+            for user in users[employers:]
+        ], batch_size)
+
+        job_objects = []
+        for n in range(jobs):
+            title = f"{rng.choice(LEVELS)} {rng.choice(TITLES)}".strip()
+            skills = rng.sample(SKILL_POOL, rng.randint(2, 5))
+            job_objects.append(JobPosting(
+                employer=employer_profiles[n % employers],
+                title=title,
+                description=f"We are hiring a {title} with {', '.join(skills)} experience. Posting #{n}.",
+                location=rng.choice(CITIES),
+                skills=', '.join(skills),
+                is_active=rng.random() > 0.1,
+            ))
+        assign_locations(job_objects)
+        job_postings = _bulk_create(JobPosting, job_objects, batch_size)
+
+        _bulk_create(JobSkill, [
+            JobSkill(job=job, skill_id=skill_ids[name])
+            for job in job_postings for name in job.skills.split(', ')
+        ], batch_size)
+        _bulk_create(SeekerSkill, [
+            SeekerSkill(seeker=seeker, skill_id=skill_ids[name])
+            for seeker in seeker_profiles for name in seeker.skills.split(', ')
+        ], batch_size)
+
+        applications = min(applications, jobs * seekers)
+        pairs = set()
+        while len(pairs) < applications:
+            pairs.add((rng.randrange(jobs), rng.randrange(seekers)))
+        statuses = list(STATUS_WEIGHTS)
+        weights = list(STATUS_WEIGHTS.values())
+        application_rows = _bulk_create(Application, [
+            Application(job=job_postings[job], seeker=seeker_profiles[seeker], status=rng.choices(statuses, weights)[0])
+            for job, seeker in sorted(pairs)
+        ], batch_size)
+
+        interview_objects = []
+        for application in application_rows:
+            if application.status != 'INTERVIEW' or rng.random() >= interview_ratio:
+                continue
+            # bulk_create skips Interview.save(), so fill the denormalised fields here
+            start = now + timedelta(days=rng.randint(1, 30), hours=rng.randint(0, 8))
+            duration = rng.choice([30, 45, 60])
+            interview_objects.append(Interview(
+                application=application,
+                scheduled_time=start,
+                duration_minutes=duration,
+                employer_id=application.job.employer_id,
+                ends_at=start + timedelta(minutes=duration),
+            ))
+        interview_rows = _bulk_create(Interview, interview_objects, batch_size)
+
+    reconcile_counts(batch_size=batch_size)
+    rebuild_index()
+
+    return {
+        'users': len(users),
+        'employers': len(employer_profiles),
+        'seekers': len(seeker_profiles),
+        'jobs': len(job_postings),
+        'applications': len(application_rows),
+        'interviews': len(interview_rows),
+    }
+
+
+def _seed_skills() -> dict:
+    Skill.objects.bulk_create([Skill(name=name) for name in SKILL_POOL], ignore_conflicts=True)
+    return dict(Skill.objects.filter(name__in=SKILL_POOL).values_list('name', 'id'))
@@ -0,0 +1,186 @@
+from django.contrib.auth.signals import user_logged_in
+from django.db.models import F
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import EmployerProfile, JobPosting, JobSeekerProfile, ResumeBlob, ResumeText, Application, Interview, SavedSearch, Location
+from .storage import digest_from_name, resume_storage
+from .caching import invalidate_employer
+from .fragments import bump_job_card
+from .utils import bump_role_version, remember_role
+from . import alerts, locations, search, matching
+
+# --- Search Index Synchronisation ---
+
+@receiver(post_save, sender=JobPosting)
+def index_saved_job(sender, instance, **kwargs):
+    """Keeps the full-text index in step with created and edited jobs."""
+    search.index_job(instance.id)
+
+@receiver(post_delete, sender=JobPosting)
+def unindex_deleted_job(sender, instance, **kwargs):
+    """Drops deleted jobs from the full-text index."""
+    search.remove_job(instance.id)
+
+@receiver(post_save, sender=EmployerProfile)
+def reindex_employer_jobs(sender, instance, created, **kwargs):
+    """Company names are indexed with each job, so refresh them on change."""
+    if not created:
+        search.index_employer_jobs(instance.id)
+
+@receiver(post_delete, sender=ResumeText)
+def unindex_deleted_resume(sender, instance, **kwargs):
+    """Drops a deleted seeker's resume from the full-text index."""
+    search.index_resumes([instance.profile_id])
+
+@receiver(pre_save, sender=Location)
+def index_location(sender, instance, **kwargs):
+    """Keeps the grid cell in step with the coordinates, e.g. after an admin edit."""
+    instance.geohash = locations.encode_geohash(instance.latitude, instance.longitude)
+
+@receiver(pre_save, sender=JobPosting)
+def resolve_job_location(sender, instance, **kwargs):
+    """Points the posting at the gazetteer place its location text names."""
+    instance.canonical_location = locations.resolve_locations([instance.location])[instance.location]
+
+# --- Skill Index Synchronisation ---
+
+@receiver(post_save, sender=JobPosting)
+def index_job_skills(sender, instance, **kwargs):
+    """Refreshes the skill -> postings index when a job is created or edited."""
+    matching.index_job_skills(instance)
+
+@receiver(post_save, sender=JobSeekerProfile)
+def index_seeker_skills(sender, instance, **kwargs):
+    """Refreshes the skill -> seekers index when a profile is saved."""
+    matching.index_seeker_skills(instance)
+
+# --- Saved Search Matching ---
+
+@receiver(pre_save, sender=SavedSearch)
+def key_saved_search(sender, instance, **kwargs):
+    """Files the search in the term index under its most selective term."""
+    instance.key_term = alerts.choose_key_term(alerts.search_terms(instance))
+
+@receiver(post_save, sender=JobPosting)
+def match_saved_searches(sender, instance, **kwargs):
+    """Puts a posted or edited job in the inbox of every seeker whose saved search it matches."""
+    alerts.match_jobs([instance])
+
+# --- Resume Blob Reference Counting ---
+
+def retain_blob(name):
+    """Adds one reference to a content-addressed resume file."""
+    if not digest_from_name(name):
+        return  # legacy, randomly-suffixed upload; not tracked
+    size = resume_storage.size(name) if resume_storage.exists(name) else 0
+    blob, _ = ResumeBlob.objects.get_or_create(name=name, defaults={'size': size})
+    ResumeBlob.objects.filter(pk=blob.pk).update(ref_count=F('ref_count') + 1, released_on=None)
+
+def release_blob(name):
+    """Drops one reference; unreferenced blobs are left for gc_resume_blobs."""
+    if not digest_from_name(name):
+        return
+    ResumeBlob.objects.filter(name=name).update(ref_count=F('ref_count') - 1)
+    ResumeBlob.objects.filter(name=name, ref_count__lte=0).update(released_on=timezone.now())
+
+@receiver(pre_save, sender=JobSeekerProfile)
+def remember_previous_resume(sender, instance, update_fields=None, **kwargs):
+    """Records which file the profile pointed at before this save."""
+    if instance.pk is None:
+        instance._previous_resume = ''
+    elif update_fields is not None and 'resume' not in update_fields:
+        instance._previous_resume = instance.resume.name or ''
+    else:
+        previous = sender.objects.filter(pk=instance.pk).values_list('resume', flat=True).first()
+        instance._previous_resume = previous or ''
+
+@receiver(post_save, sender=JobSeekerProfile)
+def count_resume_references(sender, instance, **kwargs):
+    """Moves a reference from the old resume blob to the new one."""
+    previous = getattr(instance, '_previous_resume', '')
+    current = instance.resume.name or ''
+    if previous == current:
+        return
+    if current:
+        retain_blob(current)
+    if previous:
+        release_blob(previous)
+
+@receiver(post_delete, sender=JobSeekerProfile)
+def release_deleted_resume(sender, instance, **kwargs):
+    """A deleted profile no longer references its resume."""
+    if instance.resume:
+        release_blob(instance.resume.name)
+
+# --- Employer Dashboard Cache Invalidation ---
+
+@receiver([post_save, post_delete], sender=JobPosting)
+def invalidate_job_employer(sender, instance, **kwargs):
+    """A job was posted, edited or removed."""
+    invalidate_employer(instance.employer_id)
+
+@receiver([post_save, post_delete], sender=Application)
+def invalidate_application_employer(sender, instance, **kwargs):
+    """An application arrived, changed status or was removed."""
+    # Look up by id: on cascading deletes the job row may already be gone,
+    # in which case the job's own post_delete has invalidated the cache
+    employer_id = JobPosting.objects.filter(pk=instance.job_id).values_list('employer_id', flat=True).first()
+    invalidate_employer(employer_id)
+
+@receiver(post_save, sender=EmployerProfile)
+def invalidate_employer_profile(sender, instance, created, **kwargs):
+    """The company name heads the dashboard, whose page validator is this version."""
+    if not created:
+        invalidate_employer(instance.id)
+
+@receiver([post_save, post_delete], sender=Interview)
+def invalidate_interview_employer(sender, instance, **kwargs):
+    """An interview was scheduled, rescheduled or removed."""
+    invalidate_employer(instance.employer_id)
+
+@receiver(post_save, sender=JobSeekerProfile)
+def invalidate_applicant_employers(sender, instance, created, **kwargs):
+    """Applicant resumes and skills are shown on the employers' dashboards."""
+    if created:
+        return
+    employer_ids = JobPosting.objects.filter(applications__seeker=instance).values_list('employer_id', flat=True).distinct()
+    for employer_id in employer_ids:
+        invalidate_employer(employer_id)
+
+# --- Job Card Fragment Invalidation ---
+
+@receiver([post_save, post_delete], sender=JobPosting)
+def refresh_job_card(sender, instance, **kwargs):
+    """An edited job gets its card re-rendered on next view."""
+    bump_job_card(instance.id)
+
+@receiver(post_save, sender=EmployerProfile)
+def refresh_employer_job_cards(sender, instance, created, **kwargs):
+    """Cards show the company name."""
+    if created:
+        return
+    for job_id in JobPosting.objects.filter(employer_id=instance.id).values_list('id', flat=True):
+        bump_job_card(job_id)
+
+@receiver(post_save, sender=EmployerProfile)
+def touch_employer_jobs(sender, instance, created, **kwargs):
+    """Moves the seekers' dashboard validators along with the company name."""
+    if not created:
+        JobPosting.objects.filter(employer_id=instance.id).update(updated_at=timezone.now())
+
+# --- Session Role Invalidation ---
+
+@receiver([post_save, post_delete], sender=EmployerProfile)
+@receiver([post_save, post_delete], sender=JobSeekerProfile)
+def invalidate_session_role(sender, instance, created=False, **kwargs):
+    """Gaining or losing a profile changes the user's role."""
+    if created or kwargs['signal'] is post_delete:
+        bump_role_version(instance.user_id)
+
+@receiver(user_logged_in)
+def resolve_role_on_login(sender, request, user, **kwargs):
+    """Resolves the role into the new session, so later requests skip it."""
+    if request is not None and hasattr(request, 'session'):
+        remember_role(request.session, user, refresh=True)
@@ -0,0 +1,119 @@
+import hashlib
+import os
+import tempfile
+
+from django.core.files.storage import FileSystemStorage
+from django.db import transaction
+from django.utils import timezone
+from django.utils.deconstruct import deconstructible
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+# --- Content-Addressed Resume Storage ---
+
+INCOMING_DIR = '.incoming'
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    Stores each unique file once, named after the SHA-256 of its contents.
+
+    Uploads are hashed chunk by chunk while they stream to a temporary file,
+    then atomically moved to <upload dir>/<xx>/<digest><ext>. Uploading a file
+    that already exists just discards the temporary copy, so re-uploads of
+    the same resume never add to disk use.
+    """
+
+    def get_available_name(self, name, max_length=None):
+        # The final name is derived from the content in _save
+        return name
+
+    def _save(self, name, content):
+        directory, filename = os.path.split(name)
+        extension = os.path.splitext(filename)[1].lower()
+
+        incoming = self.path(os.path.join(directory, INCOMING_DIR))
+        os.makedirs(incoming, exist_ok=True)
+
+        digest = hashlib.sha256()
+        size = 0
+        with tempfile.NamedTemporaryFile(dir=incoming, delete=False) as temp:
+            try:
+                if hasattr(content, 'seek'):
+                    content.seek(0)
+                for chunk in content.chunks():
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode()
+                    digest.update(chunk)
+                    temp.write(chunk)
+                    size += len(chunk)
+            except BaseException:
+                temp.close()
+                os.remove(temp.name)
+                raise
+
+        hexdigest = digest.hexdigest()
+        final_name = os.path.join(directory, hexdigest[:2], hexdigest + extension).replace('\\', '/')
+        final_path = self.path(final_name)
+        # gc_resume_blobs deletes a file only while holding its blob row, so
+        # with the row held here an existing copy cannot vanish before the
+        # dedupe below relies on it
+        with transaction.atomic():
+            self._claim_blob(final_name, size)
+            if os.path.exists(final_path):
+                os.remove(temp.name)
+            else:
+                os.makedirs(os.path.dirname(final_path), exist_ok=True)
+                os.replace(temp.name, final_path)
+                if self.file_permissions_mode is not None:
+                    os.chmod(final_path, self.file_permissions_mode)
+                else:
+                    # NamedTemporaryFile creates files as 0600; use the usual mode
+                    os.chmod(final_path, 0o644)
+        return final_name
+
+    def _claim_blob(self, name, size):
+        """
+        Locks the ResumeBlob row for `name`, creating it if needed.
+
+        An unreferenced blob's release time restarts, so the collector leaves
+        the file alone until the profile being saved retains it; a blob that
+        is never retained is collected like any other released one.
+        """
+        from .models import ResumeBlob
+
+        now = timezone.now()
+        blob, created = ResumeBlob.objects.select_for_update().get_or_create(
+            name=name, defaults={'size': size, 'released_on': now},
+        )
+        if not created and blob.ref_count <= 0:
+            ResumeBlob.objects.filter(pk=blob.pk).update(released_on=now)
+
+
+def digest_from_name(name: str) -> str:
+    """Returns the content digest encoded in a stored name, or '' for legacy names."""
+    stem = os.path.splitext(os.path.basename(name or ''))[0]
+    if len(stem) == 64 and all(char in '0123456789abcdef' for char in stem):
+        return stem
+    return ''
+
+
+resume_storage = ContentAddressedStorage()
+
+
+# --- Static Files ---
+
+class StaticFilesStorage(CompressedManifestStaticFilesStorage):
+    """
+    WhiteNoise's hashed, pre-compressed storage, usable before collectstatic.
+
+    collectstatic writes content-hashed copies (app.3f2a9c.css) that
+    WhiteNoise serves with a far-future, immutable Cache-Control. Until a
+    manifest exists (tests, a fresh checkout) URLs fall back to the plain
+    name instead of raising.
+    """
+
+    def stored_name(self, name):
+        if not self.hashed_files:
+            return name
+        return super().stored_name(name)
@@ -1,3 +1,1378 @@
-from django.test import TestCase
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import zipfile
+from unittest import mock
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.cache import cache
+from django.core.checks import run_checks
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import AsyncClient, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import (
+    Interview, EmployerProfile, JobSeekerProfile, JobPosting, Application, JobSkill, SeekerSkill, ResumeText, ResumeBlob,
+    NotificationOutbox, ArchivedApplication, SavedSearch, SavedSearchMatch, Location,
+)
+from .pagination import keyset_page, encode_cursor, decode_cursor
+from .search import build_match_query, search_applicants, search_jobs
+from .matching import normalize_skills, recommend_jobs, score_applicants
+from .extraction import extract_in_worker
+from .storage import resume_storage
+from .caching import cache_stats
+from .counters import change_status, count_new_application, submit_application, APPLY_CREATED, APPLY_DUPLICATE, APPLY_UNAVAILABLE
+from .utils import SESSION_ROLE_KEY
+from .scheduling import find_conflicts, interviews_for_week
+from .instrumentation import collect_view_stats, percentile, view_stats
+from .seeding import flush_seeded, seed_portal
+from .benchmarks import compare_to_baseline, run_benchmarks
+from .importing import import_jobs, iter_rows
+from .routers import PrimaryReplicaRouter, replica_reads
+from .middleware import PIN_COOKIE
+from .fragments import render_job_cards
+from .notifications import claim_batch, deliver_batch
+from .archiving import archive_applications, expire_jobs
+from .queryplans import full_scans
+from .cssbuild import build_css, compile_class
+from .alerts import match_jobs
+from .locations import bounding_boxes, covering_cells, encode_geohash, locations_within, resolve_locations
 
 # Create your tests here.
+
+class EmployeeDashboardFeedTests(TestCase):
+    """Keyset pagination of the active job feed."""
+
+    @classmethod
+    def setUpTestData(cls):
+        employer_user = User.objects.create_user('acme', password='pass')
+        cls.employer = EmployerProfile.objects.create(user=employer_user, company_name='Acme')
+        seeker_user = User.objects.create_user('seeker', password='pass')
+        cls.seeker = JobSeekerProfile.objects.create(user=seeker_user)
+        cls.jobs = [
+            JobPosting.objects.create(employer=cls.employer, title=f'Job {i}', description='d', location='Chennai')
+            for i in range(25)
+        ]
+
+    def test_cursor_round_trip(self):
+        job = self.jobs[0]
+        self.assertEqual(decode_cursor(encode_cursor(job)), (job.posted_on, job.id))
+        self.assertIsNone(decode_cursor('not-a-cursor'))
+
+    def test_pages_cover_every_job_once(self):
+        seen, cursor = [], None
+        while True:
+            page, cursor = keyset_page(JobPosting.objects.all(), cursor, page_size=10)
+            seen.extend(job.id for job in page)
+            if cursor is None:
+                break
+        self.assertEqual(sorted(seen), sorted(job.id for job in self.jobs))
+        self.assertEqual(len(seen), len(set(seen)))
+
+    def test_dashboard_renders_first_page_and_partial(self):
+        cache.clear()
+        self.client.login(username='seeker', password='pass')
+        response = self.client.get(reverse('employee_dashboard'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['jobs']), 20)
+        self.assertEqual(response.context['total_jobs'], 25)
+
+        cursor = response.context['next_cursor']
+        response = self.client.get(reverse('employee_dashboard'), {'cursor': cursor, 'partial': 1})
+        self.assertTemplateUsed(response, 'jobs/_job_cards.html')
+        self.assertEqual(len(response.context['jobs']), 5)
+        self.assertIsNone(response.context['next_cursor'])
+
+
+class JobSearchTests(TestCase):
+    """FTS5-backed job search and its signal-driven index sync."""
+
+    @classmethod
+    def setUpTestData(cls):
+        employer_user = User.objects.create_user('globex', password='pass')
+        cls.employer = EmployerProfile.objects.create(user=employer_user, company_name='Globex')
+        cls.python_job = JobPosting.objects.create(
+            employer=cls.employer, title='Python Developer', description='Django and SQL', location='Chennai'
+        )
+        cls.java_job = JobPosting.objects.create(
+            employer=cls.employer, title='Java Engineer', description='Spring, some Python scripting', location='Pune'
+        )
+
+    def test_match_query_escapes_operators(self):
+        self.assertEqual(build_match_query('python OR "sql'), '"python" "OR" "sql"*')
+        self.assertEqual(build_match_query('  '), '')
+
+    def test_title_match_ranks_first(self):
+        jobs, has_next = search_jobs('python')
+        self.assertEqual(jobs, [self.python_job, self.java_job])
+        self.assertFalse(has_next)
+
+    def test_index_follows_updates_and_deletes(self):
+        self.java_job.is_active = False
+        self.java_job.save()
+        self.assertEqual(search_jobs('python')[0], [self.python_job])
+
+        self.employer.company_name = 'Initech'
+        self.employer.save()
+        self.assertEqual(search_jobs('initech')[0], [self.python_job])
+
+        self.python_job.delete()
+        self.assertEqual(search_jobs('python')[0], [])
+
+
+class SkillMatchingTests(TestCase):
+    """Skill normalisation, incremental index updates and batch scoring."""
+
+    @classmethod
+    def setUpTestData(cls):
+        employer_user = User.objects.create_user('hooli', password='pass')
+        cls.employer = EmployerProfile.objects.create(user=employer_user, company_name='Hooli')
+        cls.backend = JobPosting.objects.create(
+            employer=cls.employer, title='Backend', description='d', location='Chennai', skills='Python, SQL, Django'
+        )
+        cls.frontend = JobPosting.objects.create(
+            employer=cls.employer, title='Frontend', description='d', location='Chennai', skills='JS, React'
+        )
+        cls.alice = JobSeekerProfile.objects.create(user=User.objects.create_user('alice'), skills='python, sql')
+        cls.bob = JobSeekerProfile.objects.create(user=User.objects.create_user('bob'), skills='ReactJS')
+
+    def test_normalize_skills(self):
+        self.assertEqual(normalize_skills('Python, SQL ,  ReactJS; py'), ['python', 'sql', 'react'])
+        self.assertEqual(normalize_skills(None), [])
+
+    def test_recommendations_follow_profile_updates(self):
+        self.assertEqual([job for job, _ in recommend_jobs(self.alice)], [self.backend])
+
+        self.alice.skills = 'javascript'
+        self.alice.save()
+        self.assertEqual([job for job, _ in recommend_jobs(self.alice)], [self.frontend])
+
+    def test_job_edit_updates_index_incrementally(self):
+        self.backend.skills = 'Python'
+        self.backend.save()
+        self.assertEqual(
+            set(JobSkill.objects.filter(job=self.backend).values_list('skill__name', flat=True)), {'python'}
+        )
+
+    def test_applied_jobs_are_not_recommended(self):
+        Application.objects.create(job=self.backend, seeker=self.alice)
+        self.assertEqual(recommend_jobs(self.alice), [])
+
+    def test_score_applicants(self):
+        alice_app = Application.objects.create(job=self.backend, seeker=self.alice)
+        bob_app = Application.objects.create(job=self.backend, seeker=self.bob)
+        bob_frontend = Application.objects.create(job=self.frontend, seeker=self.bob)
+
+        scores = score_applicants(self.employer)
+        self.assertGreater(scores[alice_app.id], 0)
+        self.assertEqual(scores[bob_app.id], 0)
+        self.assertGreater(scores[bob_frontend.id], 0)
+
+    def test_dashboards_show_matches(self):
+        Application.objects.create(job=self.backend, seeker=self.alice)
+        self.client.force_login(self.employer.user)
+        response = self.client.get(reverse('employer_dashboard'))
+        self.assertContains(response, 'Best-matching applicants')
+
+        self.client.force_login(self.bob.user)
+        response = self.client.get(reverse('employee_dashboard'))
+        self.assertContains(response, 'Recommended for You')
+
+
+def make_docx(*paragraphs):
+    """Builds a minimal DOCX file in memory."""
+    ns = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+    body = ''.join(f'<w:p><w:r><w:t>{text}</w:t></w:r></w:p>' for text in paragraphs)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('word/document.xml', f'<w:document xmlns:w="{ns}"><w:body>{body}</w:body></w:document>')
+    return buffer.getvalue()
+
+
+class ResumeExtractionTests(TestCase):
+    """Upload-time enqueueing and the process_resumes worker."""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.employer = EmployerProfile.objects.create(user=User.objects.create_user('umbrella'), company_name='Umbrella')
+        self.job = JobPosting.objects.create(employer=self.employer, title='Dev', description='d', location='Chennai', skills='Django')
+        self.seeker = JobSeekerProfile.objects.create(user=User.objects.create_user('carol'), skills='SQL')
+
+    def test_worker_reports_errors_instead_of_raising(self):
+        record_id, text, error, _ = extract_in_worker((7, '/tmp/resume.txt', 5))
+        self.assertEqual((record_id, text), (7, ''))
+        self.assertIn('Unsupported resume type', error)
+
+    def test_upload_enqueues_and_worker_extracts(self):
+        self.client.force_login(self.seeker.user)
+        resume = SimpleUploadedFile('cv.docx', make_docx('Carol', 'Built APIs with Django and SQL'))
+        self.client.post(reverse('upload_resume'), {'skills': 'SQL', 'resume': resume})
+
+        record = ResumeText.objects.get(profile=self.seeker)
+        self.assertEqual(record.status, 'PENDING')
+
+        call_command('process_resumes', once=True, workers=1, stdout=io.StringIO())
+        record.refresh_from_db()
+        self.assertEqual(record.status, 'DONE')
+        self.assertIn('Built APIs with Django', record.text)
+        self.assertIsNotNone(record.extraction_seconds)
+        # Skills mentioned in the resume feed into matching
+        self.assertEqual(
+            set(SeekerSkill.objects.filter(seeker=self.seeker).values_list('skill__name', flat=True)),
+            {'sql', 'django'},
+        )
+
+    def test_extraction_revalidates_the_dashboard(self):
+        self.client.force_login(self.seeker.user)
+        resume = SimpleUploadedFile('cv.docx', make_docx('Carol', 'Built APIs with Django'))
+        self.client.post(reverse('upload_resume'), {'skills': 'SQL', 'resume': resume})
+        url = reverse('employee_dashboard')
+        self.client.get(url)  # renders the upload's flash message
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, headers={'If-None-Match': etag}).status_code, 304)
+
+        call_command('process_resumes', once=True, workers=1, stdout=io.StringIO())
+        response = self.client.get(url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Dev')
+
+    def test_extraction_rebuilds_the_cached_employer_dashboard(self):
+        self.client.force_login(self.seeker.user)
+        resume = SimpleUploadedFile('cv.docx', make_docx('Carol', 'Built APIs with Django'))
+        self.client.post(reverse('upload_resume'), {'skills': 'SQL', 'resume': resume})
+        submit_application(self.job.id, self.seeker.id)
+        self.client.force_login(self.employer.user)
+        url = reverse('employer_dashboard')
+        self.client.get(url)  # renders the upload's flash message
+        response = self.client.get(url)
+        self.assertNotContains(response, 'Best-matching applicants')
+
+        # Run as the worker process would: its cache invalidation never reaches the web process
+        with mock.patch('jobs.extraction.invalidate_employer'):
+            call_command('process_resumes', once=True, workers=1, stdout=io.StringIO())
+        response = self.client.get(url, headers={'If-None-Match': response['ETag']})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Best-matching applicants')
+
+    def test_extracted_text_is_searchable_by_employers_applied_to(self):
+        self.client.force_login(self.seeker.user)
+        resume = SimpleUploadedFile('cv.docx', make_docx('Carol', 'Led the Kubernetes migration at Initech'))
+        self.client.post(reverse('upload_resume'), {'skills': 'SQL', 'resume': resume})
+        submit_application(self.job.id, self.seeker.id)
+        self.assertEqual(search_applicants(self.employer.id, 'kubernetes'), [])  # not extracted yet
+
+        call_command('process_resumes', once=True, workers=1, stdout=io.StringIO())
+        [application] = search_applicants(self.employer.id, 'kubernete')
+        self.assertEqual(application.seeker, self.seeker)
+        self.assertIn('Kubernetes migration', application.snippet)
+        other = EmployerProfile.objects.create(user=User.objects.create_user('initech'), company_name='Initech')
+        self.assertEqual(search_applicants(other.id, 'kubernetes'), [])
+
+        self.client.force_login(self.employer.user)
+        response = self.client.get(reverse('applicant_search'), {'q': 'kubernetes'})
+        self.assertContains(response, 'carol')
+        self.assertNotContains(self.client.get(reverse('applicant_search'), {'q': 'cobol'}), 'carol')
+
+        # A new upload drops the old text until it is extracted in turn
+        self.client.force_login(self.seeker.user)
+        resume = SimpleUploadedFile('cv2.docx', make_docx('Carol', 'Payroll systems'))
+        self.client.post(reverse('upload_resume'), {'skills': 'SQL', 'resume': resume})
+        self.assertEqual(search_applicants(self.employer.id, 'kubernetes'), [])
+        call_command('process_resumes', once=True, workers=1, stdout=io.StringIO())
+        self.assertEqual(len(search_applicants(self.employer.id, 'payroll')), 1)
+        self.seeker.delete()
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT COUNT(*) FROM jobs_resumetext_fts')
+            self.assertEqual(cursor.fetchone()[0], 0)
+
+
+class ResumeStorageTests(TestCase):
+    """Content-addressed resume storage, reference counting and GC."""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.dave = JobSeekerProfile.objects.create(user=User.objects.create_user('dave'))
+        self.erin = JobSeekerProfile.objects.create(user=User.objects.create_user('erin'))
+
+    def upload(self, profile, content, filename='cv.pdf'):
+        profile.resume = SimpleUploadedFile(filename, content)
+        profile.save()
+        return profile.resume.name
+
+    def test_identical_uploads_share_one_blob(self):
+        first = self.upload(self.dave, b'%PDF same resume')
+        second = self.upload(self.erin, b'%PDF same resume', filename='other.pdf')
+        self.assertEqual(first, second)
+        self.assertTrue(first.startswith('resumes/'))
+        self.assertEqual(ResumeBlob.objects.get(name=first).ref_count, 2)
+
+    def test_replaced_blob_is_collected(self):
+        old = self.upload(self.dave, b'%PDF version one')
+        new = self.upload(self.dave, b'%PDF version two')
+        self.assertEqual(ResumeBlob.objects.get(name=old).ref_count, 0)
+        self.assertEqual(ResumeBlob.objects.get(name=new).ref_count, 1)
+
+        call_command('gc_resume_blobs', min_age=0, stdout=io.StringIO())
+        self.assertFalse(resume_storage.exists(old))
+        self.assertFalse(ResumeBlob.objects.filter(name=old).exists())
+        self.assertTrue(resume_storage.exists(new))
+
+    def test_reupload_of_a_released_blob_is_not_collected(self):
+        name = self.upload(self.dave, b'%PDF going back')
+        self.upload(self.dave, b'%PDF moved on')
+        ResumeBlob.objects.filter(name=name).update(released_on=timezone.now() - timedelta(hours=2))
+
+        # Erin's upload dedupes against the released file before her profile retains it
+        self.assertEqual(resume_storage.save('resumes/cv.pdf', io.BytesIO(b'%PDF going back')), name)
+        call_command('gc_resume_blobs', min_age=1, stdout=io.StringIO())
+        self.assertTrue(resume_storage.exists(name))
+
+    def test_legacy_uploads_are_adopted_and_swept(self):
+        legacy = resume_storage.path('resumes/Resume_AbC1234.pdf')
+        os.makedirs(os.path.dirname(legacy), exist_ok=True)
+        with open(legacy, 'wb') as handle:
+            handle.write(b'%PDF legacy')
+        JobSeekerProfile.objects.filter(pk=self.dave.pk).update(resume='resumes/Resume_AbC1234.pdf')
+
+        call_command('gc_resume_blobs', min_age=0, adopt_legacy=True, stdout=io.StringIO())
+        self.dave.refresh_from_db()
+        self.assertNotEqual(self.dave.resume.name, 'resumes/Resume_AbC1234.pdf')
+        self.assertEqual(ResumeBlob.objects.get(name=self.dave.resume.name).ref_count, 1)
+        self.assertFalse(os.path.exists(legacy))
+
+
+class EmployerDashboardCacheTests(TestCase):
+    """Per-employer dashboard caching with signal-driven invalidation."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = EmployerProfile.objects.create(user=User.objects.create_user('wayne'), company_name='Wayne')
+        cls.job = JobPosting.objects.create(employer=cls.employer, title='Analyst', description='d', location='Chennai')
+        cls.seeker = JobSeekerProfile.objects.create(user=User.objects.create_user('frank'))
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.employer.user)
+
+    def test_second_view_is_a_cache_hit(self):
+        self.client.get(reverse('employer_dashboard'))
+        # Session, user, the two conditional-GET aggregates and the profile; no job/application rows
+        with self.assertNumQueries(5):
+            response = self.client.get(reverse('employer_dashboard'))
+        self.assertContains(response, 'Analyst')
+        self.assertEqual(cache_stats('employer_dashboard'), {'hits': 1, 'misses': 1, 'hit_rate': 0.5})
+
+    def test_application_change_invalidates(self):
+        self.client.get(reverse('employer_dashboard'))
+        app = Application.objects.create(job=self.job, seeker=self.seeker)
+        self.assertContains(self.client.get(reverse('employer_dashboard')), 'frank')
+
+        app.status = 'REJECTED'
+        app.save()
+        self.assertContains(self.client.get(reverse('employer_dashboard')), 'Rejected')
+        self.assertEqual(cache_stats('employer_dashboard')['hits'], 0)
+
+
+class ApplicationCounterTests(TestCase):
+    """Denormalised per-job application counters."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = EmployerProfile.objects.create(user=User.objects.create_user('stark'), company_name='Stark')
+        cls.job = JobPosting.objects.create(employer=cls.employer, title='Engineer', description='d', location='Chennai')
+        cls.seeker = JobSeekerProfile.objects.create(user=User.objects.create_user('grace'), resume='resumes/cv.pdf')
+
+    def counts(self):
+        self.job.refresh_from_db()
+        return (self.job.application_count, self.job.applied_count, self.job.shortlisted_count,
+                self.job.interview_count, self.job.rejected_count)
+
+    def test_views_keep_counters_exact(self):
+        self.client.force_login(self.seeker.user)
+        self.client.get(reverse('apply_for_job', args=[self.job.id]))
+        self.assertEqual(self.counts(), (1, 1, 0, 0, 0))
+
+        app = Application.objects.get(job=self.job, seeker=self.seeker)
+        self.client.force_login(self.employer.user)
+        self.client.post(reverse('shortlist_application', args=[app.id]))
+        self.assertEqual(self.counts(), (1, 0, 1, 0, 0))
+
+        self.client.post(reverse('schedule_interview', args=[app.id]), {'scheduled_time': '2030-01-01T10:00', 'duration_minutes': 30})
+        self.assertEqual(self.counts(), (1, 0, 0, 1, 0))
+
+    def test_reconcile_repairs_drift(self):
+        Application.objects.create(job=self.job, seeker=self.seeker, status='REJECTED')
+        other = JobPosting.objects.create(employer=self.employer, title='Other', description='d', location='Chennai')
+        JobPosting.objects.filter(pk=self.job.pk).update(application_count=7, applied_count=3)
+        before = dict(JobPosting.objects.values_list('pk', 'updated_at'))
+        call_command('reconcile_application_counts', stdout=io.StringIO())
+        self.assertEqual(self.counts(), (1, 0, 0, 0, 1))
+        # Only the repaired job moves the dashboards' validators
+        self.assertGreater(self.job.updated_at, before[self.job.pk])
+        other.refresh_from_db()
+        self.assertEqual(other.updated_at, before[other.pk])
+
+
+class RoleMiddlewareTests(TestCase):
+    """Session-cached role resolution and the role decorators."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = EmployerProfile.objects.create(user=User.objects.create_user('oscorp'), company_name='Oscorp')
+        cls.plain_user = User.objects.create_user('heidi')
+
+    def test_role_is_resolved_once_per_session(self):
+        # Resolved on login, whichever way the user logged in
+        self.client.force_login(self.employer.user)
+        self.assertEqual(self.client.session[SESSION_ROLE_KEY]['role'], 'employer')
+
+        # Session and user only; the role comes from the session
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('login'))
+        self.assertRedirects(response, reverse('employer_dashboard'), fetch_redirect_response=False)
+
+    def test_role_survives_a_move_to_another_worker(self):
+        cache.clear()  # the profile's creation bumped the version in this process only
+        self.client.force_login(self.employer.user)
+        self.client.get(reverse('login'))
+        cache.clear()  # a worker whose cache has never seen this user
+        with self.assertNumQueries(2):  # session and user; no re-resolve, no session write
+            self.client.get(reverse('login'))
+
+        errors = [message.id for message in run_checks(include_deployment_checks=True)]
+        self.assertIn('jobs.W001', errors)
+
+    def test_roles_gate_views(self):
+        self.client.force_login(self.employer.user)
+        response = self.client.get(reverse('employee_dashboard'))
+        self.assertRedirects(response, '/?next=' + reverse('employee_dashboard'), fetch_redirect_response=False)
+
+    def test_new_profile_invalidates_session_role(self):
+        self.client.force_login(self.plain_user)
+        self.client.get(reverse('upload_resume'))
+        self.assertIsNone(self.client.session[SESSION_ROLE_KEY]['role'])
+
+        JobSeekerProfile.objects.create(user=self.plain_user)
+        self.assertEqual(self.client.get(reverse('upload_resume')).status_code, 200)
+        self.assertEqual(self.client.session[SESSION_ROLE_KEY]['role'], 'employee')
+
+    def test_profile_changes_in_other_processes(self):
+        # Their role version bumps land in another process's cache
+        bump = mock.patch('jobs.signals.bump_role_version')
+        self.client.force_login(self.employer.user)
+        self.client.get(reverse('employer_dashboard'))
+
+        with bump:
+            self.employer.delete()
+            recreated = EmployerProfile.objects.create(user=self.employer.user, company_name='Oscorp Labs')
+        self.assertContains(self.client.get(reverse('employer_dashboard')), 'Oscorp Labs')
+        self.assertEqual(self.client.session[SESSION_ROLE_KEY]['profile'], recreated.id)
+
+        with bump:
+            recreated.delete()
+        self.assertEqual(self.client.get(reverse('employer_dashboard')).status_code, 302)
+        response = self.client.post(reverse('job_create'), {'title': 'T', 'description': 'd', 'location': 'L', 'skills': ''})
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(JobPosting.objects.exists())
+
+        self.client.force_login(self.plain_user)
+        self.client.get(reverse('upload_resume'))
+        with bump:
+            JobSeekerProfile.objects.create(user=self.plain_user)
+        self.assertEqual(self.client.get(reverse('upload_resume')).status_code, 200)
+
+
+class BulkTriageTests(TestCase):
+    """Bulk status changes for many applications in one request."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = EmployerProfile.objects.create(user=User.objects.create_user('tyrell'), company_name='Tyrell')
+        cls.other = EmployerProfile.objects.create(user=User.objects.create_user('cyberdyne'), company_name='Cyberdyne')
+        cls.job = JobPosting.objects.create(employer=cls.employer, title='Ops', description='d', location='Chennai')
+        cls.other_job = JobPosting.objects.create(employer=cls.other, title='AI', description='d', location='Pune')
+        cls.apps = []
+        for i in range(30):
+            seeker = JobSeekerProfile.objects.create(user=User.objects.create_user(f'seeker{i}'))
+            cls.apps.append(Application.objects.create(job=cls.job, seeker=seeker))
+            count_new_application(cls.job.id)
+        cls.foreign_app = Application.objects.create(job=cls.other_job, seeker=seeker)
+
+    def setUp(self):
+        self.client.force_login(self.employer.user)
+
+    def test_bulk_reject_uses_constant_queries(self):
+        ids = [app.id for app in self.apps]
+        self.client.get(reverse('login'))  # resolve the role into the session first
+        # session, user, profile check, select, update, outbox insert, counter update + savepoint pair
+        with self.assertNumQueries(9):
+            self.client.post(reverse('bulk_update_applications'), {'action': 'reject', 'application_ids': ids})
+        self.assertEqual(Application.objects.filter(id__in=ids, status='REJECTED').count(), 30)
+        self.job.refresh_from_db()
+        self.assertEqual((self.job.applied_count, self.job.rejected_count), (0, 30))
+
+    def test_foreign_applications_are_refused(self):
+        ids = [self.apps[0].id, self.foreign_app.id]
+        self.client.post(reverse('bulk_update_applications'), {'action': 'shortlist', 'application_ids': ids})
+        self.assertFalse(Application.objects.filter(id__in=ids, status='SHORTLISTED').exists())
+
+
+class InterviewSchedulingTests(TestCase):
+    """Interview durations, overlap detection and the weekly calendar."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = EmployerProfile.objects.create(user=User.objects.create_user('initech'), company_name='Initech')
+        job = JobPosting.objects.create(employer=cls.employer, title='QA', description='d', location='Chennai')
+        cls.first = Application.objects.create(
+            job=job, status='SHORTLISTED', seeker=JobSeekerProfile.objects.create(user=User.objects.create_user('ivan'))
+        )
+        cls.second = Application.objects.create(
+            job=job, status='SHORTLISTED', seeker=JobSeekerProfile.objects.create(user=User.objects.create_user('judy'))
+        )
+        cls.start = timezone.make_aware(datetime(2030, 1, 7, 10, 0))  # a Monday
+        cls.interview = Interview.objects.create(application=cls.first, scheduled_time=cls.start, duration_minutes=60)
+
+    def test_saved_interview_is_denormalised(self):
+        self.assertEqual(self.interview.employer_id, self.employer.id)
+        self.assertEqual(self.interview.ends_at, self.start + timedelta(minutes=60))
+
+    def test_find_conflicts(self):
+        self.assertEqual(list(find_conflicts(self.employer.id, self.start + timedelta(minutes=30), 30)), [self.interview])
+        self.assertFalse(find_conflicts(self.employer.id, self.start + timedelta(minutes=60), 30).exists())
+        self.assertFalse(find_conflicts(self.employer.id, self.start, 30, exclude_id=self.interview.id).exists())
+
+    def test_overlapping_schedule_is_rejected(self):
+        self.client.force_login(self.employer.user)
+        response = self.client.post(
+            reverse('schedule_interview', args=[self.second.id]),
+            {'scheduled_time': '2030-01-07T10:30', 'duration_minutes': 30},
+        )
+        self.assertContains(response, 'Overlaps the interview with ivan')
+        self.assertFalse(Interview.objects.filter(application=self.second).exists())
+
+    def test_week_view(self):
+        days = interviews_for_week(self.employer.id, self.start.date())
+        self.assertEqual(days[0], (self.start.date(), [self.interview]))
+        self.client.force_login(self.employer.user)
+        response = self.client.get(reverse('interview_calendar'), {'week': '2030-W02'})
+        self.assertContains(response, 'ivan')
+
+
+def query_budgets_only():
+    """VIEW_BUDGETS with the timing budgets lifted; timings vary too much between machines."""
+    return {name: {**budget, 'ms': 60_000} for name, budget in settings.VIEW_BUDGETS.items()}
+
+
+class ViewMetricsTests(TestCase):
+    """Per-view query/latency instrumentation and budgets."""
+
+    def setUp(self):
+        cache.clear()
+        view_stats.samples.clear()
+        self.seeker = JobSeekerProfile.objects.create(user=User.objects.create_user('kim'))
+        self.client.force_login(self.seeker.user)
+
+    def test_samples_are_recorded_per_view(self):
+        self.client.get(reverse('employee_dashboard'))
+        report = collect_view_stats()['employee_dashboard']
+        self.assertEqual(report['queries']['count'], 1)
+        self.assertGreater(report['queries']['p50'], 0)
+        self.assertGreater(report['template_ms']['p50'], 0)
+
+    @override_settings(VIEW_BUDGETS={'default': {'queries': 0, 'ms': 10000}})
+    def test_budget_violation_is_logged(self):
+        with self.assertLogs('jobs.performance', 'WARNING') as logs:
+            self.client.get(reverse('employee_dashboard'))
+        self.assertIn('employee_dashboard', logs.output[0])
+
+    def test_budgeted_views_stay_within_their_query_budgets(self):
+        seed_portal(employers=3, jobs=60, seekers=10, applications=80)
+        seeker = JobSeekerProfile.objects.exclude(applications=None).first()
+        JobSeekerProfile.objects.filter(pk=seeker.pk).update(resume='resumes/seeded.pdf')
+        employer = EmployerProfile.objects.first()
+        for user in (seeker.user, employer.user):
+            user.set_password('secret-pass-1')
+            user.save()
+        job = JobPosting.objects.filter(is_active=True).exclude(applications__seeker=seeker).first()
+
+        with override_settings(VIEW_BUDGETS=query_budgets_only()), self.assertNoLogs('jobs.performance', 'WARNING'):
+            self.client.post(reverse('login'), {'username': seeker.user.username, 'password': 'secret-pass-1', 'role': 'employee'})
+            for _ in range(2):  # cold (flash message, feed count), then warm
+                self.client.get(reverse('employee_dashboard'))
+            self.client.post(reverse('apply_for_job', args=[job.id]))
+            self.client.get(reverse('employee_dashboard'))
+
+            self.client.logout()
+            self.client.post(reverse('login'), {'username': employer.user.username, 'password': 'secret-pass-1', 'role': 'employer'})
+            for _ in range(2):
+                self.client.get(reverse('employer_dashboard'))
+        report = collect_view_stats()
+        self.assertEqual(report['employee_dashboard']['queries']['count'], 3)
+        self.assertEqual(report['employer_dashboard']['queries']['count'], 2)
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual((percentile(values, 0.5), percentile(values, 0.99)), (50, 99))
+
+
+class SeedAndBenchmarkTests(TestCase):
+    """Synthetic data generation and the benchmark runner."""
+
+    def test_seeding_is_reproducible(self):
+        sizes = {'employers': 2, 'jobs': 10, 'seekers': 8, 'applications': 30, 'seed': 7}
+        created = seed_portal(**sizes)
+        self.assertEqual(created['applications'], 30)
+        first = list(JobPosting.objects.order_by('id').values_list('title', 'skills', 'application_count'))
+        self.assertEqual(sum(count for _, _, count in first), 30)
+
+        flush_seeded()
+        self.assertFalse(JobPosting.objects.exists())
+        seed_portal(**sizes)
+        self.assertEqual(list(JobPosting.objects.order_by('id').values_list('title', 'skills', 'application_count')), first)
+
+    def test_run_benchmarks(self):
+        # Timings run under tracemalloc here
+        with override_settings(VIEW_BUDGETS=query_budgets_only()), self.assertNoLogs('jobs.performance', 'WARNING'):
+            results = run_benchmarks([20], requests=2)
+        self.assertEqual(set(results['20']), {'employer_dashboard', 'employee_dashboard', 'apply_for_job'})
+        self.assertGreater(results['20']['employer_dashboard']['queries'], 0)
+
+    def test_compare_to_baseline(self):
+        baseline = {'100': {'employee_dashboard': {'queries': 5, 'p95_ms': 10.0, 'peak_memory_kb': 100.0}}}
+        within = {'100': {'employee_dashboard': {'queries': 5, 'p95_ms': 12.0, 'peak_memory_kb': 100.0}}}
+        worse = {'100': {'employee_dashboard': {'queries': 6, 'p95_ms': 20.0, 'peak_memory_kb': 100.0}}}
+        self.assertEqual(compare_to_baseline(within, baseline), [])
+        self.assertEqual(len(compare_to_baseline(worse, baseline)), 2)
+
+
+class JobImportTests(TestCase):
+    """Streaming CSV/JSONL import of job postings."""
+
+    def setUp(self):
+        self.employer = EmployerProfile.objects.create(user=User.objects.create_user('umbrella'), company_name='Umbrella')
+
+    def test_csv_import_reports_bad_rows(self):
+        data = (
+            'title,description,location,skills\n'
+            'Chemist,Lab work,Raccoon City,"Chemistry, Python"\n'
+            ',Missing title,Raccoon City,\n'
+            'Guard,Night shift,Raccoon City,\n'
+        ).encode()
+        errors = []
+        summary = import_jobs(self.employer.id, iter_rows(io.BytesIO(data), 'csv'), batch_size=1,
+                              on_error=lambda number, row_errors: errors.append((number, row_errors)))
+        self.assertEqual((summary['created'], summary['failed']), (2, 1))
+        self.assertEqual(errors[0][0], 2)
+        self.assertIn('title', errors[0][1])
+        self.assertEqual(list(JobPosting.objects.get(title='Chemist').skill_links.values_list('skill__name', flat=True).order_by('skill__name')),
+                         ['chemistry', 'python'])
+        self.assertEqual([job.title for job in search_jobs('chemist')[0]], ['Chemist'])
+
+    def test_jsonl_upload(self):
+        data = b'{"title": "Pilot", "description": "Fly", "location": "Remote"}\nnot json\n'
+        self.client.force_login(self.employer.user)
+        response = self.client.post(reverse('job_import'), {'file': SimpleUploadedFile('jobs.jsonl', data)})
+        self.assertContains(response, '1 created')
+        self.assertContains(response, 'Invalid JSON')
+        self.assertTrue(JobPosting.objects.filter(employer=self.employer, title='Pilot').exists())
+
+    def test_import_command(self):
+        path = os.path.join(tempfile.mkdtemp(), 'jobs.jsonl')
+        self.addCleanup(shutil.rmtree, os.path.dirname(path))
+        with open(path, 'w') as handle:
+            for n in range(25):
+                handle.write(json.dumps({'title': f'Job {n}', 'description': 'd', 'location': 'Remote'}) + '\n')
+        out = io.StringIO()
+        call_command('import_jobs', path, employer='umbrella', batch_size=10, stdout=out, stderr=io.StringIO())
+        self.assertIn('25 job(s) created', out.getvalue())
+        self.assertEqual(JobPosting.objects.filter(employer=self.employer).count(), 25)
+
+
+class AsyncApiTests(TestCase):
+    """JSON API served by async views."""
+
+    @classmethod
+    def setUpTestData(cls):
+        employer = EmployerProfile.objects.create(user=User.objects.create_user('wonka'), company_name='Wonka')
+        cls.jobs = [
+            JobPosting.objects.create(employer=employer, title=f'Taster {n}', description='d', location='Remote')
+            for n in range(3)
+        ]
+        cls.seeker = JobSeekerProfile.objects.create(user=User.objects.create_user('charlie'), resume='resumes/charlie.pdf')
+
+    async def test_job_list_and_detail(self):
+        client = AsyncClient()
+        response = await client.get(reverse('api_job_list'))
+        self.assertEqual([job['title'] for job in response.json()['results']], ['Taster 2', 'Taster 1', 'Taster 0'])
+
+        response = await client.get(reverse('api_job_detail', args=[self.jobs[0].id]))
+        self.assertEqual(response.json()['company'], 'Wonka')
+        response = await client.get(reverse('api_job_detail', args=[0]))
+        self.assertEqual(response.status_code, 404)
+
+    async def test_apply_and_list_applications(self):
+        client = AsyncClient()
+        response = await client.post(reverse('api_apply', args=[self.jobs[0].id]))
+        self.assertEqual(response.status_code, 401)
+
+        await client.aforce_login(self.seeker.user)
+        response = await client.post(reverse('api_apply', args=[self.jobs[0].id]))
+        self.assertEqual(response.status_code, 201)
+        application_id = response.json()['id']
+        response = await client.post(reverse('api_apply', args=[self.jobs[0].id]))
+        self.assertEqual(response.status_code, 409)
+
+        response = await client.get(reverse('api_my_applications'))
+        self.assertEqual([app['job']['title'] for app in response.json()['results']], ['Taster 0'])
+        self.assertEqual(response.json()['results'][0]['id'], application_id)
+        job = await JobPosting.objects.aget(pk=self.jobs[0].id)
+        self.assertEqual((job.application_count, job.applied_count), (1, 1))
+
+
+class PrimaryReplicaRouterTests(SimpleTestCase):
+    """Router decisions outside any transaction."""
+
+    @override_settings(DATABASE_REPLICAS=['replica1'])
+    def test_router(self):
+        router = PrimaryReplicaRouter()
+        self.assertEqual(router.db_for_read(JobPosting), 'default')  # outside a replica-eligible request
+        token = replica_reads.set(True)
+        try:
+            self.assertEqual(router.db_for_read(JobPosting), 'replica1')
+            self.assertEqual(router.db_for_write(JobPosting), 'default')
+            self.assertEqual(router.db_for_read(JobPosting), 'default')  # pinned after the write
+        finally:
+            replica_reads.reset(token)
+        self.assertFalse(router.allow_migrate('replica1', 'jobs'))
+
+
+class ReplicaRoutingTests(TestCase):
+    """Primary/replica routing with read-your-writes pinning."""
+
+    @override_settings(DATABASE_REPLICAS=['replica1'])
+    def test_atomic_blocks_read_the_primary(self):
+        router = PrimaryReplicaRouter()
+        token = replica_reads.set(True)
+        try:
+            with transaction.atomic():
+                self.assertEqual(router.db_for_read(JobPosting), 'default')
+        finally:
+            replica_reads.reset(token)
+
+    def test_write_sets_pin_cookie(self):
+        User.objects.create_user('lou', password='secret-pass-1')
+        response = self.client.post(reverse('login'), {'username': 'lou', 'password': 'secret-pass-1', 'role': 'employee'})
+        self.assertIn(PIN_COOKIE, response.cookies)
+        response = self.client.get(reverse('login'))
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+
+class JobCardFragmentTests(TestCase):
+    """Cached job card fragments with per-seeker applied state."""
+
+    def setUp(self):
+        cache.clear()
+        self.employer = EmployerProfile.objects.create(user=User.objects.create_user('acme'), company_name='Acme')
+        self.jobs = [
+            JobPosting.objects.create(employer=self.employer, title=f'Role {n}', description='d', location='Remote')
+            for n in range(2)
+        ]
+
+    def test_cards_are_cached_and_personalised(self):
+        first = render_job_cards(self.jobs, {self.jobs[0].id})
+        self.assertIn('Already Applied', first[0])
+        self.assertIn('Apply Now', first[1])
+
+        with mock.patch('jobs.fragments.render_to_string') as render:
+            second = render_job_cards(self.jobs, set())
+        render.assert_not_called()
+        self.assertIn('Apply Now', second[0])
+
+    def test_edits_refresh_the_card(self):
+        render_job_cards(self.jobs, set())
+        self.jobs[0].title = 'Renamed Role'
+        self.jobs[0].save()
+        self.employer.company_name = 'Acme Corp'
+        self.employer.save()
+        cards = render_job_cards(self.jobs, set())
+        self.assertIn('Renamed Role', cards[0])
+        self.assertIn('Acme Corp', cards[1])
+
+
+class ApplyTests(TestCase):
+    """Single-statement, idempotent apply."""
+
+    def setUp(self):
+        employer = EmployerProfile.objects.create(user=User.objects.create_user('hooli'), company_name='Hooli')
+        self.job = JobPosting.objects.create(employer=employer, title='Engineer', description='d', location='Remote')
+        self.seeker = JobSeekerProfile.objects.create(user=User.objects.create_user('richard'), resume='resumes/r.pdf')
+
+    def test_outcomes(self):
+        outcome, _, application_id = submit_application(self.job.id, self.seeker.id)
+        self.assertEqual(outcome, APPLY_CREATED)
+        self.assertEqual(application_id, Application.objects.get().id)
+        self.assertEqual(submit_application(self.job.id, self.seeker.id)[::2], (APPLY_DUPLICATE, application_id))
+        self.job.refresh_from_db()
+        self.assertEqual((self.job.application_count, self.job.applied_count), (1, 1))
+        self.assertEqual(submit_application(0, self.seeker.id), (APPLY_UNAVAILABLE, None, None))
+
+    def test_inactive_job_is_rejected(self):
+        JobPosting.objects.filter(pk=self.job.id).update(is_active=False)
+        self.client.force_login(self.seeker.user)
+        self.client.get(reverse('apply_for_job', args=[self.job.id]))
+        self.assertFalse(Application.objects.exists())
+
+
+class ConcurrentApplyTests(TransactionTestCase):
+    """Many simultaneous applies by the same seeker create exactly one row."""
+
+    def test_concurrent_applies(self):
+        employer = EmployerProfile.objects.create(user=User.objects.create_user('pied'), company_name='Pied Piper')
+        job = JobPosting.objects.create(employer=employer, title='Engineer', description='d', location='Remote')
+        seeker = JobSeekerProfile.objects.create(user=User.objects.create_user('dinesh'))
+
+        workers = 16
+        barrier = threading.Barrier(workers)
+        outcomes, errors = [], []
+
+        def apply():
+            try:
+                barrier.wait()
+                outcomes.append(submit_application(job.id, seeker.id)[0])
+            except Exception as exc:  # surfaced by the assertion below
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=apply) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(outcomes.count(APPLY_CREATED), 1)
+        self.assertEqual(Application.objects.filter(job=job, seeker=seeker).count(), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.application_count, 1)
+
+
+@override_settings(NOTIFICATION_COALESCE_SECONDS=0, EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+class NotificationOutboxTests(TestCase):
+    """Outbox rows written with status changes, and the batching email worker."""
+
+    def setUp(self):
+        self.employer = EmployerProfile.objects.create(user=User.objects.create_user('globex'), company_name='Globex')
+        seeker = JobSeekerProfile.objects.create(user=User.objects.create_user('homer', email='homer@example.com'))
+        self.apps = [
+            Application.objects.create(
+                job=JobPosting.objects.create(employer=self.employer, title=title, description='d', location='Springfield'),
+                seeker=seeker,
+            )
+            for title in ('Safety Inspector', 'Plant Operator')
+        ]
+        for app in self.apps:
+            count_new_application(app.job_id)
+
+    def test_events_are_coalesced_per_candidate(self):
+        self.client.force_login(self.employer.user)
+        self.client.post(reverse('shortlist_application', args=[self.apps[0].id]))
+        self.client.post(reverse('bulk_update_applications'), {'action': 'reject', 'application_ids': [app.id for app in self.apps]})
+        self.assertEqual(NotificationOutbox.objects.filter(state='PENDING').count(), 3)
+
+        summary = deliver_batch(claim_batch(100))
+        self.assertEqual((summary['sent'], summary['events']), (1, 3))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['homer@example.com'])
+        self.assertIn('Safety Inspector at Globex: Rejected', mail.outbox[0].body)
+        self.assertEqual(NotificationOutbox.objects.filter(state='SUPERSEDED').count(), 1)
+
+    def test_failed_send_is_retried_with_backoff(self):
+        self.client.force_login(self.employer.user)
+        self.client.post(reverse('shortlist_application', args=[self.apps[0].id]))
+        with mock.patch('django.core.mail.backends.locmem.EmailBackend.send_messages', side_effect=OSError('down')):
+            summary = deliver_batch(claim_batch(100))
+        self.assertEqual(summary['retried'], 1)
+        event = NotificationOutbox.objects.get()
+        self.assertEqual((event.state, event.attempts), ('PENDING', 1))
+        self.assertGreater(event.available_at, timezone.now())
+        self.assertEqual(claim_batch(100), [])  # not due yet
+
+        NotificationOutbox.objects.update(available_at=timezone.now())
+        call_command('send_notifications', once=True, stdout=io.StringIO())
+        self.assertEqual(NotificationOutbox.objects.get().state, 'SENT')
+        self.assertEqual(len(mail.outbox), 1)
+
+
+class JobExpiryArchiveTests(TestCase):
+    """Batched job expiry, archival of cold applications and the archive pages."""
+
+    def setUp(self):
+        self.employer = EmployerProfile.objects.create(user=User.objects.create_user('initech', password='pass'), company_name='Initech')
+        self.seeker = JobSeekerProfile.objects.create(user=User.objects.create_user('peter', password='pass'))
+        self.old_job = JobPosting.objects.create(employer=self.employer, title='TPS Reports', description='d', location='Austin')
+        self.new_job = JobPosting.objects.create(employer=self.employer, title='Printer Repair', description='d', location='Austin')
+        JobPosting.objects.filter(pk=self.old_job.pk).update(posted_on=timezone.now() - timedelta(days=100))
+        self.application = Application.objects.create(job=self.old_job, seeker=self.seeker, status='INTERVIEW')
+        count_new_application(self.old_job.id, 'INTERVIEW')
+        Interview.objects.create(application=self.application, scheduled_time=timezone.now() - timedelta(days=90), duration_minutes=45)
+
+    def test_closing_a_job_starts_the_archive_clock(self):
+        self.new_job.is_active = False
+        self.new_job.save(update_fields=['is_active'])
+        self.new_job.refresh_from_db()
+        self.assertIsNotNone(self.new_job.closed_on)
+        self.new_job.is_active = True
+        self.new_job.save()
+        self.new_job.refresh_from_db()
+        self.assertIsNone(self.new_job.closed_on)
+
+    def test_expiry_closes_old_postings_in_batches(self):
+        self.assertEqual(expire_jobs(60, batch_size=1), 1)
+        self.old_job.refresh_from_db()
+        self.assertFalse(self.old_job.is_active)
+        self.assertIsNotNone(self.old_job.closed_on)
+        self.assertTrue(JobPosting.objects.get(pk=self.new_job.pk).is_active)
+        self.assertEqual(search_jobs('tps')[0], [])
+
+    def test_archival_moves_applications_of_long_closed_jobs(self):
+        expire_jobs(60)
+        self.assertEqual(archive_applications(30), 0)  # closed just now
+
+        later = timezone.now() + timedelta(days=31)
+        self.assertEqual(archive_applications(30, batch_size=1, now=later), 1)
+        self.assertFalse(Application.objects.exists())
+        self.assertFalse(Interview.objects.exists())
+        archived = ArchivedApplication.objects.get()
+        self.assertEqual((archived.id, archived.status, archived.interview_duration_minutes), (self.application.id, 'INTERVIEW', 45))
+
+        self.old_job.refresh_from_db()
+        self.assertEqual((self.old_job.application_count, self.old_job.interview_count, self.old_job.archived_count), (0, 0, 1))
+
+    def test_archive_pages(self):
+        JobPosting.objects.filter(pk=self.old_job.pk).update(is_active=False, closed_on=timezone.now() - timedelta(days=365))
+        call_command('archive_jobs', stdout=io.StringIO())
+
+        self.client.login(username='peter', password='pass')
+        response = self.client.get(reverse('application_history'))
+        self.assertContains(response, 'TPS Reports at Initech')
+
+        self.client.login(username='initech', password='pass')
+        response = self.client.get(reverse('job_archive', args=[self.old_job.id]))
+        self.assertContains(response, 'peter')
+        self.assertContains(self.client.get(reverse('employer_dashboard')), '1 archived')
+
+
+class QueryPlanTests(TestCase):
+    """Every query the main views run on seeded data is served by an index."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_portal(employers=4, jobs=60, seekers=40, applications=300, seed=3)
+        application = Application.objects.filter(status='INTERVIEW', interview__isnull=False).select_related('job__employer__user').first()
+        cls.application = application
+        cls.employer_user = application.job.employer.user
+        cls.seeker_user = JobSeekerProfile.objects.filter(applications__isnull=False).first().user
+
+    def assertNoFullScans(self, requests):
+        for method, url, data in requests:
+            with CaptureQueriesContext(connection) as captured:
+                response = getattr(self.client, method)(url, data)
+            self.assertLess(response.status_code, 400, url)
+            self.assertEqual(full_scans(captured.captured_queries), [], f"{method.upper()} {url}")
+
+    def test_checker_reports_full_scans(self):
+        with CaptureQueriesContext(connection) as captured:
+            list(JobPosting.objects.filter(title='Nobody'))
+        self.assertEqual([table for table, _ in full_scans(captured.captured_queries)], ['jobs_jobposting'])
+
+    def test_employer_views(self):
+        self.client.force_login(self.employer_user)
+        job_id, app_id = self.application.job_id, self.application.id
+        self.assertNoFullScans([
+            ('get', reverse('employer_dashboard'), None),
+            ('get', reverse('interview_calendar'), {'week': timezone.localdate().strftime('%G-W%V')}),
+            ('get', reverse('schedule_interview', args=[app_id]), None),
+            ('get', reverse('job_update', args=[job_id]), None),
+            ('get', reverse('job_archive', args=[job_id]), None),
+            ('post', reverse('bulk_update_applications'), {'action': 'shortlist', 'application_ids': [app_id]}),
+        ])
+
+    def test_seeker_views(self):
+        self.client.force_login(self.seeker_user)
+        first_page = self.client.get(reverse('employee_dashboard'))
+        self.assertNoFullScans([
+            ('get', reverse('employee_dashboard'), None),
+            ('get', reverse('employee_dashboard'), {'cursor': first_page.context['next_cursor'], 'partial': 1}),
+            ('get', reverse('job_search'), {'q': 'engineer'}),
+            ('get', reverse('application_history'), None),
+            ('get', reverse('api_job_list'), None),
+            ('get', reverse('api_my_applications'), None),
+        ])
+
+
+class StylesheetBuildTests(TestCase):
+    """The purged utility stylesheet that replaces the Tailwind CDN."""
+
+    def test_committed_stylesheet_is_current(self):
+        # Fails after a template change until "manage.py build_css" is run
+        call_command('build_css', check=True, stdout=io.StringIO(), stderr=io.StringIO())
+        self.assertEqual(build_css()[1], [])
+
+    def test_compile_class_variants(self):
+        self.assertEqual(compile_class('px-4')[2], '.px-4{padding-left:1rem;padding-right:1rem}')
+        key, query, rule = compile_class('md:grid-cols-7')
+        self.assertEqual(query, '@media (min-width:768px)')
+        self.assertEqual(rule, r'.md\:grid-cols-7{grid-template-columns:repeat(7, minmax(0, 1fr))}')
+        self.assertTrue(compile_class('hover:file:bg-indigo-100')[2].startswith(r'.hover\:file\:bg-indigo-100::file-selector-button:hover{'))
+        self.assertIsNone(compile_class('bg-chartreuse-500'))
+        self.assertIsNone(compile_class('status-applied'))
+
+    def test_pages_use_the_local_stylesheet(self):
+        response = self.client.get(reverse('login'))
+        self.assertContains(response, '/static/jobs/css/app.css')
+        self.assertNotContains(response, 'cdn.tailwindcss.com')
+
+
+class ResumeDownloadTests(TestCase):
+    """Permission-checked resume delivery with Range and ETag support."""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.seeker = JobSeekerProfile.objects.create(user=User.objects.create_user('fiona', password='pass'))
+        self.seeker.resume = SimpleUploadedFile('cv.pdf', b'%PDF-1.4 fiona resume')
+        self.seeker.save()
+        self.url = reverse('download_resume', args=[self.seeker.id])
+
+        self.employer = EmployerProfile.objects.create(user=User.objects.create_user('vandelay', password='pass'), company_name='Vandelay')
+        self.stranger = EmployerProfile.objects.create(user=User.objects.create_user('pendant', password='pass'), company_name='Pendant')
+        job = JobPosting.objects.create(employer=self.employer, title='Importer', description='d', location='NYC')
+        Application.objects.create(job=job, seeker=self.seeker)
+
+    def test_owner_and_applied_employer_only(self):
+        self.client.login(username='fiona', password='pass')
+        response = self.client.get(self.url)
+        self.assertEqual(b''.join(response.streaming_content), b'%PDF-1.4 fiona resume')
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+
+        self.client.login(username='vandelay', password='pass')
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        self.client.login(username='pendant', password='pass')
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+        self.client.logout()
+        self.assertEqual(self.client.get(self.url).status_code, 302)
+
+    def test_etag_and_ranges(self):
+        self.client.login(username='fiona', password='pass')
+        etag = self.client.get(self.url)['ETag']
+        self.assertEqual(etag, f'"{os.path.splitext(os.path.basename(self.seeker.resume.name))[0]}"')
+        self.assertEqual(self.client.get(self.url, headers={'If-None-Match': etag}).status_code, 304)
+
+        response = self.client.get(self.url, headers={'Range': 'bytes=0-7'})
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], 'bytes 0-7/21')
+        self.assertEqual(b''.join(response.streaming_content), b'%PDF-1.4')
+        self.assertEqual(b''.join(self.client.get(self.url, headers={'Range': 'bytes=-6'}).streaming_content), b'resume')
+        self.assertEqual(self.client.get(self.url, headers={'Range': 'bytes=100-'}).status_code, 416)
+        # A stale If-Range gets the whole file
+        self.assertEqual(self.client.get(self.url, headers={'Range': 'bytes=0-7', 'If-Range': '"old"'}).status_code, 200)
+
+    @override_settings(PRIVATE_FILE_DELIVERY='x-accel')
+    def test_hands_off_to_the_web_server(self):
+        self.client.login(username='vandelay', password='pass')
+        response = self.client.get(self.url)
+        self.assertEqual(response['X-Accel-Redirect'], '/protected-media/' + self.seeker.resume.name)
+        self.assertEqual(response.content, b'')
+
+
+class ConditionalDashboardTests(TestCase):
+    """Dashboards answer 304 from cheap validators until their data changes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = EmployerProfile.objects.create(user=User.objects.create_user('initech'), company_name='Initech')
+        cls.job = JobPosting.objects.create(employer=cls.employer, title='TPS Reporter', description='d', location='Austin')
+        cls.seeker = JobSeekerProfile.objects.create(user=User.objects.create_user('peter'), skills='reports')
+
+    def setUp(self):
+        cache.clear()
+
+    def revalidate(self, url, etag):
+        return self.client.get(url, headers={'If-None-Match': etag})
+
+    def test_employee_dashboard(self):
+        self.client.force_login(self.seeker.user)
+        url = reverse('employee_dashboard')
+        response = self.client.get(url)
+        etag = response['ETag']
+        self.assertTrue(etag.startswith('W/"'))
+        self.assertIn('Last-Modified', response)
+        self.assertEqual(response['Cache-Control'], 'private, no-cache')
+
+        # Session, user and the validators' one profile query; no feed or render
+        with self.assertNumQueries(3):
+            response = self.revalidate(url, etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+        submit_application(self.job.id, self.seeker.id)
+        response = self.revalidate(url, etag)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        # The employer moving the application, or closing a job, changes the page
+        change_status(Application.objects.get(), 'SHORTLISTED')
+        etag = self.assertChanged(url, etag)
+        other = JobPosting.objects.create(employer=self.employer, title='Printer Fixer', description='d', location='Austin')
+        etag = self.assertChanged(url, etag)
+        other.is_active = False
+        other.save()
+        self.assertChanged(url, etag)
+
+    def assertChanged(self, url, etag):
+        response = self.revalidate(url, etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        return response['ETag']
+
+    def test_employer_dashboard(self):
+        self.client.force_login(self.employer.user)
+        url = reverse('employer_dashboard')
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.revalidate(url, etag).status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            submit_application(self.job.id, self.seeker.id)
+        etag = self.assertChanged(url, etag)
+        self.employer.company_name = 'Initrode'
+        self.employer.save()
+        self.assertContains(self.revalidate(url, etag), 'Initrode')
+
+    def test_employer_dashboard_sees_other_processes(self):
+        submit_application(self.job.id, self.seeker.id)
+        self.client.force_login(self.employer.user)
+        url = reverse('employer_dashboard')
+        etag = self.client.get(url)['ETag']
+        with CaptureQueriesContext(connection) as captured:
+            self.assertEqual(self.revalidate(url, etag).status_code, 304)
+        # Session, user and the two validator aggregates
+        self.assertEqual(len(captured.captured_queries), 4)
+        self.assertEqual(full_scans(captured.captured_queries[2:]), [])
+
+        # As archive_jobs would from cron: its invalidation reaches another process's cache
+        with mock.patch('jobs.archiving.invalidate_employer'):
+            expire_jobs(0, now=timezone.now() + timedelta(days=1))
+        self.assertChanged(url, etag)
+
+    def test_pending_messages_are_rendered(self):
+        self.client.force_login(self.seeker.user)
+        url = reverse('employee_dashboard')
+        etag = self.client.get(url)['ETag']
+        # Refused for lack of a resume: nothing changed, but a message is waiting
+        self.client.post(reverse('apply_for_job', args=[self.job.id]))
+        self.assertContains(self.revalidate(url, etag), 'Please upload your resume first')
+        self.assertEqual(self.revalidate(url, etag).status_code, 304)
+
+
+class SavedSearchTests(TestCase):
+    """Saved searches matched against new postings through the term index."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = EmployerProfile.objects.create(user=User.objects.create_user('hooli'), company_name='Hooli')
+        cls.seeker = JobSeekerProfile.objects.create(user=User.objects.create_user('richard', email='richard@example.com'))
+        cls.other = JobSeekerProfile.objects.create(user=User.objects.create_user('gilfoyle', email='gilfoyle@example.com'))
+
+    def post_job(self, **fields):
+        self.client.force_login(self.employer.user)
+        data = {'title': 'Backend Engineer', 'description': 'Build APIs', 'location': 'Palo Alto', 'skills': ''}
+        self.client.post(reverse('job_create'), {**data, **fields})
+        return JobPosting.objects.latest('id')
+
+    def test_key_term_prefers_selective_terms(self):
+        search = SavedSearch.objects.create(seeker=self.seeker, keywords='senior django', location='Palo Alto')
+        self.assertEqual(search.key_term, 'kw:django')
+        search.skills = 'py'
+        search.save()
+        self.assertEqual(search.key_term, 'skill:python')
+
+    def test_new_and_edited_postings_fill_matching_inboxes(self):
+        SavedSearch.objects.create(seeker=self.seeker, keywords='django', location='palo alto')
+        SavedSearch.objects.create(seeker=self.seeker, skills='Python')  # matches too, but one inbox entry
+        SavedSearch.objects.create(seeker=self.other, keywords='rust')
+        SavedSearch.objects.create(seeker=self.other, keywords='django', location='Berlin')
+
+        job = self.post_job(title='Django Developer', skills='Python, SQL')
+        self.assertEqual(list(SavedSearchMatch.objects.values_list('seeker_id', 'job_id')), [(self.seeker.id, job.id)])
+
+        self.client.post(reverse('job_update', args=[job.id]), {
+            'title': 'Django Developer', 'description': 'Rewrite it in Rust', 'location': 'Palo Alto', 'skills': 'Python',
+        })
+        self.assertEqual(SavedSearchMatch.objects.filter(seeker=self.seeker).count(), 1)
+        self.assertTrue(SavedSearchMatch.objects.filter(seeker=self.other, job=job).exists())
+
+    def test_matching_only_reads_candidate_searches(self):
+        seekers = JobSeekerProfile.objects.bulk_create([
+            JobSeekerProfile(user=User.objects.create_user(f'bighead{i}')) for i in range(50)
+        ])
+        for i, seeker in enumerate(seekers):
+            SavedSearch.objects.create(seeker=seeker, keywords=f'cobol{i}')
+        SavedSearch.objects.create(seeker=self.seeker, keywords='compression')
+        # bulk_create sends no post_save; matched explicitly below
+        [job] = JobPosting.objects.bulk_create([
+            JobPosting(employer=self.employer, title='Compression Engineer', description='d', location='Palo Alto')
+        ])
+
+        # Employer name, candidate searches, existing entries, INSERT
+        with CaptureQueriesContext(connection) as captured:
+            self.assertEqual(match_jobs([job]), 1)
+        self.assertEqual(len(captured.captured_queries), 4)
+        self.assertEqual(full_scans(captured.captured_queries), [])
+
+    def test_digest_lists_open_matches_once(self):
+        SavedSearch.objects.create(seeker=self.seeker, keywords='engineer')
+        SavedSearch.objects.create(seeker=self.other, keywords='closed')
+        self.post_job(title='Platform Engineer')
+        self.post_job(title='Data Engineer')
+        closed = self.post_job(title='Closed Engineer')
+        closed.is_active = False
+        closed.save()
+
+        call_command('send_search_digests', stdout=io.StringIO())
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['richard@example.com'])
+        self.assertEqual(mail.outbox[0].subject, '2 new jobs matching your saved searches')
+        self.assertIn('Platform Engineer at Hooli', mail.outbox[0].body)
+        self.assertNotIn('Closed Engineer', mail.outbox[0].body)
+        self.assertFalse(SavedSearchMatch.objects.filter(digested_on__isnull=True).exists())
+
+        call_command('send_search_digests', stdout=io.StringIO())
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_manage_saved_searches(self):
+        self.client.force_login(self.seeker.user)
+        url = reverse('saved_searches')
+        self.assertContains(self.client.post(url, {'keywords': ' ', 'location': '', 'skills': ''}), 'Enter keywords')
+        self.client.post(url, {'keywords': 'middle out', 'location': '', 'skills': ''})
+        search = SavedSearch.objects.get(seeker=self.seeker)
+
+        self.post_job(title='Middle Out Engineer')
+        self.client.force_login(self.seeker.user)
+        self.assertContains(self.client.get(url), 'Middle Out Engineer at Hooli')
+
+        self.client.force_login(self.other.user)
+        self.assertEqual(self.client.post(reverse('delete_saved_search', args=[search.id])).status_code, 404)
+        self.client.force_login(self.seeker.user)
+        self.client.post(reverse('delete_saved_search', args=[search.id]))
+        self.assertFalse(SavedSearchMatch.objects.exists())
+
+    def test_resume_form_keeps_its_widgets(self):
+        self.seeker.resume = 'resumes/cv.pdf'
+        self.seeker.save(update_fields=['resume'])
+        self.client.force_login(self.seeker.user)
+        response = self.client.get(reverse('upload_resume'))
+        self.assertContains(response, 'placeholder="e.g., Python, SQL, AWS"')
+        self.assertContains(response, 'file:bg-indigo-50')
+        # A plain FileInput: no "Clear" checkbox to drop the stored resume
+        self.assertNotContains(response, 'resume-clear')
+
+
+class LocationTests(TestCase):
+    """Gazetteer resolution of job locations and radius search over the grid index."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = EmployerProfile.objects.create(user=User.objects.create_user('dunder'), company_name='Dunder')
+        cls.seeker = JobSeekerProfile.objects.create(user=User.objects.create_user('pam'))
+        cls.chennai = Location.objects.get(name='Chennai')
+
+    def test_spellings_resolve_to_one_place(self):
+        resolved = resolve_locations([
+            'Chennai', 'chennai, TN', 'Chennai, India', 'Madras (Hybrid)', 'Chennai, France', 'Remote', '',
+        ])
+        self.assertEqual({text: location and location.name for text, location in resolved.items()}, {
+            'Chennai': 'Chennai', 'chennai, TN': 'Chennai', 'Chennai, India': 'Chennai',
+            'Madras (Hybrid)': 'Chennai', 'Chennai, France': None, 'Remote': None, '': None,
+        })
+        # Shared names go to the first gazetteer entry unless qualified
+        resolved = resolve_locations(['Hyderabad', 'Hyderabad, Pakistan', 'Toronto, CA', 'São Paulo', 'London, UK'])
+        self.assertEqual(resolved['Hyderabad'].country_code, 'IN')
+        self.assertEqual(resolved['Hyderabad, Pakistan'].country_code, 'PK')
+        self.assertEqual(resolved['Toronto, CA'].country, 'Canada')
+        self.assertEqual(str(resolved['São Paulo']), 'São Paulo, Brazil')
+        self.assertEqual(str(resolved['London, UK']), 'London, England, United Kingdom')
+
+    def test_postings_get_canonical_locations(self):
+        job = JobPosting.objects.create(employer=self.employer, title='Sales', description='d', location='chennai, TN')
+        self.assertEqual(job.canonical_location, self.chennai)
+        job.location = 'Bangalore'
+        job.save(update_fields=['location'])
+        job.refresh_from_db()
+        self.assertEqual(job.canonical_location.name, 'Bengaluru')
+
+        import_jobs(self.employer.id, iter([(2, {'title': 'Clerk', 'description': 'd', 'location': 'Madras', 'skills': ''})]))
+        self.assertEqual(JobPosting.objects.get(title='Clerk').canonical_location, self.chennai)
+
+    def test_geohash_and_covering_cells(self):
+        self.assertEqual(encode_geohash(57.64911, 10.40744, 11), 'u4pruydqqvj')
+        self.assertTrue(self.chennai.geohash.startswith('tf3'))
+        for latitude, longitude, radius in [(13.08, 80.27, 50), (0, 179.9, 500), (89.5, 0, 50), (-33.9, 151.2, 2000)]:
+            cells = covering_cells(bounding_boxes(latitude, longitude, radius))
+            self.assertLessEqual(len(cells), 32)
+            self.assertTrue(any(encode_geohash(latitude, longitude).startswith(cell) for cell in cells))
+
+    def test_places_within_radius(self):
+        nearby = locations_within(self.chennai.latitude, self.chennai.longitude, 150)
+        self.assertEqual([location.name for location, _ in nearby], ['Chennai', 'Kanchipuram', 'Vellore', 'Puducherry'])
+        self.assertAlmostEqual(nearby[-1][1], 135, delta=10)
+        self.assertNotIn('Bengaluru', [location.name for location, _ in nearby])
+        self.assertIn('Bengaluru', [location.name for location, _ in locations_within(13.0827, 80.2707, 300)])
+
+        # Across the antimeridian and around a pole
+        self.assertEqual(locations_within(-33.87, -179.0, 100), [])
+        self.assertEqual(locations_within(90.0, 0.0, 1000), [])
+
+        with CaptureQueriesContext(connection) as captured:
+            locations_within(self.chennai.latitude, self.chennai.longitude, 50)
+        self.assertEqual(full_scans(captured.captured_queries), [])
+
+    def test_search_near_a_place(self):
+        JobPosting.objects.create(employer=self.employer, title='Paper Sales', description='d', location='Chennai')
+        JobPosting.objects.create(employer=self.employer, title='Paper Warehouse', description='d', location='Vellore, TN')
+        JobPosting.objects.create(employer=self.employer, title='Paper Sales', description='d', location='Mumbai')
+        self.client.force_login(self.seeker.user)
+        url = reverse('job_search')
+
+        response = self.client.get(url, {'near': 'Madras', 'radius': 25})
+        self.assertEqual([job.location for job in response.context['jobs']], ['Chennai'])
+        response = self.client.get(url, {'near': 'Madras', 'radius': 250})
+        self.assertEqual([job.location for job in response.context['jobs']], ['Vellore, TN', 'Chennai'])
+        response = self.client.get(url, {'q': 'sales', 'near': 'chennai, india', 'radius': 250})
+        self.assertEqual([job.title for job in response.context['jobs']], ['Paper Sales'])
+        self.assertContains(self.client.get(url, {'near': 'Scranton'}), 'Unknown place')
@@ -1,5 +1,5 @@
 from django.urls import path
-from . import views
+from . import api, views
 
 urlpatterns = [
     # Custom Login/Logout (Root is the login page)
@@ -9,15 +9,35 @@ urlpatterns = [
     # Employee (Job Seeker) Routes
     path('employee/dashboard/', views.employee_dashboard, name='employee_dashboard'),
     path('employee/resume/upload/', views.upload_resume, name='upload_resume'),
+    path('resumes/<int:seeker_id>/', views.download_resume, name='download_resume'),
     path('employee/apply/<int:job_id>/', views.apply_for_job, name='apply_for_job'),
+    path('employee/jobs/search/', views.job_search, name='job_search'),
+    path('employee/applications/archive/', views.application_history, name='application_history'),
+    path('employee/searches/', views.saved_searches, name='saved_searches'),
+    path('employee/searches/<int:search_id>/delete/', views.delete_saved_search, name='delete_saved_search'),
     
     # Employer Routes (Dashboard and CRUD)
     path('employer/dashboard/', views.employer_dashboard, name='employer_dashboard'),
     path('employer/jobs/create/', views.job_create, name='job_create'),
+    path('employer/jobs/import/', views.job_import, name='job_import'),
     path('employer/jobs/update/<int:job_id>/', views.job_update, name='job_update'),
     path('employer/jobs/delete/<int:job_id>/', views.job_delete, name='job_delete'),
+    path('employer/jobs/<int:job_id>/archive/', views.job_archive, name='job_archive'),
     
     # Employer Action: Shortlisting and Scheduling
     path('employer/application/shortlist/<int:app_id>/', views.shortlist_application, name='shortlist_application'),
     path('employer/application/schedule/<int:app_id>/', views.schedule_interview, name='schedule_interview'),
+    path('employer/applications/bulk/', views.bulk_update_applications, name='bulk_update_applications'),
+    path('employer/interviews/calendar/', views.interview_calendar, name='interview_calendar'),
+    path('employer/applicants/search/', views.applicant_search, name='applicant_search'),
+
+    # Async JSON API
+    path('api/jobs/', api.job_list, name='api_job_list'),
+    path('api/jobs/<int:job_id>/', api.job_detail, name='api_job_detail'),
+    path('api/jobs/<int:job_id>/apply/', api.apply, name='api_apply'),
+    path('api/applications/', api.my_applications, name='api_my_applications'),
+
+    # Operations (staff only)
+    path('ops/cache-stats/', views.cache_stats_view, name='cache_stats'),
+    path('ops/view-stats/', views.view_stats_view, name='view_stats'),
 ]
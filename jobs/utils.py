@@ -1,49 +1,152 @@
-from django.contrib.auth.models import User, Group
-from django.core.exceptions import ObjectDoesNotExist
+from functools import wraps
 
-# --- Role Check Helper Functions (using Django Groups) ---
+from django.contrib.auth import get_user_model
+from django.contrib.auth.views import redirect_to_login
+from django.core.cache import cache
+from django.utils.functional import SimpleLazyObject
 
-def is_employer(user: User) -> bool:
+from .models import EmployerProfile, JobSeekerProfile
+
+# --- Role Resolution (used by jobs.middleware.RoleMiddleware) ---
+
+ROLE_EMPLOYER = 'employer'
+ROLE_EMPLOYEE = 'employee'
+SESSION_ROLE_KEY = 'jobs_role'
+
+PROFILE_MODELS = {
+    ROLE_EMPLOYER: EmployerProfile,
+    ROLE_EMPLOYEE: JobSeekerProfile,
+}
+
+
+def _role_version_key(user_id) -> str:
+    return f'jobs:role_version:{user_id}'
+
+
+def role_version(user_id) -> int:
     """
-    Checks if the given user belongs to the 'Employers' group.
-    
-    Args:
-        user: A Django User object.
-        
-    Returns:
-        True if the user is in the 'Employers' group, False otherwise.
+    Returns the current role version of a user: 0 until one of their
+    profiles is created or deleted, then counting up.
+
+    Deterministic, so every worker agrees on it and a session moving
+    between workers keeps its role. Bumps reach other workers only through
+    a shared cache (see the jobs.W001 deploy check); until then a stale
+    session role is repaired by the fallbacks in _load_profile and
+    role_required.
     """
-    # A standard and efficient way to check group membership
-    return user.groups.filter(name='Employers').exists()
+    return cache.get(_role_version_key(user_id), 0)
+
+
+def bump_role_version(user_id):
+    """Invalidates every cached role for the given user."""
+    try:
+        cache.incr(_role_version_key(user_id))
+    except ValueError:
+        cache.set(_role_version_key(user_id), 1, None)
+
 
-def is_employee(user: User) -> bool:
+def resolve_role(user):
     """
-    Checks if the given user belongs to the 'Employees' group.
-    
-    Args:
-        user: A Django User object.
-        
+    Looks up which profile the user has, in a single query.
+
+    Employer profiles win over seeker profiles, matching the order the login
+    view has always checked them in.
+
     Returns:
-        True if the user is in the 'Employees' group, False otherwise.
+        A (role, profile_id) tuple; both are None for users without a profile.
     """
-    # Note: If you have a separate profile model with a boolean field 
-    # (e.g., user.profile.is_employee), you would use that instead.
-    return user.groups.filter(name='Employees').exists()
+    employer_id, seeker_id = get_user_model().objects.filter(pk=user.pk).values_list(
+        'employer_profile__id', 'seeker_profile__id'
+    ).first() or (None, None)
+    if employer_id is not None:
+        return ROLE_EMPLOYER, employer_id
+    if seeker_id is not None:
+        return ROLE_EMPLOYEE, seeker_id
+    return None, None
+
+
+class RoleChanged(Exception):
+    """Raised when a session's cached profile no longer exists."""
 
-# --- Alternative Implementation (If using a Custom User Model with a 'role' field) ---
 
-# If you have defined a custom User model (e.g., in your app's models.py) like this:
-# class CustomUser(AbstractUser):
-#     ROLE_CHOICES = (
-#         ('employer', 'Employer'),
-#         ('employee', 'Employee'),
-#     )
-#     role = models.CharField(max_length=10, choices=ROLE_CHOICES, default='employee')
+def _load_profile(request, model, profile_id):
+    try:
+        return model.objects.get(pk=profile_id)
+    except model.DoesNotExist:
+        # Deleted or recreated by another process, whose version bump only
+        # reached its own cache: re-resolve, and let this process know too
+        bump_role_version(request.user.pk)
+        attach_role(request, refresh=True)
+        raise RoleChanged
 
-# ... then you would use this implementation instead:
 
-# def is_employer_by_field(user):
-#     return user.role == 'employer'
+def remember_role(session, user, refresh=False) -> dict:
+    """
+    Returns the user's role as cached in the session, resolving and storing
+    it again when missing, stale or `refresh` is set.
+    """
+    version = role_version(user.pk)
+    cached = session.get(SESSION_ROLE_KEY)
+    if refresh or not cached or cached.get('user') != user.pk or cached.get('version') != version:
+        role, profile_id = resolve_role(user)
+        cached = {'user': user.pk, 'role': role, 'profile': profile_id, 'version': version}
+        session[SESSION_ROLE_KEY] = cached
+    return cached
+
+
+def attach_role(request, refresh=False):
+    """
+    Sets request.role, request.profile_id and request.profile.
+
+    The resolved role is kept in the session and reused until the user's role
+    version changes, so most requests resolve their role without a query.
+    request.profile is loaded lazily, only when a view actually reads it.
+    """
+    user = request.user
+    request.role = request.profile_id = None
+    request.profile = None
+    if not user.is_authenticated:
+        return
+
+    cached = remember_role(request.session, user, refresh=refresh)
+    request.role = cached['role']
+    request.profile_id = cached['profile']
+    if request.role is not None:
+        model, profile_id = PROFILE_MODELS[request.role], request.profile_id
+        request.profile = SimpleLazyObject(lambda: _load_profile(request, model, profile_id))
+
+
+# --- Role Check Decorators ---
+
+def role_required(role):
+    """
+    Allows the view only for users whose resolved role is `role`.
+
+    Anonymous users and users with another role are sent to the login page,
+    which is where the previous user_passes_test checks sent them. Session
+    roles are only invalidated within one process, so before turning a user
+    away the role is resolved again, and a profile that has gone missing
+    (RoleChanged) is checked again against the fresh role. Writes load the
+    profile up front, so they never act for a profile that is gone.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if getattr(request, 'role', None) != role and request.user.is_authenticated:
+                attach_role(request, refresh=True)
+            if getattr(request, 'role', None) != role:
+                return redirect_to_login(request.get_full_path(), '/')
+            try:
+                if request.method not in ('GET', 'HEAD'):
+                    request.profile.pk
+                return view_func(request, *args, **kwargs)
+            except RoleChanged:
+                if request.role != role:
+                    return redirect_to_login(request.get_full_path(), '/')
+                return view_func(request, *args, **kwargs)
+        return wrapper
+    return decorator
+
 
-# def is_employee_by_field(user):
-#     return user.role == 'employee'
\ No newline at end of file
+employer_required = role_required(ROLE_EMPLOYER)
+employee_required = role_required(ROLE_EMPLOYEE)
@@ -1,13 +1,41 @@
+import os
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import authenticate, login, logout
-from django.contrib.auth.decorators import login_required, user_passes_test
+from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from .models import JobPosting, JobSeekerProfile, EmployerProfile, Application, Interview
+from .models import JobPosting, JobSeekerProfile, EmployerProfile, Application, Interview, ArchivedApplication, SavedSearch
 from django import forms
-from datetime import datetime
-from django.db.models import Prefetch
-from .forms import LoginForm  
-from .utils import is_employer, is_employee 
+from datetime import datetime, timedelta
+from django.db.models import Exists, OuterRef, Prefetch, Q
+from .forms import LoginForm, JobPostingForm
+from .utils import employer_required, employee_required, attach_role, ROLE_EMPLOYER, ROLE_EMPLOYEE
+from .pagination import keyset_page, cached_active_job_count, FEED_COUNT_CACHE_KEY
+from django.core.cache import cache
+from .search import search_applicants, search_jobs
+from .matching import recommend_jobs, score_applicants
+from .extraction import enqueue_resumes
+from .caching import get_employer_cached, cache_stats, reset_cache_stats
+from .instrumentation import collect_view_stats
+from .counters import change_status, bulk_change_status, submit_application, APPLY_DUPLICATE, APPLY_UNAVAILABLE
+from django.db import transaction
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import Http404, JsonResponse
+from django.utils import timezone
+from .scheduling import find_conflicts, week_start_for, interviews_for_week
+from .importing import detect_format, import_jobs, iter_rows
+from .fragments import render_job_cards
+from .archiving import archived_applications_for_job, archived_applications_for_seeker
+from django.core.paginator import Paginator
+from .storage import resume_storage
+from .delivery import private_file_response
+from .conditional import conditional_page, employee_dashboard_validators, employer_dashboard_validators, state_digest
+from .alerts import MAX_SAVED_SEARCHES, inbox_for_seeker
+from .locations import locations_within, nearby_jobs, resolve_locations
+
+ARCHIVE_PAGE_SIZE = 50
+INBOX_PAGE_SIZE = 50
+SEARCH_RADIUS_CHOICES = (10, 25, 50, 100, 250)  # km
+
 # --- FORMS (Simple, non-ModelForms for direct user input) ---
 
 # Simple Login Form
@@ -15,11 +43,20 @@ class LoginForm(forms.Form):
     username = forms.CharField(max_length=150)
     password = forms.CharField(widget=forms.PasswordInput)
 
-# Simple Job Posting Form
-class JobPostingForm(forms.Form):
-    title = forms.CharField(max_length=200, widget=forms.TextInput(attrs={'class': 'w-full px-3 py-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-indigo-500'}))
-    description = forms.CharField(widget=forms.Textarea(attrs={'class': 'w-full px-3 py-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-indigo-500', 'rows': 5}))
-    location = forms.CharField(max_length=100, widget=forms.TextInput(attrs={'class': 'w-full px-3 py-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-indigo-500'}))
+# Bulk Job Import Form
+class JobImportForm(forms.Form):
+    file = forms.FileField(
+        help_text="CSV with a header row, or JSON Lines. Columns/keys: title, description, location, skills.",
+        widget=forms.FileInput(attrs={'accept': '.csv,.jsonl,.ndjson', 'class': 'block w-full text-sm text-gray-500 file:mr-4 file:py-2 file:px-4 file:rounded-full file:border-0 file:text-sm file:font-semibold file:bg-indigo-50 file:text-indigo-700 hover:file:bg-indigo-100'})
+    )
+
+    def clean_file(self):
+        upload = self.cleaned_data['file']
+        try:
+            self.file_format = detect_format(upload.name)
+        except ValueError as exc:
+            raise forms.ValidationError(str(exc))
+        return upload
 
 # Resume Upload Form
 class ResumeUploadForm(forms.ModelForm):
@@ -31,6 +68,22 @@ class ResumeUploadForm(forms.ModelForm):
             'resume': forms.FileInput(attrs={'class': 'block w-full text-sm text-gray-500 file:mr-4 file:py-2 file:px-4 file:rounded-full file:border-0 file:text-sm file:font-semibold file:bg-indigo-50 file:text-indigo-700 hover:file:bg-indigo-100'})
         }
 
+# Saved Search Form
+class SavedSearchForm(forms.ModelForm):
+    class Meta:
+        model = SavedSearch
+        fields = ['keywords', 'location', 'skills']
+        widgets = {
+            field: forms.TextInput(attrs={'class': 'w-full px-3 py-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-indigo-500'})
+            for field in ('keywords', 'location', 'skills')
+        }
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if not any(cleaned_data.get(field, '').strip() for field in self.Meta.fields):
+            raise forms.ValidationError("Enter keywords, a location or skills to search for.")
+        return cleaned_data
+
 # Interview Scheduling Form
 class InterviewForm(forms.ModelForm):
     # Use DateTimeInput for easier data input (though it requires browser support)
@@ -40,31 +93,41 @@ class InterviewForm(forms.ModelForm):
     )
     class Meta:
         model = Interview
-        fields = ['scheduled_time', 'location_link', 'notes']
+        fields = ['scheduled_time', 'duration_minutes', 'location_link', 'notes']
+        labels = {'duration_minutes': 'Duration (minutes)'}
         widgets = {
+            'duration_minutes': forms.NumberInput(attrs={'min': 5, 'step': 5, 'class': 'w-full px-3 py-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-indigo-500'}),
             'location_link': forms.URLInput(attrs={'class': 'w-full px-3 py-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-indigo-500'}),
             'notes': forms.Textarea(attrs={'class': 'w-full px-3 py-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-indigo-500', 'rows': 3})
         }
 
+    def __init__(self, *args, employer_id=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.employer_id = employer_id
+
+    def clean(self):
+        cleaned_data = super().clean()
+        start = cleaned_data.get('scheduled_time')
+        duration = cleaned_data.get('duration_minutes')
+        if start and duration and self.employer_id is not None:
+            conflict = find_conflicts(self.employer_id, start, duration, exclude_id=self.instance.pk).first()
+            if conflict:
+                self.add_error('scheduled_time', (
+                    f"Overlaps the interview with {conflict.application.seeker.user.username} "
+                    f"at {timezone.localtime(conflict.scheduled_time):%b %d, %H:%M} "
+                    f"({conflict.duration_minutes} min)."
+                ))
+        return cleaned_data
 
-# --- ROLE CHECKERS ---
-
-def is_employee(user):
-    """Checks if the user has a JobSeekerProfile."""
-    return user.is_authenticated and hasattr(user, 'seeker_profile')
-
-def is_employer(user):
-    """Checks if the user has an EmployerProfile."""
-    return user.is_authenticated and hasattr(user, 'employer_profile')
 
 # --- AUTHENTICATION VIEWS ---
 
 def user_login(request):
     """Handles login and redirects based on user role."""
     if request.user.is_authenticated:
-        if is_employer(request.user):
+        if request.role == ROLE_EMPLOYER:
             return redirect('employer_dashboard')
-        elif is_employee(request.user):
+        elif request.role == ROLE_EMPLOYEE:
             return redirect('employee_dashboard')
         # Fallback for admin users without specific profiles
         return redirect('employee_dashboard') 
@@ -78,10 +141,11 @@ def user_login(request):
             
             if user is not None:
                 login(request, user)
-                if is_employer(user):
+                attach_role(request)
+                if request.role == ROLE_EMPLOYER:
                     messages.success(request, f"Welcome back, {user.username} (Employer)!")
                     return redirect('employer_dashboard')
-                elif is_employee(user):
+                elif request.role == ROLE_EMPLOYEE:
                     messages.success(request, f"Welcome back, {user.username} (Employee)!")
                     return redirect('employee_dashboard')
                 else:
@@ -107,24 +171,39 @@ def user_logout(request):
 
 # --- EMPLOYER VIEWS ---
 
-@user_passes_test(is_employer, login_url='/')
-@login_required
-def employer_dashboard(request):
-    """Employer dashboard showing posted jobs and applications."""
-    try:
-        employer_profile = request.user.employer_profile
-    except EmployerProfile.DoesNotExist:
-        messages.error(request, "Employer profile not configured for this user.")
-        return redirect('login') # or redirect to an admin setup page
-
+def _employer_dashboard_jobs(employer_profile):
+    """Builds the employer's jobs with applications, interviews and match scores."""
     # Fetch jobs posted by the current employer, prefetching applications
-    jobs = JobPosting.objects.filter(employer=employer_profile).prefetch_related(
+    jobs = list(JobPosting.objects.filter(employer=employer_profile).prefetch_related(
         Prefetch(
             'applications',
             queryset=Application.objects.order_by('-applied_on').select_related(
                 'seeker__user'
             ).prefetch_related('interview')
         )
+    ))
+
+    # Rank each job's applicants by skill match, scored in one batch
+    match_scores = score_applicants(employer_profile)
+    for job in jobs:
+        for app in job.applications.all():
+            app.match_score = match_scores.get(app.id, 0.0)
+        ranked = sorted(job.applications.all(), key=lambda app: app.match_score, reverse=True)
+        job.best_matches = [app for app in ranked[:3] if app.match_score > 0]
+    return jobs
+
+@employer_required
+@conditional_page(employer_dashboard_validators)
+def employer_dashboard(request):
+    """Employer dashboard showing posted jobs and applications."""
+    employer_profile = request.profile
+
+    # Served from the cache until a job, application, applicant or interview
+    # changes: keyed on the same database state as the page's ETag
+    state, _ = employer_dashboard_validators(request)
+    jobs = get_employer_cached(
+        request.profile_id, 'employer_dashboard', lambda: _employer_dashboard_jobs(employer_profile),
+        version=state_digest(state),
     )
 
     context = {
@@ -133,19 +212,30 @@ def employer_dashboard(request):
     }
     return render(request, 'jobs/employer_dashboard.html', context)
 
-@user_passes_test(is_employer, login_url='/')
-@login_required
+@employer_required
+def applicant_search(request):
+    """Full-text search over the extracted resumes of the employer's applicants."""
+    query = request.GET.get('q', '').strip()
+    context = {
+        'query': query,
+        'applications': search_applicants(request.profile_id, query) if query else [],
+    }
+    return render(request, 'jobs/applicant_search.html', context)
+
+@employer_required
 def job_create(request):
     """Handles creating a new job posting."""
     if request.method == 'POST':
         form = JobPostingForm(request.POST)
         if form.is_valid():
             JobPosting.objects.create(
-                employer=request.user.employer_profile,
+                employer_id=request.profile_id,
                 title=form.cleaned_data['title'],
                 description=form.cleaned_data['description'],
-                location=form.cleaned_data['location']
+                location=form.cleaned_data['location'],
+                skills=form.cleaned_data['skills']
             )
+            cache.delete(FEED_COUNT_CACHE_KEY)
             messages.success(request, "Job posted successfully!")
             return redirect('employer_dashboard')
     else:
@@ -157,11 +247,10 @@ def job_create(request):
     }
     return render(request, 'jobs/job_form.html', context)
 
-@user_passes_test(is_employer, login_url='/')
-@login_required
+@employer_required
 def job_update(request, job_id):
     """Handles updating an existing job posting."""
-    job = get_object_or_404(JobPosting, id=job_id, employer=request.user.employer_profile)
+    job = get_object_or_404(JobPosting, id=job_id, employer_id=request.profile_id)
     
     if request.method == 'POST':
         form = JobPostingForm(request.POST)
@@ -169,12 +258,13 @@ def job_update(request, job_id):
             job.title = form.cleaned_data['title']
             job.description = form.cleaned_data['description']
             job.location = form.cleaned_data['location']
+            job.skills = form.cleaned_data['skills']
             job.save()
             messages.success(request, f"Job '{job.title}' updated successfully.")
             return redirect('employer_dashboard')
     else:
         # Initialize form with current data
-        initial_data = {'title': job.title, 'description': job.description, 'location': job.location}
+        initial_data = {'title': job.title, 'description': job.description, 'location': job.location, 'skills': job.skills}
         form = JobPostingForm(initial=initial_data)
 
     context = {
@@ -184,38 +274,103 @@ def job_update(request, job_id):
     }
     return render(request, 'jobs/job_form.html', context)
 
-@user_passes_test(is_employer, login_url='/')
-@login_required
+@employer_required
 def job_delete(request, job_id):
     """Deletes a job posting."""
-    job = get_object_or_404(JobPosting, id=job_id, employer=request.user.employer_profile)
+    job = get_object_or_404(JobPosting, id=job_id, employer_id=request.profile_id)
     
     if request.method == 'POST':
         job.delete()
+        cache.delete(FEED_COUNT_CACHE_KEY)
         messages.success(request, f"Job '{job.title}' deleted.")
     return redirect('employer_dashboard')
 
-@user_passes_test(is_employer, login_url='/')
-@login_required
+MAX_IMPORT_ROWS = 20000  # larger files go through the import_jobs command
+MAX_REPORTED_IMPORT_ERRORS = 200
+
+@employer_required
+def job_import(request):
+    """Creates many job postings from an uploaded CSV or JSONL file."""
+    summary = None
+    errors = []
+    if request.method == 'POST':
+        form = JobImportForm(request.POST, request.FILES)
+        if form.is_valid():
+            def on_error(number, row_errors):
+                if len(errors) < MAX_REPORTED_IMPORT_ERRORS:
+                    errors.append((number, row_errors))
+
+            upload = form.cleaned_data['file']
+            summary = import_jobs(
+                request.profile_id, iter_rows(upload, form.file_format),
+                on_error=on_error, max_rows=MAX_IMPORT_ROWS,
+            )
+            if summary['created']:
+                messages.success(request, f"{summary['created']} job(s) imported.")
+    else:
+        form = JobImportForm()
+
+    context = {
+        'form': form,
+        'summary': summary,
+        'errors': errors,
+        'errors_truncated': summary is not None and summary['failed'] > len(errors),
+        'title': "Import Jobs",
+    }
+    return render(request, 'jobs/job_import.html', context)
+
+@employer_required
 def shortlist_application(request, app_id):
     """Shortlists an application."""
-    application = get_object_or_404(Application, id=app_id)
-    if application.job.employer != request.user.employer_profile:
+    application = get_object_or_404(Application.objects.select_related('job'), id=app_id)
+    if application.job.employer_id != request.profile_id:
         messages.error(request, "Permission denied.")
         return redirect('employer_dashboard')
 
     if request.method == 'POST':
-        application.status = 'SHORTLISTED'
-        application.save()
+        change_status(application, 'SHORTLISTED')
         messages.success(request, "Application has been Shortlisted.")
     return redirect('employer_dashboard')
 
-@user_passes_test(is_employer, login_url='/')
-@login_required
+# Bulk triage actions -> resulting Application.status
+BULK_ACTIONS = {
+    'shortlist': 'SHORTLISTED',
+    'reject': 'REJECTED',
+    'interview': 'INTERVIEW',
+}
+MAX_BULK_APPLICATIONS = 1000
+
+@employer_required
+def bulk_update_applications(request):
+    """Shortlists, rejects or moves to interview many applications at once."""
+    if request.method != 'POST':
+        return redirect('employer_dashboard')
+
+    new_status = BULK_ACTIONS.get(request.POST.get('action'))
+    try:
+        application_ids = [int(app_id) for app_id in request.POST.getlist('application_ids')]
+    except ValueError:
+        application_ids = []
+
+    if new_status is None or not application_ids:
+        messages.warning(request, "Select at least one application and an action.")
+        return redirect('employer_dashboard')
+    if len(application_ids) > MAX_BULK_APPLICATIONS:
+        messages.error(request, f"You can update at most {MAX_BULK_APPLICATIONS} applications at once.")
+        return redirect('employer_dashboard')
+
+    changed = bulk_change_status(request.profile_id, application_ids, new_status)
+    if changed is None:
+        messages.error(request, "Permission denied.")
+    else:
+        messages.success(request, f"{changed} application(s) updated.")
+    return redirect('employer_dashboard')
+
+@employer_required
 def schedule_interview(request, app_id):
     """Schedules an interview for a shortlisted application."""
-    application = get_object_or_404(Application, id=app_id)
-    if application.job.employer != request.user.employer_profile:
+    application = get_object_or_404(Application.objects.select_related('job', 'seeker__user'), id=app_id)
+    if application.job.employer_id != request.profile_id:
         messages.error(request, "Permission denied.")
         return redirect('employer_dashboard')
     
@@ -229,18 +384,17 @@ def schedule_interview(request, app_id):
         instance = None
 
     if request.method == 'POST':
-        form = InterviewForm(request.POST, instance=instance)
+        form = InterviewForm(request.POST, instance=instance, employer_id=request.profile_id)
         if form.is_valid():
-            interview = form.save(commit=False)
-            interview.application = application
-            interview.save()
-            
-            application.status = 'INTERVIEW'
-            application.save()
+            with transaction.atomic():
+                interview = form.save(commit=False)
+                interview.application = application
+                interview.save()
+                change_status(application, 'INTERVIEW')
             messages.success(request, f"Interview scheduled for {application.seeker.user.username}.")
             return redirect('employer_dashboard')
     else:
-        form = InterviewForm(instance=instance)
+        form = InterviewForm(instance=instance, employer_id=request.profile_id)
         
     context = {
         'form': form,
@@ -250,44 +404,175 @@ def schedule_interview(request, app_id):
     return render(request, 'jobs/schedule_interview.html', context)
 
 
+@employer_required
+def interview_calendar(request):
+    """Week view of the employer's scheduled interviews."""
+    monday = week_start_for(request.GET.get('week'))
+    context = {
+        'days': interviews_for_week(request.profile_id, monday),
+        'week_start': monday,
+        'previous_week': (monday - timedelta(days=7)).strftime('%G-W%V'),
+        'next_week': (monday + timedelta(days=7)).strftime('%G-W%V'),
+        'title': f"Interviews for the week of {monday:%b %d, %Y}",
+    }
+    return render(request, 'jobs/interview_calendar.html', context)
+
+@employer_required
+def job_archive(request, job_id):
+    """Archived applications of one of the employer's closed jobs."""
+    job = get_object_or_404(JobPosting, id=job_id, employer_id=request.profile_id)
+    context = {
+        'page': Paginator(archived_applications_for_job(job.id), ARCHIVE_PAGE_SIZE).get_page(request.GET.get('page')),
+        'job': job,
+        'back_url': 'employer_dashboard',
+        'title': f"Archived Applications for {job.title}",
+    }
+    return render(request, 'jobs/application_archive.html', context)
+
+
 # --- EMPLOYEE VIEWS ---
 
-@user_passes_test(is_employee, login_url='/')
-@login_required
+@employee_required
+@conditional_page(employee_dashboard_validators)
 def employee_dashboard(request):
     """Employee dashboard showing all jobs, their applications, and profile status."""
-    try:
-        seeker_profile = request.user.seeker_profile
-    except JobSeekerProfile.DoesNotExist:
-        # This shouldn't happen if setup is run, but as a safeguard:
-        messages.error(request, "Employee profile not found. Please contact admin.")
-        return redirect('login') 
-
-    # Get all active jobs
-    jobs = JobPosting.objects.filter(is_active=True).select_related('employer__user')
-
-    # Get applications by this user, prefetching interview data
-    applications = Application.objects.filter(seeker=seeker_profile).select_related('job').prefetch_related('interview')
-    applied_job_ids = [app.job.id for app in applications]
-    
+    seeker_profile = request.profile
+
+    # Get one page of active jobs, newest first, starting after the cursor
+    active_jobs = JobPosting.objects.filter(is_active=True)
+    jobs, next_cursor = keyset_page(
+        active_jobs.select_related('employer'),
+        cursor=request.GET.get('cursor'),
+    )
+
+    # Get applications by this user, joining in their interviews
+    applications = Application.objects.filter(seeker_id=request.profile_id).select_related('job', 'interview')
+    applied_job_ids = {app.job_id for app in applications}
+
+    # "Load more" requests only need the next batch of job cards
+    if request.GET.get('partial'):
+        context = {
+            'jobs': jobs,
+            'job_cards': render_job_cards(jobs, applied_job_ids),
+            'next_cursor': next_cursor,
+        }
+        return render(request, 'jobs/_job_cards.html', context)
+
     context = {
         'seeker_profile': seeker_profile,
         'jobs': jobs,
+        'job_cards': render_job_cards(jobs, applied_job_ids),
+        'total_jobs': cached_active_job_count(active_jobs),
+        'recommendations': recommend_jobs(seeker_profile),
+        'next_cursor': next_cursor,
         'applications': applications,
         'applied_job_ids': applied_job_ids,
     }
     return render(request, 'jobs/employee_dashboard.html', context)
 
-@user_passes_test(is_employee, login_url='/')
-@login_required
+@employee_required
+def job_search(request):
+    """Full-text search over active jobs, ranked by relevance, optionally near a place."""
+    query = request.GET.get('q', '').strip()
+    try:
+        page = max(int(request.GET.get('page', 1)), 1)
+    except ValueError:
+        page = 1
+
+    # "Within N km of <place>": the place's gazetteer neighbours, via the grid index
+    near = request.GET.get('near', '').strip()
+    try:
+        radius = int(request.GET.get('radius', SEARCH_RADIUS_CHOICES[1]))
+    except ValueError:
+        radius = SEARCH_RADIUS_CHOICES[1]
+    radius = radius if radius in SEARCH_RADIUS_CHOICES else SEARCH_RADIUS_CHOICES[1]
+    origin = resolve_locations([near])[near] if near else None
+    nearby = locations_within(origin.latitude, origin.longitude, radius) if origin else []
+    location_ids = [location.id for location, _ in nearby] if near else None
+
+    if query:
+        jobs, has_next = search_jobs(query, page=page, location_ids=location_ids)
+    elif near:
+        jobs, has_next = nearby_jobs(location_ids, page=page)
+    else:
+        jobs, has_next = [], False
+    applied_job_ids = set(
+        Application.objects.filter(seeker_id=request.profile_id).values_list('job_id', flat=True)
+    )
+
+    context = {
+        'query': query,
+        'near': near,
+        'radius': radius,
+        'radius_choices': SEARCH_RADIUS_CHOICES,
+        'origin': origin,
+        'nearby': nearby,
+        'jobs': jobs,
+        'job_cards': render_job_cards(jobs, applied_job_ids),
+        'page': page,
+        'has_next': has_next,
+        'applied_job_ids': applied_job_ids,
+    }
+    return render(request, 'jobs/job_search.html', context)
+
+@employee_required
+def application_history(request):
+    """The seeker's archived applications to jobs that closed long ago."""
+    context = {
+        'page': Paginator(archived_applications_for_seeker(request.profile_id), ARCHIVE_PAGE_SIZE).get_page(request.GET.get('page')),
+        'back_url': 'employee_dashboard',
+        'title': "Archived Applications",
+    }
+    return render(request, 'jobs/application_archive.html', context)
+
+@employee_required
+def saved_searches(request):
+    """The seeker's saved searches and the inbox of postings they matched."""
+    searches = list(SavedSearch.objects.filter(seeker_id=request.profile_id).order_by('-created_on'))
+    if request.method == 'POST':
+        form = SavedSearchForm(request.POST)
+        if len(searches) >= MAX_SAVED_SEARCHES:
+            messages.error(request, f"You can keep at most {MAX_SAVED_SEARCHES} saved searches. Delete one first.")
+        elif form.is_valid():
+            form.instance.seeker_id = request.profile_id
+            form.save()
+            messages.success(request, "Search saved. New jobs matching it will appear below and in your email digest.")
+            return redirect('saved_searches')
+    else:
+        form = SavedSearchForm(initial={'keywords': request.GET.get('q', '')})
+
+    context = {
+        'form': form,
+        'searches': searches,
+        'page': Paginator(inbox_for_seeker(request.profile_id), INBOX_PAGE_SIZE).get_page(request.GET.get('page')),
+        'applied_job_ids': set(
+            Application.objects.filter(seeker_id=request.profile_id).values_list('job_id', flat=True)
+        ),
+    }
+    return render(request, 'jobs/saved_searches.html', context)
+
+@employee_required
+def delete_saved_search(request, search_id):
+    """Deletes one of the seeker's saved searches; its inbox entries go with it."""
+    if request.method == 'POST':
+        deleted, _ = SavedSearch.objects.filter(id=search_id, seeker_id=request.profile_id).delete()
+        if not deleted:
+            raise Http404("No such saved search.")
+        messages.success(request, "Saved search deleted.")
+    return redirect('saved_searches')
+
+@employee_required
 def upload_resume(request):
     """Allows a job seeker to upload or update their resume/profile."""
-    seeker_profile = get_object_or_404(JobSeekerProfile, user=request.user)
+    seeker_profile = get_object_or_404(JobSeekerProfile, pk=request.profile_id)
 
     if request.method == 'POST':
         form = ResumeUploadForm(request.POST, request.FILES, instance=seeker_profile)
         if form.is_valid():
             form.save()
+            if 'resume' in form.changed_data:
+                # Text extraction happens in the process_resumes worker
+                enqueue_resumes([seeker_profile])
             messages.success(request, "Resume and profile updated successfully!")
             return redirect('employee_dashboard')
     else:
@@ -300,25 +585,60 @@ def upload_resume(request):
     return render(request, 'jobs/upload_resume.html', context)
 
 
-@user_passes_test(is_employee, login_url='/')
-@login_required
+@employee_required
 def apply_for_job(request, job_id):
     """Handles the job application process."""
-    job = get_object_or_404(JobPosting, id=job_id)
-    seeker_profile = request.user.seeker_profile
-    
-    if not seeker_profile.resume:
+    if not request.profile.resume:
+        job = get_object_or_404(JobPosting, id=job_id)
         messages.error(request, f"Please upload your resume first to apply for: {job.title}.")
         return redirect('upload_resume')
 
-    if Application.objects.filter(job=job, seeker=seeker_profile).exists():
+    outcome, job, _ = submit_application(job_id, request.profile_id)
+    if job is None:
+        raise Http404("No such job.")
+    if outcome == APPLY_DUPLICATE:
         messages.warning(request, "You have already applied for this job.")
-        return redirect('employee_dashboard')
-    
-    Application.objects.create(
-        job=job,
-        seeker=seeker_profile,
-        status='APPLIED'
-    )
-    messages.success(request, f"Successfully applied for '{job.title}'.")
+    elif outcome == APPLY_UNAVAILABLE:
+        messages.error(request, f"'{job['title']}' is no longer accepting applications.")
+    else:
+        messages.success(request, f"Successfully applied for '{job['title']}'.")
     return redirect('employee_dashboard')
+
+
+# --- RESUME DOWNLOADS ---
+
+@login_required
+def download_resume(request, seeker_id):
+    """
+    Sends a seeker's resume to the seeker, or to an employer they applied to.
+
+    The permission check and the file lookup are one query; anyone else gets
+    a 404 so resume URLs reveal nothing.
+    """
+    allowed = Q(user_id=request.user.id)
+    if request.role == ROLE_EMPLOYER:
+        allowed |= Exists(Application.objects.filter(seeker_id=OuterRef('pk'), job__employer_id=request.profile_id))
+        allowed |= Exists(ArchivedApplication.objects.filter(seeker_id=OuterRef('pk'), job__employer_id=request.profile_id))
+    resume = JobSeekerProfile.objects.filter(allowed, pk=seeker_id).values_list('resume', 'user__username').first()
+    if resume is None or not resume[0]:
+        raise Http404("No such resume.")
+
+    name, username = resume
+    return private_file_response(request, resume_storage, name, f"{username}-resume{os.path.splitext(name)[1]}")
+
+
+# --- OPERATIONS ---
+
+@staff_member_required
+def cache_stats_view(request):
+    """Hit/miss counters of the dashboard cache, as JSON (?reset=1 zeroes them)."""
+    stats = {'employer_dashboard': cache_stats('employer_dashboard')}
+    if request.GET.get('reset'):
+        reset_cache_stats('employer_dashboard')
+    return JsonResponse(stats)
+
+
+@staff_member_required
+def view_stats_view(request):
+    """p50/p95/p99 of query count, SQL, template and total time per view, as JSON."""
+    return JsonResponse(collect_view_stats())